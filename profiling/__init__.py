@@ -0,0 +1,17 @@
+"""Scripts timing the date, database and user-interface hot paths"""
+#  Copyright (c) 2021 author(s) of JulianBC.
+#
+#  This file is part of JulianBC.
+#
+#  JulianBC is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  JulianBC is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
@@ -0,0 +1,96 @@
+#  Copyright (c) 2021 author(s) of JulianBC.
+#
+#  This file is part of JulianBC.
+#
+#  JulianBC is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  JulianBC is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Time per-date conversions against the vectorized batch conversions.
+
+Run from the repository root with ``python -m profiling.batch_conversions``.
+"""
+import numpy
+import time
+
+from tests.test_real_dates.utils import RealCalendarTestCase
+
+LOOP_SIZE = 10 ** 4
+BATCH_SIZE = 10 ** 6
+
+
+def dates_per_second(func, size: int) -> float:
+    start = time.perf_counter()
+    func()
+    return size / (time.perf_counter() - start)
+
+
+def main():
+    case = RealCalendarTestCase()
+    case.setUp()
+    try:
+        cd = case.gregorian_cd
+        rng = numpy.random.default_rng(0)
+        ordinals = rng.integers(-(10 ** 7), 10 ** 7, BATCH_SIZE)
+        ymds = cd.ordinals_to_ast_ymd(ordinals)
+        loop_ordinals = ordinals[:LOOP_SIZE].tolist()
+        loop_ymds = list(zip(*(array[:LOOP_SIZE].tolist() for array in ymds)))
+
+        def loop_to_ymd():
+            for ordinal in loop_ordinals:
+                cd.ordinal_date_to_ast_ymd(cd.ordinal_to_ordinal_date(ordinal))
+
+        def loop_to_ordinal():
+            for ymd in loop_ymds:
+                cd.ordinal_date_to_ordinal(cd.ast_ymd_to_ordinal_date(ymd))
+
+        julian_ymds = case.julian_cd.ordinals_to_ast_ymd(ordinals)
+        julian_array = numpy.column_stack(julian_ymds)
+        loop_julian_ymds = julian_array[:LOOP_SIZE].tolist()
+
+        def loop_convert():
+            for julian_ymd in loop_julian_ymds:
+                cd.convert_ast_ymd(julian_ymd, case.julian_cd)
+
+        rows = {
+            "ordinal -> ymd": (
+                dates_per_second(loop_to_ymd, LOOP_SIZE),
+                dates_per_second(
+                    lambda: cd.ordinals_to_ast_ymd(ordinals), BATCH_SIZE
+                ),
+            ),
+            "ymd -> ordinal": (
+                dates_per_second(loop_to_ordinal, LOOP_SIZE),
+                dates_per_second(
+                    lambda: cd.ast_ymd_to_ordinals(*ymds), BATCH_SIZE
+                ),
+            ),
+            "Julian -> ymd": (
+                dates_per_second(loop_convert, LOOP_SIZE),
+                dates_per_second(
+                    lambda: cd.convert_ast_ymd_many(
+                        julian_array, case.julian_cd
+                    ),
+                    BATCH_SIZE,
+                ),
+            ),
+        }
+        print(f"{'Gregorian':<16}{'loop (dates/s)':>16}", end="")
+        print(f"{'batch (dates/s)':>18}")
+        for name, (loop_rate, batch_rate) in rows.items():
+            print(f"{name:<16}{loop_rate:>16,.0f}{batch_rate:>18,.0f}")
+    finally:
+        case.tearDown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#  Copyright (c) 2021 author(s) of JulianBC.
+#
+#  This file is part of JulianBC.
+#
+#  JulianBC is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  JulianBC is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Time fetching the events in a timeline's view from millions of events,
+with the R*Tree and with a plain scan of the event table. Then time
+counting them per column of a zoomed-out view, with the rollups and with
+the event table.
+
+Run from the repository root with ``python -m profiling.event_queries``.
+"""
+import numpy
+import pathlib
+import tempfile
+import time
+
+from src.db import Event
+from src.db.utils import make_engine
+from sqlalchemy import insert
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+from tests.factories import ConvertibleCalendarFactory
+
+EVENTS = 10 ** 7
+EVENTS_PER_INSERT = 10 ** 5
+QUERIES = 20
+VIEW_SPAN = 730  # days, about what a timeline shows at start up
+OD_RANGE = 10 ** 6
+COLUMNS = 500  # of a zoomed-out view of every event
+
+
+def add_events(session: Session, calendar_id: int):
+    rng = numpy.random.default_rng(0)
+    for first_id in range(1, EVENTS + 1, EVENTS_PER_INSERT):
+        size = min(EVENTS_PER_INSERT, EVENTS + 1 - first_id)
+        start_ods = rng.uniform(-OD_RANGE, OD_RANGE, size)
+        durations = rng.lognormal(0, 2, size)  # mostly short, some long
+        rows = [
+            {
+                "id": first_id + idx,
+                "name": "event",
+                "calendar_id": calendar_id,
+                "start_od": start_od,
+                "end_od": start_od + duration,
+            }
+            for idx, (start_od, duration) in enumerate(
+                zip(start_ods.tolist(), durations.tolist())
+            )
+        ]
+        session.execute(insert(Event), rows)
+    session.commit()
+
+
+def scan(session: Session, calendar, start_od: float, end_od: float):
+    return session.execute(
+        select(Event.id).where(
+            Event.calendar_id == calendar.id,
+            Event.start_od <= end_od,
+            Event.end_od >= start_od,
+        )
+    ).all()
+
+
+def histogram_scan(session: Session, calendar, edges) -> list[int]:
+    start_ods = (
+        session.execute(
+            select(Event.start_od).where(
+                Event.calendar_id == calendar.id,
+                Event.start_od >= edges[0],
+                Event.start_od <= edges[-1],
+            )
+        )
+        .scalars()
+        .all()
+    )
+    return numpy.histogram(start_ods, edges)[0].tolist()
+
+
+def milliseconds(func, session, calendar, start_ods) -> float:
+    start = time.perf_counter()
+    for start_od in start_ods:
+        func(session, calendar, start_od, start_od + VIEW_SPAN)
+    return (time.perf_counter() - start) * 1e3 / len(start_ods)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        engine = make_engine(pathlib.Path(directory) / "events.db")
+        with Session(engine) as session:
+            calendar = ConvertibleCalendarFactory.build()
+            session.add(calendar)
+            session.commit()
+
+            start = time.perf_counter()
+            add_events(session, calendar.id)
+            seconds = time.perf_counter() - start
+            print(f"inserted {EVENTS:,} events in {seconds:.1f} s")
+
+            rng = numpy.random.default_rng(1)
+            start_ods = rng.uniform(-OD_RANGE, OD_RANGE, QUERIES).tolist()
+            visible = len(
+                Event.overlapping(
+                    session, calendar, start_ods[0], start_ods[0] + VIEW_SPAN
+                )
+            )
+            print(f"{visible} events in a {VIEW_SPAN} day view")
+            print(f"{'query':<10}{'ms/view':>10}")
+            for name, func in (("R*Tree", Event.overlapping), ("scan", scan)):
+                per_view = milliseconds(func, session, calendar, start_ods)
+                print(f"{name:<10}{per_view:>10.1f}")
+
+            edges = numpy.linspace(-OD_RANGE, OD_RANGE, COLUMNS + 1)
+            print(f"{COLUMNS} columns over {2 * OD_RANGE:,} days")
+            print(f"{'count':<10}{'ms/view':>10}")
+            for name, func in (
+                ("rollups", Event.histogram),
+                ("scan", histogram_scan),
+            ):
+                start = time.perf_counter()
+                func(session, calendar, edges)
+                per_view = (time.perf_counter() - start) * 1e3
+                print(f"{name:<10}{per_view:>10.1f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#  Copyright (c) 2021 author(s) of JulianBC.
+#
+#  This file is part of JulianBC.
+#
+#  JulianBC is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  JulianBC is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Time importing the date and time modules in a fresh interpreter.
+
+Run from the repository root with ``python -m profiling.import_time``.
+sympy is timed too, when installed, since the modules used to import it.
+"""
+import subprocess
+import sys
+
+MODULES = "numpy", "sqlalchemy", "src.customdatetime", "sympy"
+REPEAT = 5
+TIMER = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def import_seconds(module: str) -> float:
+    """:returns: fastest import of the module in a fresh interpreter"""
+    timings = []
+    for _ in range(REPEAT):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(module=module)],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        timings.append(float(output))
+    return min(timings)
+
+
+def main():
+    print(f"{'module':<22}{'import (ms)':>14}")
+    for module in MODULES:
+        try:
+            seconds = import_seconds(module)
+        except subprocess.CalledProcessError:
+            print(f"{module:<22}{'not installed':>14}")
+            continue
+        print(f"{module:<22}{seconds * 1e3:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#  Copyright (c) 2021 author(s) of JulianBC.
+#
+#  This file is part of JulianBC.
+#
+#  JulianBC is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  JulianBC is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Time flushing a chain of linked calendars with and without pairwise closure.
+
+Run from the repository root with ``python -m profiling.mutual_conversions``.
+"""
+import time
+
+from src.db import CalendarConversion
+from tests.factories import (
+    CalendarConversionFactory,
+    ConvertibleCalendarFactory,
+)
+from tests.utils import DatabaseTestCase
+
+CHAIN_LENGTHS = 50, 100, 200
+
+
+def flush_seconds(
+    chain_length: int, pairwise_closure: bool
+) -> tuple[float, int]:
+    """:returns: seconds to flush the chain, conversions afterwards"""
+    case = DatabaseTestCase()
+    case.setUp()
+    case.session.info["pairwise_closure"] = pairwise_closure
+    try:
+        calendars = ConvertibleCalendarFactory.build_batch(chain_length)
+        conversions = [
+            CalendarConversionFactory.build(
+                source_calendar=source_calendar,
+                target_calendar=target_calendar,
+            )
+            for source_calendar, target_calendar in zip(
+                calendars, calendars[1:]
+            )
+        ]
+        case.session.add_all(calendars + conversions)
+        start = time.perf_counter()
+        case.session.flush()
+        seconds = time.perf_counter() - start
+        return seconds, case.session.query(CalendarConversion).count()
+    finally:
+        del case.session.info["pairwise_closure"]
+        case.tearDown()
+
+
+def main():
+    print(f"{'calendars':>10}{'closure':>13}{'flush (s)':>11}", end="")
+    print(f"{'conversions':>13}")
+    for pairwise_closure in (True, False):
+        closure = "pairwise" if pairwise_closure else "incremental"
+        for chain_length in CHAIN_LENGTHS:
+            seconds, conversions = flush_seconds(
+                chain_length, pairwise_closure
+            )
+            print(f"{chain_length:>10}{closure:>13}{seconds:>11.2f}", end="")
+            print(f"{conversions:>13}")
+
+
+if __name__ == "__main__":
+    main()
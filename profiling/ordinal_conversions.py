@@ -0,0 +1,67 @@
+#  Copyright (c) 2021 author(s) of JulianBC.
+#
+#  This file is part of JulianBC.
+#
+#  JulianBC is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  JulianBC is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Time ordinal <-> ordinal date conversions far from the epoch.
+
+Run from the repository root with ``python -m profiling.ordinal_conversions``.
+Latency should be flat from year 1 out to a billion years in either direction.
+"""
+import timeit
+
+from tests.test_real_dates.utils import RealCalendarTestCase
+
+YEARS = 1, 10 ** 3, 10 ** 6, 10 ** 9
+NUMBER = 2000
+
+
+def main():
+    case = RealCalendarTestCase()
+    case.setUp()
+    try:
+        cds = {
+            "Gregorian": case.gregorian_cd,
+            "Julian": case.julian_cd,
+            "Coptic": case.coptic_cd,
+            "Lunar Hijri": case.l_hijri_cd,
+            "Indian Civil": case.indian_cd,
+        }
+        print(f"{'calendar':<14}{'year':>14}{'to date (us)':>16}", end="")
+        print(f"{'to ordinal (us)':>18}")
+        for name, cd in cds.items():
+            for year in YEARS:
+                for ast_year in sorted({year, 1 - year}):
+                    ordinal_date = ast_year, 1
+                    _ordinal = cd.ordinal_date_to_ordinal(ordinal_date)
+                    to_date = timeit.timeit(
+                        lambda: cd.ordinal_to_ordinal_date(_ordinal),
+                        number=NUMBER,
+                    )
+                    to_ordinal = timeit.timeit(
+                        lambda: cd.ordinal_date_to_ordinal(ordinal_date),
+                        number=NUMBER,
+                    )
+                    print(
+                        f"{name:<14}{ast_year:>14}"
+                        f"{to_date / NUMBER * 1e6:>16.2f}"
+                        f"{to_ordinal / NUMBER * 1e6:>18.2f}"
+                    )
+    finally:
+        case.tearDown()
+
+
+if __name__ == "__main__":
+    main()
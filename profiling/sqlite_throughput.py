@@ -0,0 +1,103 @@
+#  Copyright (c) 2021 author(s) of JulianBC.
+#
+#  This file is part of JulianBC.
+#
+#  JulianBC is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  JulianBC is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Time writing and reading calendars and events with SQLite's defaults and
+with the pragmas of make_engine.
+
+Run from the repository root with ``python -m profiling.sqlite_throughput``.
+"""
+import pathlib
+import tempfile
+import time
+
+from src.db import ConvertibleCalendar, Event
+from src.db.utils import Base, make_engine
+from sqlalchemy.future import create_engine
+from sqlalchemy.orm import Session
+from tests.factories import ConvertibleCalendarFactory, EventFactory
+
+ROWS = 2000
+ROWS_PER_COMMIT = 10
+READS = 5
+
+
+def default_engine(path: pathlib.Path):
+    engine = create_engine(f"sqlite:///{path}", future=True)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def rows_per_second(engine, rows: list) -> tuple[float, float]:
+    """:returns: rows of one model written and read per second"""
+    model = type(rows[0])
+    with Session(engine) as session:
+        start = time.perf_counter()
+        for first in range(0, ROWS, ROWS_PER_COMMIT):
+            last = first + ROWS_PER_COMMIT
+            session.add_all(rows[first:last])
+            session.commit()
+        write_rate = ROWS / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(READS):
+        with Session(engine) as session:
+            session.query(model).all()
+    read_rate = ROWS * READS / (time.perf_counter() - start)
+    return write_rate, read_rate
+
+
+def events(engine) -> list[Event]:
+    """:returns: events of a calendar added to the database"""
+    with Session(engine) as session:
+        calendar = ConvertibleCalendarFactory.build()
+        session.add(calendar)
+        session.commit()
+        calendar_id = calendar.id
+    return [
+        Event(
+            name=event.name,
+            calendar_id=calendar_id,
+            start_od=event.start_od,
+            end_od=event.end_od,
+        )
+        for event in EventFactory.build_batch(ROWS)
+    ]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        directory = pathlib.Path(directory)
+        engines = {
+            "memory": make_engine(),
+            "file, defaults": default_engine(directory / "default.db"),
+            "file, make_engine": make_engine(directory / "tuned.db"),
+        }
+        for model in (ConvertibleCalendar, Event):
+            print(f"{model.__tablename__:<20}{'writes/s':>12}{'reads/s':>12}")
+            for name, engine in engines.items():
+                if model is Event:
+                    rows = events(engine)
+                else:
+                    rows = ConvertibleCalendarFactory.build_batch(ROWS)
+                write_rate, read_rate = rows_per_second(engine, rows)
+                print(f"{name:<20}{write_rate:>12,.0f}{read_rate:>12,.0f}")
+        for engine in engines.values():
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
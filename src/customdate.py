@@ -15,20 +15,22 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
-import itertools
+import bisect
 import math
+import numpy
 
 from collections import deque
 from enum import Enum, unique
-from src.db import ConvertibleCalendar
+from src.db import CalendarSpec, ConvertibleCalendar
 from typing import Union
 
 
 @unique
 class DateUnit(Enum):
-    ERA = 3
-    YEAR = 2
-    MONTH = 1
+    ERA = 4
+    YEAR = 3
+    MONTH = 2
+    WEEK = 1
     DAY = 0
 
 
@@ -70,52 +72,120 @@ class ConvertibleDate:
     def __init__(self, calendar: ConvertibleCalendar, date_sep="/"):
         self.date_sep = date_sep
         self._calendar = calendar
-        if self.calendar.has_leap_year:
-            start = self.calendar.leap_year_cycle_start
-            self._all_cycle_ordinals = deque(
-                itertools.chain.from_iterable(
-                    [  # common and leap year cycle ordinals
-                        range(start, cycle + start)
-                        for cycle in self.calendar.leap_year_cycles
-                    ]
-                )
-            )
-            self._all_cycle_ordinals.rotate(self.calendar.leap_year_offset)
-            self._common_year_cycle_ordinals = tuple(
-                _ord
-                for _ord in self._all_cycle_ordinals
-                if _ord not in self.calendar.leap_year_cycle_ordinals
-            )
-        else:
-            self._all_cycle_ordinals = deque([])
-            self._common_year_cycle_ordinals = ()
 
     def convert_ast_ymd(
         self,
         foreign_ast_ymd: tuple,
         foreign_datetime: "ConvertibleDate",
     ) -> Ymd_tuple:
-        """:returns: native ast_ymd equivalent to the foreign ast_ymd"""
+        """
+        :returns: native ast_ymd equivalent to the foreign ast_ymd
+        :raises ValueError: if the calendars can't be converted
+        """
+        sync_offset = self.calendar.sync_offset(foreign_datetime.calendar)
+        if sync_offset is None:
+            raise ValueError(
+                f"No conversion between {self.calendar} and "
+                f"{foreign_datetime.calendar}"
+            )
+
         foreign_ordinal_date = foreign_datetime.ast_ymd_to_ordinal_date(
             foreign_ast_ymd
         )
         foreign_ordinal = foreign_datetime.ordinal_date_to_ordinal(
             foreign_ordinal_date
         )
-        foreign_sync_ordinal = foreign_datetime.calendar.sync_ordinal(
-            self.calendar
-        )
-        elapsed_days = foreign_ordinal - foreign_sync_ordinal
-
-        native_sync_ordinal = self.calendar.sync_ordinal(
-            foreign_datetime.calendar
-        )
-        new_native_ordinal = native_sync_ordinal + elapsed_days
+        new_native_ordinal = foreign_ordinal + sync_offset
         new_native_ordinal_date = self.ordinal_to_ordinal_date(
             new_native_ordinal
         )
         return self.ordinal_date_to_ast_ymd(new_native_ordinal_date)
 
+    def convert_ast_ymd_many(
+        self,
+        foreign_ast_ymds,
+        foreign_datetime: "ConvertibleDate",
+    ) -> tuple[numpy.ndarray, Union[numpy.ndarray, None], numpy.ndarray]:
+        """
+        vectorized :py:meth:`convert_ast_ymd`
+
+        :param foreign_ast_ymds: iterable of foreign ast_ymds, or an int array
+            shaped (n, 3)
+        :returns: native astronomical years, months and days like
+            :py:meth:`ordinals_to_ast_ymd`
+        :raises ValueError: if the calendars can't be converted or for any
+            invalid foreign ast_ymd
+        """
+        sync_offset = self.calendar.sync_offset(foreign_datetime.calendar)
+        if sync_offset is None:
+            raise ValueError(
+                f"No conversion between {self.calendar} and "
+                f"{foreign_datetime.calendar}"
+            )
+
+        foreign_ordinals = foreign_datetime.ast_ymd_to_ordinals(
+            *foreign_datetime._unzip_ast_ymds(foreign_ast_ymds)
+        )
+        return self.ordinals_to_ast_ymd(foreign_ordinals + sync_offset)
+
+    def fan_out_ast_ymd(
+        self, ast_ymd: Ymd_tuple
+    ) -> dict[ConvertibleCalendar, Ymd_tuple]:
+        """
+        :py:meth:`convert_ast_ymd` into every calendar this one converts to,
+        finding the ordinal of the given date once
+        :returns: ast_ymd for each of :py:meth:`ConvertibleCalendar.calendars`
+        """
+        ordinal = self.ordinal_date_to_ordinal(
+            self.ast_ymd_to_ordinal_date(ast_ymd)
+        )
+        target_ast_ymds = dict()
+        for calendar, sync_offset in self.calendar.sync_offsets().items():
+            target_cd = ConvertibleDate(calendar)
+            target_ordinal_date = target_cd.ordinal_to_ordinal_date(
+                ordinal + sync_offset
+            )
+            target_ast_ymds[calendar] = target_cd.ordinal_date_to_ast_ymd(
+                target_ordinal_date
+            )
+        return target_ast_ymds
+
+    def fan_out_ast_ymd_many(
+        self, ast_ymds
+    ) -> dict[ConvertibleCalendar, tuple]:
+        """
+        vectorized :py:meth:`fan_out_ast_ymd`
+
+        :param ast_ymds: iterable of ast_ymds, or an int array shaped (n, 3)
+        :returns: astronomical years, months and days like
+            :py:meth:`ordinals_to_ast_ymd` for each of
+            :py:meth:`ConvertibleCalendar.calendars`
+        """
+        ordinals = self.ast_ymd_to_ordinals(*self._unzip_ast_ymds(ast_ymds))
+        return {
+            calendar: ConvertibleDate(calendar).ordinals_to_ast_ymd(
+                ordinals + sync_offset
+            )
+            for calendar, sync_offset in self.calendar.sync_offsets().items()
+        }
+
+    def _unzip_ast_ymds(self, ast_ymds) -> tuple:
+        """
+        :param ast_ymds: iterable of ast_ymds, or an int array shaped (n, 3)
+        :returns: astronomical years, months and days as arguments for
+            :py:meth:`ast_ymd_to_ordinals`
+        """
+        if isinstance(ast_ymds, numpy.ndarray):
+            ast_years, months, days = ast_ymds.reshape(-1, 3).T
+        else:
+            ast_ymds = list(ast_ymds)
+            ast_years = [ast_ymd[0] for ast_ymd in ast_ymds]
+            months = [ast_ymd[1] for ast_ymd in ast_ymds]
+            days = [ast_ymd[2] for ast_ymd in ast_ymds]
+        if not any(self.spec.months_in_year):
+            months = None
+        return ast_years, months, days
+
     def ordinal_date_to_ordinal(self, ordinal_date: tuple[int, int]) -> int:
         """:raises ValueError: for an invalid ordinal date"""
 
@@ -131,7 +201,8 @@ class ConvertibleDate:
         ast_year, day_of_year = ordinal_date
         start_ast_year, sign = self._start_and_sign(ast_year)
 
-        if not self.calendar.has_leap_year:
+        spec = self.spec
+        if not spec.has_leap_year:
             days_in_year = self.days_in_year(ast_year)
             prev_ast_year = ast_year - sign * 1
             if sign == -1:
@@ -142,190 +213,104 @@ class ConvertibleDate:
             return ordinal
 
         completed_cycles = self.completed_cycles(ast_year)
-        normal_leap_years_in_previous_cycles = (
-            completed_cycles * self.calendar.leap_years_in_normal_cycle
-        )
-        normal_common_years_in_previous_cycles = (
-            completed_cycles * self.common_years_in_normal_cycle
-        )
-
-        all_cycle_ordinals = self.all_cycle_ordinals
-        if sign == -1:
-            all_cycle_ordinals.reverse()
-
-        all_this_cycles_ordinals_up_to_this_year = list()
-        idx = 0
         cycle_index = self.cycle_index(
             ast_year, completed_cycles, start_ast_year, sign
         )
-        while idx != cycle_index:
-            current_ordinal = all_cycle_ordinals[idx]
-            all_this_cycles_ordinals_up_to_this_year.append(current_ordinal)
-            idx += 1
-        if sign == -1:  # undo reverse for the entire instance
-            all_cycle_ordinals.reverse()
-
-        leap_ordinals = self.calendar.leap_year_cycle_ordinals
-        this_cycles_elapsed_leap_ordinals = set(leap_ordinals) & set(
-            all_this_cycles_ordinals_up_to_this_year
-        )
-        elapsed_normal_leap_years_in_this_cycle = len(
-            this_cycles_elapsed_leap_ordinals
-        )
-
-        common_ordinals = self.common_year_cycle_ordinals
-        this_cycles_elapsed_common_ordinals = set(common_ordinals) & set(
-            all_this_cycles_ordinals_up_to_this_year
-        )
-        elapsed_normal_common_years_in_this_cycle = len(
-            this_cycles_elapsed_common_ordinals
+        elapsed_cycle_leap_years = spec.forward_elapsed_leap_years
+        if sign == -1:
+            elapsed_cycle_leap_years = spec.backward_elapsed_leap_years
+        cycle_length = len(elapsed_cycle_leap_years) - 1
+        num_elapsed_years = completed_cycles * cycle_length + cycle_index
+        normal_leap_years_in_previous_cycles = (
+            completed_cycles * elapsed_cycle_leap_years[-1]
         )
+        elapsed_normal_leap_years_in_this_cycle = elapsed_cycle_leap_years[
+            cycle_index
+        ]
 
-        net_special_years = self.net_elapsed_special_years(ast_year)
-        net_elapsed_special_leaps = net_special_years[0]
-        net_elapsed_special_commons = net_special_years[1]
-
+        net_elapsed_special_leaps, _ = self.net_elapsed_special_years(ast_year)
         num_elapsed_leap_years = (
             normal_leap_years_in_previous_cycles
             + elapsed_normal_leap_years_in_this_cycle
             + net_elapsed_special_leaps
         )
-        num_elapsed_common_years = (
-            normal_common_years_in_previous_cycles
-            + elapsed_normal_common_years_in_this_cycle
-            + net_elapsed_special_commons
-        )
+        num_elapsed_common_years = num_elapsed_years - num_elapsed_leap_years
         days_in_elapsed_years = (
-            num_elapsed_leap_years * self.calendar.days_in_leap_year
-            + num_elapsed_common_years * self.calendar.days_in_common_year
+            num_elapsed_leap_years * spec.days_in_leap_year
+            + num_elapsed_common_years * spec.days_in_common_year
         )
 
         return make_ordinal(day_of_year, days_in_elapsed_years, sign)
 
     def ordinal_to_ordinal_date(self, ordinal: int) -> tuple[int, int]:
         """:raises AssertionError: if an invalid ordinal date is made"""
-
-        def make_ordinal_date(
-            ord_: int, days_in_years_passed: int, year: int
-        ) -> tuple[int, int]:
-            day = abs(ord_) - days_in_years_passed
-            if sign == -1:
-                day = self.days_in_year(year) - day
-                if day == 0:
-                    year += sign * 1
-                    day = self.days_in_year(year)
-            m = f"{ord_} made invalid ordinal date {year, day} for {calendar}"
-            assert self.is_valid_ordinal_date((year, day)), m
-            return year, day
-
-        def days_in_this_cycle(ay: int) -> int:
-            """:param ay: astronomical year"""
-            net_special_years = self.net_elapsed_special_years(ay)
-            net_special_leaps = net_special_years[0]
-            net_special_commons = net_special_years[1]
-
-            dily = self.calendar.days_in_leap_year
-            dicy = self.calendar.days_in_common_year
-            net_special_leap_days = net_special_leaps * dily
-            net_special_common_days = net_special_commons * dicy
-            net_special_days = net_special_leap_days + net_special_common_days
-            return self.days_in_normal_cycle + net_special_days
-
-        #
-        # NOTE TO FUTURE ME/MAINTAINER
-        # this method avoids calling self.days_in_year for performance reasons
-        # if it wasn't implemented in CPython it could be a lot simpler...
-        #
-        # The philosophy is to count days from a calendar's epoch until the
-        # provided ordinal, counting the years that have elapsed in the process
-
-        start_ast_year, sign = self._start_and_sign(ordinal)
-        ast_year = start_ast_year
-        calendar = self.calendar
-        if not calendar.has_leap_year:
+        # The philosophy is to count days from the start of the calendar's
+        # first year. Whole cycles are divided out, then the year within the
+        # cycle is found with a bisect, so the cost doesn't depend on how far
+        # the ordinal is from the epoch
+        ordinal = int(ordinal)
+        cycle_day_offsets = self.spec.cycle_day_offsets
+        cycle_length = len(cycle_day_offsets) - 1
+        days_in_cycle = cycle_day_offsets[-1]
+        completed_cycles, days_into_cycle = divmod(ordinal - 1, days_in_cycle)
+        years_into_cycle = bisect.bisect_right(
+            cycle_day_offsets, days_into_cycle
+        )
+        ast_year = completed_cycles * cycle_length + years_into_cycle
+
+        # special years move year boundaries by a few days at most
+        days_before_year = self._days_before_year(ast_year)
+        while ordinal <= days_before_year:
+            ast_year -= 1
+            days_before_year = self._days_before_year(ast_year)
+
+        days_in_year = self.days_in_year(ast_year)
+        while ordinal > days_before_year + days_in_year:
+            ast_year += 1
+            days_before_year += days_in_year
             days_in_year = self.days_in_year(ast_year)
-            passed_years = int(abs(ordinal) / days_in_year)
-            if ordinal % days_in_year == 0 and sign == 1:  # edge case
-                passed_years = (ordinal / days_in_year) - 1
-
-            ast_year += passed_years * sign
-            days_in_passed_years = days_in_year * passed_years
-            return make_ordinal_date(ordinal, days_in_passed_years, ast_year)
-
-        cycle_length = calendar.leap_year_cycle_length
-
-        # coarse search for correct ast year, increment by entire cycles
-        #
-        # when ast_year == 0, days_in_passed_cycles is negative and the
-        # ast_year is positive. This error is corrected later
-        days_in_passed_cycles = 0
-        while days_in_passed_cycles < abs(ordinal):
-            days_in_passed_cycles += days_in_this_cycle(ast_year)
-            ast_year += cycle_length * sign
-        days_in_passed_cycles -= days_in_this_cycle(ast_year)
-        ast_year -= cycle_length * sign
-
-        if days_in_passed_cycles >= 0:
-            # assume all years are leap to guess minimum correct year
-            min_ast_year = ast_year
-            min_days_into_cycle = calendar.days_in_leap_year
-            while days_in_passed_cycles + min_days_into_cycle < abs(ordinal):
-                min_days_into_cycle += calendar.days_in_leap_year
-                min_ast_year += sign * 1
-            min_days_into_cycle -= calendar.days_in_leap_year
-            min_ast_year -= sign * 1
-            guessed_min_days = min_days_into_cycle > 0
-        else:  # skip because of edge case described above
-            guessed_min_days = False
-            min_ast_year = ast_year = 0
-            days_in_passed_cycles = 0
-            min_days_into_cycle = 0
-
-        if guessed_min_days:
-            # find the amount of extra leap years only if necessary
-            days_in_leap_year = self.calendar.days_in_leap_year
-            days_in_common_year = self.calendar.days_in_common_year
-
-            completed_cycles = self.completed_cycles(min_ast_year)
-            min_cycle_index = self.cycle_index(
-                min_ast_year, completed_cycles, start_ast_year, sign
-            )
-            all_cycle_ords = list(self.all_cycle_ordinals)
-            if sign == -1:
-                all_cycle_ords.reverse()
-            min_passed_cycle_ords = set(all_cycle_ords[: min_cycle_index + 1])
-            cycle_common_ords = set(self.common_year_cycle_ordinals)
-            extra_leap_years = len(min_passed_cycle_ords & cycle_common_ords)
-            leap_days = days_in_leap_year - days_in_common_year
-            if sign == -1:  # reset for the entire instance
-                all_cycle_ords.reverse()
-
-            # adjust guesses based on extra leap years
-            extra_leap_days = abs(extra_leap_years * leap_days)
-            days_in_leap_year = calendar.days_in_leap_year
-            ast_year = min_ast_year + int(extra_leap_days / days_in_leap_year)
-            skipped_special_years = self.net_elapsed_special_years(ast_year)
-            skipped_special_common_years = skipped_special_years[1]
-            ast_year += skipped_special_common_years
-            min_days_into_cycle -= extra_leap_days
-
-        # iterate year by year
-        if guessed_min_days:
-            days_in_passed_years = days_in_passed_cycles + min_days_into_cycle
-        else:
-            days_in_passed_years = days_in_passed_cycles + self.days_in_year(
-                ast_year
-            )
-        while days_in_passed_years < abs(ordinal):
-            ast_year += sign * 1
-            days_in_passed_years += self.days_in_year(ast_year)
-        days_in_passed_years -= self.days_in_year(ast_year)
 
-        return make_ordinal_date(ordinal, days_in_passed_years, ast_year)
+        ordinal_date = ast_year, ordinal - days_before_year
+        msg = f"{ordinal} made invalid ordinal date {ordinal_date}"
+        assert self.is_valid_ordinal_date(ordinal_date), msg
+        return ordinal_date
+
+    def _days_before_year(self, ast_year: int) -> int:
+        """
+        :returns: days between the start of the calendar's first year and the
+            start of the given year. Negative for proleptic years
+        """
+        cycle_day_offsets = self.spec.cycle_day_offsets
+        cycle_length = len(cycle_day_offsets) - 1
+        completed_cycles, cycle_index = divmod(ast_year - 1, cycle_length)
+        days_before_year = (
+            completed_cycles * cycle_day_offsets[-1]
+            + cycle_day_offsets[cycle_index]
+        )
+
+        if not self.spec.special_years:
+            return days_before_year
+
+        leap_days = self.spec.days_in_leap_year - self.spec.days_in_common_year
+        net_special_leaps = self._net_special_leaps_before(ast_year)
+        return days_before_year + net_special_leaps * leap_days
+
+    def _net_special_leaps_before(self, ast_year: int) -> int:
+        """
+        :returns: net special leap years before the given year, less those
+            before the epoch. Negative counts for proleptic years since they
+            count backwards
+        """
+        special_years = self.spec.special_years
+        net_special_leaps = self.spec.net_special_leaps
+        return (
+            net_special_leaps[bisect.bisect_left(special_years, ast_year)]
+            - net_special_leaps[bisect.bisect_left(special_years, 1)]
+        )
 
     def completed_cycles(self, ast_year: int) -> int:
         start_ast_year, _ = self._start_and_sign(ast_year)
-        cycle_length = self.calendar.leap_year_cycle_length
+        cycle_length = self.spec.leap_year_cycle_length
         elapsed_years = abs(ast_year - start_ast_year)
         completed_cycles = int(elapsed_years / cycle_length)
         return completed_cycles
@@ -344,7 +329,7 @@ class ConvertibleDate:
         if start_ast_year is None or sign is None:
             start_ast_year, sign = self._start_and_sign(ast_year)
 
-        cycle_length = self.calendar.leap_year_cycle_length
+        cycle_length = self.spec.leap_year_cycle_length
         current_cycle_start_ast_year = (
             (completed_cycles * cycle_length) + start_ast_year
         ) * sign
@@ -353,7 +338,7 @@ class ConvertibleDate:
 
     @property
     def all_cycle_ordinals(self) -> deque:
-        return self._all_cycle_ordinals
+        return deque(self.spec.all_cycle_ordinals)
 
     @all_cycle_ordinals.setter
     def all_cycle_ordinals(self, _):
@@ -361,10 +346,10 @@ class ConvertibleDate:
 
     @property
     def days_in_normal_cycle(self) -> int:
-        leap_years_in_normal_cycle = self.calendar.leap_years_in_normal_cycle
+        leap_years_in_normal_cycle = self.spec.forward_elapsed_leap_years[-1]
         common_years_in_normal_cycle = self.common_years_in_normal_cycle
-        days_in_leap_year = self.calendar.days_in_leap_year
-        days_in_common_year = self.calendar.days_in_common_year
+        days_in_leap_year = self.spec.days_in_leap_year
+        days_in_common_year = self.spec.days_in_common_year
         days_in_normal_cycle = (
             leap_years_in_normal_cycle * days_in_leap_year
             + common_years_in_normal_cycle * days_in_common_year
@@ -377,7 +362,7 @@ class ConvertibleDate:
 
     @property
     def common_year_cycle_ordinals(self) -> tuple:
-        return self._common_year_cycle_ordinals
+        return self.spec.common_year_cycle_ordinals
 
     @common_year_cycle_ordinals.setter
     def common_year_cycle_ordinals(self, _):
@@ -396,44 +381,24 @@ class ConvertibleDate:
         :returns: special leap and special common years since the epoch
             *does not include* the given year
         """
-        special_leaps = set(self.calendar.special_leap_years)
-        special_commons = set(self.calendar.special_common_years)
-        if not (special_leaps or special_commons):
+        spec = self.spec
+        special_years = spec.special_years
+        if not special_years:
             return 0, 0
 
         start_ast_year, sign = self._start_and_sign(ast_year)
-        if sign == 1:
-            all_passed_years = set(range(start_ast_year, ast_year))
-        else:
-            all_passed_years = set(range(ast_year + 1, start_ast_year + 1))
-
-        elapsed_special_leaps = 0
-        if special_leaps:
-            elapsed_special_leap_years = special_leaps & all_passed_years
-            elapsed_special_leaps = len(
-                [  # only count common years made leap
-                    special_leap
-                    for special_leap in elapsed_special_leap_years
-                    if not self.is_leap_year(special_leap, count_special=False)
-                ]
-            )
-
-        elapsed_special_commons = 0
-        if special_commons:
-            passed_special_common_years = special_commons & all_passed_years
-            elapsed_special_commons = len(
-                [  # only count leap years made common
-                    special_common
-                    for special_common in passed_special_common_years
-                    if self.is_leap_year(special_common, count_special=False)
-                ]
-            )
+        if sign == 1:  # passed years are [start_ast_year, ast_year)
+            first_idx = bisect.bisect_left(special_years, start_ast_year)
+            last_idx = bisect.bisect_left(special_years, ast_year)
+        else:  # passed years are (ast_year, start_ast_year]
+            first_idx = bisect.bisect_right(special_years, ast_year)
+            last_idx = bisect.bisect_right(special_years, start_ast_year)
+
+        net_special_leaps = spec.net_special_leaps
         net_elapsed_special_leaps = (
-            elapsed_special_leaps - elapsed_special_commons
-        )
-        net_elapsed_special_commons = (
-            elapsed_special_commons - elapsed_special_leaps
+            net_special_leaps[last_idx] - net_special_leaps[first_idx]
         )
+        net_elapsed_special_commons = -net_elapsed_special_leaps
         return net_elapsed_special_leaps, net_elapsed_special_commons
 
     @staticmethod
@@ -446,42 +411,169 @@ class ConvertibleDate:
 
     def ast_ymd_to_ordinal_date(self, ast_ymd: Ymd_tuple) -> tuple[int, int]:
         """:raises ValueError: for an invalid year, month, day"""
-        if not self.is_valid_ast_ymd(ast_ymd):
+        ast_year, month, day = ast_ymd
+        is_leap = self.is_leap_year(ast_year)
+        if not self.is_valid_ast_ymd(ast_ymd, is_leap):
             raise ValueError(
                 f"{ast_ymd} is not a valid year, month, day for the "
                 f"{self.calendar.name} calendar"
             )
 
-        ast_year, month, day = ast_ymd
         day_of_year = day
         if month:
-            day_of_year = sum(self.days_in_months(ast_year)[: month - 1]) + day
+            day_of_year = self.spec.month_offsets[is_leap][month - 1] + day
         return ast_year, day_of_year
 
     def ordinal_date_to_ast_ymd(self, ordinal_date: tuple) -> Ymd_tuple:
         """:raises ValueError: for invalid ordinal date"""
-        if not self.is_valid_ordinal_date(ordinal_date):
+        ast_year, day_of_year = ordinal_date
+        is_leap = self.is_leap_year(ast_year)
+        if not self.is_valid_ordinal_date(ordinal_date, is_leap):
             raise ValueError(
                 f"{ordinal_date} is not a valid ordinal date"
                 f"for {self.calendar}"
             )
 
-        ast_year, day_of_year = ordinal_date
-        months_in_year = self.months_in_year(ast_year)
-        if not months_in_year:
+        spec = self.spec
+        if not spec.months_in_year[is_leap]:
             return ast_year, None, day_of_year
 
-        days_in_months = self.days_in_months(ast_year)
-        day = day_of_year
-        month = 0
-        days_into_year = days_in_months[month]
-        while day_of_year - days_into_year > 0:
-            day = day_of_year - days_into_year
-            month += 1
-            days_into_year += days_in_months[month]
-        month += 1  # convert from index into human-readable month
+        # the first month to end on or after the day of the year
+        month_offsets = spec.month_offsets[is_leap]
+        month = bisect.bisect_left(month_offsets, day_of_year)
+        day = day_of_year - month_offsets[month - 1]
         return ast_year, month, day
 
+    def ast_ymd_to_ordinals(self, ast_years, months, days) -> numpy.ndarray:
+        """
+        vectorized :py:meth:`ast_ymd_to_ordinal_date` followed by
+        :py:meth:`ordinal_date_to_ordinal`
+
+        :param ast_years: array-like of astronomical years
+        :param months: array-like of months, None for monthless calendars
+        :param days: array-like of days
+        :returns: int64 array of ordinals, shaped like the broadcast inputs
+        :raises ValueError: if any year, month, day is invalid
+        """
+        ast_years = numpy.asarray(ast_years, dtype=numpy.int64)
+        days = numpy.asarray(days, dtype=numpy.int64)
+        # leap year flags as row indexes, a bool array would be a mask
+        is_leap = self.is_leap_year_many(ast_years).astype(numpy.intp)
+
+        month_offset_table = self.spec.month_offset_table
+        if months is None:
+            months = numpy.zeros_like(days)
+            is_valid = (1 <= days) & (days <= month_offset_table[is_leap, -1])
+            days_into_year = days
+        else:
+            months = numpy.asarray(months, dtype=numpy.int64)
+            months_in_year = numpy.array(self.spec.months_in_year)[is_leap]
+            is_valid = (1 <= months) & (months <= months_in_year)
+            # clipping keeps invalid months indexable, they're masked anyway
+            months = months.clip(1, month_offset_table.shape[1] - 1)
+            days_before_month = month_offset_table[is_leap, months - 1]
+            days_in_month = (
+                month_offset_table[is_leap, months] - days_before_month
+            )
+            is_valid &= (1 <= days) & (days <= days_in_month)
+            days_into_year = days_before_month + days
+
+        if not is_valid.all():
+            ast_years, months, days = numpy.broadcast_arrays(
+                ast_years, months, days
+            )
+            bad_idx = numpy.argmin(is_valid)
+            bad_year, bad_month, bad_day = (
+                int(array.flat[bad_idx]) for array in (ast_years, months, days)
+            )
+            bad_ymd = bad_year, bad_month or None, bad_day
+            raise ValueError(
+                f"{bad_ymd} is not a valid year, month, day for the "
+                f"{self.calendar.name} calendar"
+            )
+        return self._days_before_years(ast_years) + days_into_year
+
+    def ordinals_to_ast_ymd(
+        self, ordinals
+    ) -> tuple[numpy.ndarray, Union[numpy.ndarray, None], numpy.ndarray]:
+        """
+        vectorized :py:meth:`ordinal_to_ordinal_date` followed by
+        :py:meth:`ordinal_date_to_ast_ymd`
+
+        :param ordinals: array-like of ordinals
+        :returns: int64 arrays of astronomical years, months and days, shaped
+            like ordinals. Months are None for monthless calendars
+        """
+        ordinals = numpy.asarray(ordinals, dtype=numpy.int64)
+        spec = self.spec
+        cycle_day_offsets = spec.cycle_day_offset_array
+        cycle_length = cycle_day_offsets.size - 1
+        completed_cycles, days_into_cycle = numpy.divmod(
+            ordinals - 1, cycle_day_offsets[-1]
+        )
+        years_into_cycle = numpy.searchsorted(
+            cycle_day_offsets, days_into_cycle, side="right"
+        )
+        ast_years = completed_cycles * cycle_length + years_into_cycle
+
+        # special years move year boundaries by a few days at most
+        days_before_year = self._days_before_years(ast_years)
+        too_late = ordinals <= days_before_year
+        while too_late.any():
+            ast_years -= too_late
+            days_before_year = self._days_before_years(ast_years)
+            too_late = ordinals <= days_before_year
+
+        # leap year flags as row indexes, a bool array would be a mask
+        is_leap = self.is_leap_year_many(ast_years).astype(numpy.intp)
+        month_offset_table = spec.month_offset_table
+        days_in_years = month_offset_table[is_leap, -1]
+        too_early = ordinals > days_before_year + days_in_years
+        while too_early.any():
+            ast_years += too_early
+            days_before_year = self._days_before_years(ast_years)
+            is_leap = self.is_leap_year_many(ast_years).astype(numpy.intp)
+            days_in_years = month_offset_table[is_leap, -1]
+            too_early = ordinals > days_before_year + days_in_years
+
+        days_into_year = ordinals - days_before_year
+        if not spec.months_in_year[False]:
+            return ast_years, None, days_into_year
+
+        # the first month to end on or after the day of the year
+        months = numpy.where(
+            is_leap,
+            numpy.searchsorted(month_offset_table[1], days_into_year),
+            numpy.searchsorted(month_offset_table[0], days_into_year),
+        )
+        days = days_into_year - month_offset_table[is_leap, months - 1]
+        return ast_years, months, days
+
+    def _days_before_years(self, ast_years: numpy.ndarray) -> numpy.ndarray:
+        """vectorized :py:meth:`_days_before_year`"""
+        spec = self.spec
+        cycle_day_offsets = spec.cycle_day_offset_array
+        completed_cycles, cycle_indices = numpy.divmod(
+            ast_years - 1, cycle_day_offsets.size - 1
+        )
+        days_before_years = (
+            completed_cycles * cycle_day_offsets[-1]
+            + cycle_day_offsets[cycle_indices]
+        )
+        if not spec.special_years:
+            return days_before_years
+
+        # special years before the given years less those before the epoch,
+        # which is negative for proleptic years since they count backwards
+        special_years = spec.special_year_array
+        net_special_leaps = spec.net_special_leap_array
+        net_elapsed_special_leaps = (
+            net_special_leaps[numpy.searchsorted(special_years, ast_years)]
+            - net_special_leaps[numpy.searchsorted(special_years, 1)]
+        )
+        leap_days = spec.days_in_leap_year - spec.days_in_common_year
+        return days_before_years + net_elapsed_special_leaps * leap_days
+
     def shift_ast_ymd(self, ast_ymd: Ymd_tuple, intervals: list) -> Ymd_tuple:
         """
         :param ast_ymd: astronomical year, month, day
@@ -507,6 +599,18 @@ class ConvertibleDate:
                     raise ValueError("Can't shift montheless year, month, day")
 
                 ast_year, month = self.shift_month(ast_year, month, delta)
+            elif dateunit == DateUnit.WEEK:
+                days_in_weeks = self._days_in_weeks()
+                ordinal_date = self.ast_ymd_to_ordinal_date(
+                    (ast_year, month, day)
+                )
+                ordinal = self.ordinal_date_to_ordinal(ordinal_date)
+                ordinal_date = self.ordinal_to_ordinal_date(
+                    ordinal + delta * days_in_weeks
+                )
+                ast_year, month, day = self.ordinal_date_to_ast_ymd(
+                    ordinal_date
+                )
             else:
                 raise ValueError(f"Don't shift ymd by {dateunit}")
 
@@ -532,19 +636,60 @@ class ConvertibleDate:
     def shift_month(
         self, ast_year: int, month: int, delta: int
     ) -> tuple[int, int]:
+        """:raises ValueError: for monthless calendars"""
+        spec = self.spec
+        cycle_month_offsets = spec.cycle_month_offsets
+        if not cycle_month_offsets[-1]:
+            raise ValueError(f"Can't shift months of {self.calendar}")
+
         new_month = month + delta
         if self.is_valid_month(ast_year, new_month):
-            month = new_month
-            return ast_year, month
-
-        # increment year until month is valid
-        sign = int(math.copysign(1, delta))
-        month = new_month
-        while not self.is_valid_month(ast_year, month):
-            ast_year += sign
-            delta = self.months_in_year(ast_year) * -sign
-            month += delta
-        return ast_year, month
+            return ast_year, new_month
+
+        # count months from the start of the calendar's first year, then
+        # divide out whole cycles like ordinal_to_ordinal_date does with days
+        months_since_epoch = self._months_before_year(ast_year) + new_month - 1
+        cycle_length = len(cycle_month_offsets) - 1
+        completed_cycles, months_into_cycle = divmod(
+            months_since_epoch, cycle_month_offsets[-1]
+        )
+        years_into_cycle = bisect.bisect_right(
+            cycle_month_offsets, months_into_cycle
+        )
+        ast_year = completed_cycles * cycle_length + years_into_cycle
+
+        # special years move year boundaries by a few months at most
+        months_before_year = self._months_before_year(ast_year)
+        while months_since_epoch < months_before_year:
+            ast_year -= 1
+            months_before_year = self._months_before_year(ast_year)
+
+        months_in_year = self.months_in_year(ast_year)
+        while months_since_epoch >= months_before_year + months_in_year:
+            ast_year += 1
+            months_before_year += months_in_year
+            months_in_year = self.months_in_year(ast_year)
+        return ast_year, months_since_epoch - months_before_year + 1
+
+    def _months_before_year(self, ast_year: int) -> int:
+        """
+        :returns: months between the start of the calendar's first year and
+            the start of the given year. Negative for proleptic years
+        """
+        spec = self.spec
+        cycle_month_offsets = spec.cycle_month_offsets
+        cycle_length = len(cycle_month_offsets) - 1
+        completed_cycles, cycle_index = divmod(ast_year - 1, cycle_length)
+        months_before_year = (
+            completed_cycles * cycle_month_offsets[-1]
+            + cycle_month_offsets[cycle_index]
+        )
+        if not spec.special_years:
+            return months_before_year
+
+        leap_months = spec.months_in_year[True] - spec.months_in_year[False]
+        net_special_leaps = self._net_special_leaps_before(ast_year)
+        return months_before_year + net_special_leaps * leap_months
 
     def next_ast_ymd(
         self, ast_ymd: Ymd_tuple, interval: Date_interval, forward=True
@@ -568,6 +713,8 @@ class ConvertibleDate:
             return self.next_ast_year(ast_year, frequency, forward)
         elif dateunit == DateUnit.MONTH:
             return self.next_month(ast_year, month, frequency, forward)
+        elif dateunit == DateUnit.WEEK:
+            return self.next_week(ast_ymd, frequency, forward)
         elif dateunit == DateUnit.DAY:
             return self.next_day(ast_ymd, frequency, forward)
         else:
@@ -578,29 +725,30 @@ class ConvertibleDate:
         :returns: First day of the next era. If the current era is the last one
             return it's first day
         """
-        num_eras = len(self.calendar.eras)
+        spec = self.spec
+        num_eras = len(spec.eras)
         if frequency > num_eras:
             msg = f"Can't find every {frequency} era(s) for {self.calendar}"
             raise ValueError(msg)
 
         sign = 1 if forward else -1
         current_era = self.era(ast_year)
-        current_idx = self.calendar.eras.index(current_era)
+        current_idx = spec.eras.index(current_era)
         next_era_idx = current_idx + sign
         while (next_era_idx + sign) % frequency != 0:
             next_era_idx += sign
 
         if next_era_idx <= 0:
             next_era_idx = 0
-            hr_year = self.calendar.era_ranges[next_era_idx][1]
+            hr_year = spec.era_ranges[next_era_idx][1]
             ast_year = self.hr_to_ast(hr_year, next_era_idx)
             month = self.months_in_year(ast_year)
             day = self.days_in_month(ast_year, month)
             return ast_year, month, day
         elif next_era_idx + 1 > num_eras:
-            next_era_idx = len(self.calendar.eras) - 1
+            next_era_idx = num_eras - 1
 
-        hr_year = self.calendar.era_ranges[next_era_idx][0]
+        hr_year = spec.era_ranges[next_era_idx][0]
         ast_year = self.hr_to_ast(hr_year, next_era_idx)
         return ast_year, 1, 1
 
@@ -612,31 +760,70 @@ class ConvertibleDate:
             msg = f"Frequency must be greater than 0, {frequency} is not"
             raise ValueError(msg)
 
-        delta = self._get_delta(forward)
-        ast_year += delta
-        while ast_year % frequency != 0:
-            ast_year += delta
+        # the nearest multiple of the frequency past the given year
+        if forward:
+            ast_year = (ast_year // frequency + 1) * frequency
+        else:
+            ast_year = (ast_year - 1) // frequency * frequency
         return ast_year, 1, 1
 
     def next_month(
         self, ast_year: int, month: int, frequency: int, forward=True
     ) -> Ymd_tuple:
         """:returns: the first day of the next month"""
-        if frequency > self.calendar.days_in_common_year:
+        if frequency > max(self.spec.months_in_year):
             msg = f"Can't find every {frequency} month(s) for {self.calendar}"
             raise ValueError(msg)
 
-        delta = self._get_delta(forward)
-        month += delta
-        ast_year, month = self._overflow_month(ast_year, month, forward)
-        while month % frequency != 0:
-            month += delta
-            ast_year, month = self._overflow_month(ast_year, month, forward)
+        # the nearest multiple of the frequency past the given month, if the
+        # year is too short for one, the first or last multiple of another
+        # year. Only calendars with more months in leap years skip a year
+        if forward:
+            month = (month // frequency + 1) * frequency
+            while month > self.months_in_year(ast_year):
+                ast_year += 1
+                month = frequency
+        else:
+            month = (month - 1) // frequency * frequency
+            while month < 1:
+                ast_year -= 1
+                month = self.months_in_year(ast_year) // frequency * frequency
 
         error_msg = f"Month number {month} not valid for {self.calendar}"
         assert self.is_valid_month(ast_year, month), error_msg
         return ast_year, month, 1
 
+    def next_week(
+        self, ast_ymd: Ymd_tuple, frequency: int, forward=True
+    ) -> Ymd_tuple:
+        """
+        :returns: the first day of the next week. Weeks start on
+            :py:attr:`calendar.weekday_start` and every nth week is counted
+            from the week of the first ordinal
+        :raises ValueError: for calendars without weeks
+        """
+        if frequency <= 0:
+            msg = f"Frequency must be greater than 0, {frequency} is not"
+            raise ValueError(msg)
+
+        days_in_weeks = self._days_in_weeks()
+        spec = self.spec
+        ordinal_date = self.ast_ymd_to_ordinal_date(ast_ymd)
+        ordinal = self.ordinal_date_to_ordinal(ordinal_date)
+
+        # the nearest multiple of the frequency past the given week
+        days_into_first_week = spec.epoch_weekday - spec.weekday_start
+        first_week_start = 1 - days_into_first_week % days_in_weeks
+        if forward:
+            week = (ordinal - first_week_start) // days_in_weeks
+            week = (week // frequency + 1) * frequency
+        else:
+            week = (ordinal - 1 - first_week_start) // days_in_weeks
+            week = week // frequency * frequency
+        ordinal = first_week_start + week * days_in_weeks
+        ordinal_date = self.ordinal_to_ordinal_date(ordinal)
+        return self.ordinal_date_to_ast_ymd(ordinal_date)
+
     def next_day(
         self, ast_ymd: Ymd_tuple, frequency: int, forward=True
     ) -> Ymd_tuple:
@@ -644,36 +831,95 @@ class ConvertibleDate:
         :returns: every nth day, defined by te frequency, changing the month
             or year if necessary
         """
-
-        def shift(ymd: Ymd_tuple, _delta: int, _forward=True) -> Ymd_tuple:
-            """rollover day/month/year if necessary when shifting days"""
-            y, m, d = ymd
-            d += _delta
-            if not self.is_valid_ast_ymd((y, m, d)):
-                m += _delta
-                y, m = self._overflow_month(y, m, _forward)
-                d = 1 if forward else self.days_in_month(y, m)
-            return y, m, d
-
-        min_days_in_month = min(
-            min(self.calendar.days_in_common_year_months),
-            min(self.calendar.days_in_leap_year_months),
-        )
+        common_months, leap_months = self.spec.days_in_months
+        min_days_in_month = min(common_months + leap_months)
         if frequency > min_days_in_month:
             msg = f"Day frequency, {frequency}, invalid for {self.calendar}"
             raise ValueError(msg)
 
-        delta = self._get_delta(forward)
-        ast_ymd = shift(ast_ymd, delta, forward)
-        day = ast_ymd[2]
-        while day % frequency != 0:
-            ast_ymd = shift(ast_ymd, delta, forward)
-            day = ast_ymd[2]
+        # the nearest multiple of the frequency past the given day, every
+        # month is long enough to have one
+        ast_year, month, day = ast_ymd
+        if forward:
+            day = (day // frequency + 1) * frequency
+            if day > self._days_in_month_or_year(ast_year, month):
+                ast_year, month = self._overflow_month_or_year(
+                    ast_year, month, forward
+                )
+                day = frequency
+        else:
+            day = (day - 1) // frequency * frequency
+            if day < 1:
+                ast_year, month = self._overflow_month_or_year(
+                    ast_year, month, forward
+                )
+                days_in_month = self._days_in_month_or_year(ast_year, month)
+                day = days_in_month // frequency * frequency
 
+        ast_ymd = ast_year, month, day
         msg = f"{ast_ymd} is invalid for {self.calendar}"
         assert self.is_valid_ast_ymd(ast_ymd), msg
         return ast_ymd
 
+    def gen_ast_ymds(
+        self, ast_ymd: Ymd_tuple, interval: Date_interval
+    ) -> tuple[Ymd_tuple, int]:
+        """
+        Generator for every interval from the given ast_ymd onwards,
+        like repeatedly calling :py:meth:`next_ast_ymd`
+
+        :param ast_ymd: first ast_ymd generated, should be on the interval
+        :param interval: every nth year, month or day
+        :returns: the ast_ymd and its ordinal. Ordinals count on from the
+            start of the year, which is only found when the year changes
+        :raises ValueError: for an interval of another DateUnit
+        """
+        frequency, dateunit = interval
+        if dateunit not in (DateUnit.YEAR, DateUnit.MONTH, DateUnit.DAY):
+            raise ValueError(f"Cannot generate every {dateunit}")
+
+        ast_year, month, day = ast_ymd
+        year_of_offsets = days_before_year = month_offsets = None
+        while True:
+            if ast_year != year_of_offsets:
+                year_of_offsets = ast_year
+                days_before_year = self._days_before_year(ast_year)
+                is_leap = self.is_leap_year(ast_year)
+                month_offsets = self.spec.month_offsets[is_leap]
+
+            day_of_year = day
+            if month is not None:
+                day_of_year += month_offsets[month - 1]
+            yield (ast_year, month, day), days_before_year + day_of_year
+
+            if dateunit == DateUnit.YEAR:
+                ast_year, month, day = self.next_ast_year(ast_year, frequency)
+            elif dateunit == DateUnit.MONTH:
+                ast_year, month, day = self.next_month(
+                    ast_year, month, frequency
+                )
+            else:
+                ast_year, month, day = self.next_day(
+                    (ast_year, month, day), frequency
+                )
+
+    def _days_in_month_or_year(self, ast_year: int, month: int) -> int:
+        """:returns: days in the month, or the year for monthless calendars"""
+        if month is None:
+            return self.days_in_year(ast_year)
+        return self.days_in_month(ast_year, month)
+
+    def _overflow_month_or_year(
+        self, ast_year: int, month: int, forward=True
+    ) -> tuple[int, int]:
+        """
+        :returns: the next or previous month, or year for monthless calendars
+        """
+        delta = self._get_delta(forward)
+        if month is None:
+            return ast_year + delta, month
+        return self._overflow_month(ast_year, month + delta, forward)
+
     def _overflow_month(
         self, year: int, month: int, forward=True
     ) -> tuple[int, int]:
@@ -694,22 +940,36 @@ class ConvertibleDate:
         human-readable year to astronomical year.
 
         :param hr_year: human-readable year
-        :param era_idx: index into py:attr:`self.calendar.era_ranges`
+        :param era_idx: index into py:attr:`self.spec.era_ranges`
         """
-        era_range = self.calendar.era_ranges[era_idx]
-        era_start_hr_year = float(era_range[0])
-        era_end_hr_year = float(era_range[1])
+        era_start_ast_year, _, era_start_hr_year, era_end_hr_year, _ = (
+            self.spec.era_bounds[era_idx]
+        )
         if era_start_hr_year == float("-inf"):  # in calendar's proleptic era
             return int(-(hr_year - era_end_hr_year))
 
-        years_before_era = 0
-        for era_info in self.gen_years_before_era(start=1):
-            if era_info["index"] == era_idx:
-                break
-            years_before_era += era_info["years_in"]
+        years_into_current_era = abs(hr_year - era_start_hr_year)
+        return int(era_start_ast_year + years_into_current_era)
 
-        years_into_current_era = abs(hr_year - era_start_hr_year) + 1
-        return int(years_into_current_era + years_before_era)
+    def hr_to_ast_many(self, hr_years, era_idxs) -> numpy.ndarray:
+        """
+        vectorized :py:meth:`hr_to_ast`
+
+        :param hr_years: array-like of human-readable years
+        :param era_idxs: array-like of indices into the calendar's eras
+        :returns: int64 array of astronomical years
+        """
+        hr_years = numpy.asarray(hr_years, dtype=numpy.int64)
+        era_idxs = numpy.asarray(era_idxs, dtype=numpy.intp)
+        era_bounds = numpy.array(self.spec.era_bounds, dtype=numpy.float64)
+        ast_start, _, hr_start, hr_end, _ = era_bounds[era_idxs].T
+        with numpy.errstate(invalid="ignore"):  # infinite bounds of the
+            ast_years = numpy.where(  # other branch
+                era_idxs == 0,
+                hr_end - hr_years,
+                ast_start + numpy.abs(hr_years - hr_start),
+            )
+        return ast_years.astype(numpy.int64)
 
     def ast_to_hr(self, ast_year: int) -> tuple[int, int]:
         """
@@ -720,37 +980,59 @@ class ConvertibleDate:
         """
         if ast_year <= 0:  # the proleptic era
             era_idx = 0
-            era_end_hr_year = self.calendar.era_ranges[era_idx][1]
+            era_end_hr_year = self.spec.era_ranges[era_idx][1]
             year_since_epoch = abs(ast_year - 1)
             hr_year = era_end_hr_year + year_since_epoch - 1
             return hr_year, era_idx
 
-        for era_info in self.gen_years_before_era(start=1):
-            era_idx = era_info["index"]
-            era_range = era_info["hr_range"]
-            era_start_ast_year, era_end_ast_year = era_info["ast_range"]
-            years_before_era = era_info["years_before"]
-
-            era_start_hr_year = float(era_range[0])
-            era_end_hr_year = float(era_range[1])
-            if era_end_hr_year == float("inf"):  # the last era
-                years_into_current_era = ast_year - era_start_ast_year
-                hr_year = era_start_hr_year + years_into_current_era
-                return int(hr_year), era_idx
-
-            if years_before_era < ast_year <= era_end_ast_year:
-                years_into_current_era = ast_year - era_start_ast_year
-
-                if era_range[1] > era_range[0]:
-                    hr_year = era_start_hr_year + years_into_current_era
-                else:
-                    hr_year = era_start_hr_year - years_into_current_era
-                return int(hr_year), era_idx
+        era_idx = self._era_idx(ast_year)
+        if era_idx is not None:
+            era_start_ast_year, _, era_start_hr_year, _, direction = (
+                self.spec.era_bounds[era_idx]
+            )
+            years_into_current_era = ast_year - era_start_ast_year
+            hr_year = era_start_hr_year + direction * years_into_current_era
+            return int(hr_year), era_idx
         raise RuntimeError(
             f"Unable to convert astronomical year, {ast_year},"
             f"to a human-readable {self.calendar} year"
         )
 
+    def ast_to_hr_many(self, ast_years) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        vectorized :py:meth:`ast_to_hr`
+
+        :param ast_years: array-like of astronomical years
+        :returns: int64 arrays of human-readable years and indices into the
+            calendar's eras
+        :raises RuntimeError: if any year is in no era
+        """
+        ast_years = numpy.asarray(ast_years, dtype=numpy.int64)
+        spec = self.spec
+        era_idxs = numpy.searchsorted(
+            spec.era_start_ast_years, ast_years, side="right"
+        )
+        era_bounds = numpy.array(spec.era_bounds, dtype=numpy.float64)
+        ast_start, ast_end, hr_start, hr_end, direction = era_bounds[
+            era_idxs
+        ].T
+        is_proleptic = era_idxs == 0
+        is_eraless = ~is_proleptic & (ast_years > ast_end)
+        if is_eraless.any():
+            bad_ast_year = int(ast_years[is_eraless].flat[0])
+            raise RuntimeError(
+                f"Unable to convert astronomical year, {bad_ast_year},"
+                f"to a human-readable {self.calendar} year"
+            )
+
+        with numpy.errstate(invalid="ignore"):  # infinite bounds of the
+            hr_years = numpy.where(  # other branch
+                is_proleptic,
+                hr_end - ast_years,
+                hr_start + direction * (ast_years - ast_start),
+            )
+        return hr_years.astype(numpy.int64), era_idxs
+
     def parse_hr_date(self, hr_date: str) -> tuple:
         """
         inverse operation of :py:meth:`format_hr_date`
@@ -767,85 +1049,113 @@ class ConvertibleDate:
         month = int(month) if month is not None else month
         day = int(day)
 
-        era_idx = self.calendar.eras.index(era)
+        era_idx = self.spec.eras.index(era)
         ast_year = self.hr_to_ast(hr_year, era_idx)
         return ast_year, month, day
 
     def format_hr_date(self, ast_ymd: Ymd_tuple) -> str:
         """inverse operation of :py:meth:`parse_hr_date`"""
         ast_year, month, day = ast_ymd
-        hr_year, _ = self.ast_to_hr(ast_year)
-        era = self.era(ast_year)
+        hr_year, era_idx = self.ast_to_hr(ast_year)
+        era = self.spec.eras[era_idx]
         return self.date_sep.join([str(hr_year), str(month), str(day), era])
 
     def era(self, ast_year: int) -> str:
         """:raises RuntimeError: If no era found"""
         if ast_year <= 0:  # is proleptic era
-            return self.calendar.eras[0]
-
-        years_before_era = 0
-        for era_info in self.gen_years_before_era(start=1):
-            era_idx = era_info["index"]
-            years_in_era = era_info["years_in"]
-            era_start_ast_year, era_end_ast_year = era_info["ast_range"]
+            return self.spec.eras[0]
 
-            if era_start_ast_year <= ast_year <= era_end_ast_year:
-                return self.calendar.eras[era_idx]
-            years_before_era += years_in_era
+        era_idx = self._era_idx(ast_year)
+        if era_idx is not None:
+            return self.spec.eras[era_idx]
         raise RuntimeError(
             f"Could not find {self.calendar} era for year: {ast_year}"
         )
 
+    def _era_idx(self, ast_year: int) -> Union[int, None]:
+        """
+        :returns: index into the calendar's eras for a non-proleptic year or
+            None if no era contains it
+        """
+        spec = self.spec
+        era_idx = bisect.bisect_right(spec.era_start_ast_years, ast_year)
+        if era_idx and ast_year <= spec.era_bounds[era_idx][1]:
+            return era_idx
+        return None
+
     def is_leap_year(self, ast_year: int, count_special: bool = True) -> bool:
         """
         :param ast_year: astronomical year
         :param count_special: flag to consider special leap and common years
         :returns: whether or not an astronomical year is a leap year
         """
-        if not self.calendar.has_leap_year:
-            return False
-
-        if ast_year in self.calendar.special_common_years and count_special:
-            return False
-        if ast_year in self.calendar.special_leap_years and count_special:
-            return True
-
-        start_ast_year, sign = self._start_and_sign(ast_year)
-        all_cycle_ordinals = self.all_cycle_ordinals
-        if sign == -1:
-            all_cycle_ordinals.reverse()
-
-        completed_cycles = self.completed_cycles(ast_year)
-        cycle_index = self.cycle_index(
-            ast_year, completed_cycles, start_ast_year, sign
-        )
-        leap_year_cycle_ordinals = self.calendar.leap_year_cycle_ordinals
-        leap = all_cycle_ordinals[cycle_index] in leap_year_cycle_ordinals
-        if sign == -1:  # undo reversing
-            all_cycle_ordinals.reverse()
-        return leap
+        spec = self.spec
+        if count_special and spec.has_leap_year:
+            if ast_year in spec.special_common_years:
+                return False
+            if ast_year in spec.special_leap_years:
+                return True
+        return spec.is_normal_leap_year(ast_year)
+
+    def is_leap_year_many(
+        self, ast_years, count_special: bool = True
+    ) -> numpy.ndarray:
+        """
+        vectorized :py:meth:`is_leap_year`
 
-    def is_valid_ast_ymd(self, ast_ymd: Ymd_tuple) -> bool:
+        :param ast_years: array-like of astronomical years
+        :param count_special: flag to consider special leap and common years
+        :returns: boolean array, shaped like ast_years
+        """
+        ast_years = numpy.asarray(ast_years, dtype=numpy.int64)
+        spec = self.spec
+        if not spec.has_leap_year:
+            return numpy.zeros(ast_years.shape, dtype=bool)
+
+        leap_year_mask = spec.leap_year_mask
+        leaps = leap_year_mask[(ast_years - 1) % leap_year_mask.size]
+        if count_special:
+            special_leaps = spec.special_leap_years
+            special_commons = spec.special_common_years
+            if special_leaps:
+                leaps |= numpy.isin(ast_years, list(special_leaps))
+            if special_commons:
+                leaps &= ~numpy.isin(ast_years, list(special_commons))
+        return leaps
+
+    def is_valid_ast_ymd(
+        self, ast_ymd: Ymd_tuple, is_leap: bool = None
+    ) -> bool:
+        """
+        :param is_leap: whether the year is a leap year, if already known
+        """
         ast_year, month, day = ast_ymd
-        if not self.is_valid_month(ast_year, month):
+        if is_leap is None:
+            is_leap = self.is_leap_year(ast_year)
+
+        if not self.is_valid_month(ast_year, month, is_leap):
             return False
 
         if month:
-            max_days = self.days_in_month(ast_year, month)
+            max_days = self.days_in_month(ast_year, month, is_leap)
         else:
-            max_days = self.days_in_year(ast_year)
+            max_days = self.days_in_year(ast_year, is_leap)
         return 1 <= day <= max_days
 
-    def is_valid_month(self, ast_year: int, month: Union[int, None]) -> bool:
-        max_months = self.months_in_year(ast_year)
+    def is_valid_month(
+        self, ast_year: int, month: Union[int, None], is_leap: bool = None
+    ) -> bool:
+        max_months = self.months_in_year(ast_year, is_leap)
         if month is None:
             return max_months == 0
         return 1 <= month <= max_months
 
-    def is_valid_ordinal_date(self, ordinal_date: tuple) -> bool:
+    def is_valid_ordinal_date(
+        self, ordinal_date: tuple, is_leap: bool = None
+    ) -> bool:
         """assumes astronomical year numbering"""
         ast_year, day_of_year = ordinal_date
-        return 1 <= day_of_year <= self.days_in_year(ast_year)
+        return 1 <= day_of_year <= self.days_in_year(ast_year, is_leap)
 
     def gen_years_before_era(self, start: int = 0) -> dict:
         """
@@ -858,57 +1168,142 @@ class ConvertibleDate:
             Years in the era can be an integer or infinity.
             Sum of years in previous eras **skips** infinite eras.
         """
-        for era_idx, era_range in enumerate(
-            self.calendar.era_ranges[start:], start=start
-        ):
-            years_before_era = sum(
-                abs(float(era_range[1]) - float(era_range[0])) + 1
-                for era_range in self.calendar.era_ranges[1:era_idx]
-            )
-            start_hr_year = float(era_range[0])
-            end_hr_year = float(era_range[1])
-            years_in_era = abs(end_hr_year - start_hr_year) + 1
-
-            ast_range = (
-                years_before_era + 1,
-                years_before_era + years_in_era,
-            )
-            if start_hr_year == float("-inf"):
-                ast_range = (float("-inf"), 0)
+        era_bounds = self.spec.era_bounds
+        for era_idx in range(start, len(era_bounds)):
+            ast_start, ast_end, start_hr_year, end_hr_year, _ = era_bounds[
+                era_idx
+            ]
             yield {
                 "index": era_idx,
-                "hr_range": era_range,
-                "ast_range": ast_range,
-                "years_in": years_in_era,
-                "years_before": years_before_era,
+                "hr_range": self.spec.era_ranges[era_idx],
+                "ast_range": (ast_start, ast_end),
+                "years_in": abs(end_hr_year - start_hr_year) + 1,
+                # the proleptic era is never counted
+                "years_before": ast_start - 1 if era_idx else 0,
             }
 
-    def days_in_months(self, ast_year: int) -> tuple:
-        if self.is_leap_year(ast_year):
-            return self.calendar.days_in_leap_year_months
-        return self.calendar.days_in_common_year_months
+    def days_in_months(self, ast_year: int, is_leap: bool = None) -> tuple:
+        if is_leap is None:
+            is_leap = self.is_leap_year(ast_year)
 
-    def days_in_month(self, ast_year: int, month: int) -> int:
-        return self.days_in_months(ast_year)[month - 1]
+        days_in_common_year_months, days_in_leap_year_months = (
+            self.spec.days_in_months
+        )
+        if is_leap:
+            return days_in_leap_year_months
+        return days_in_common_year_months
+
+    def days_in_month(
+        self, ast_year: int, month: int, is_leap: bool = None
+    ) -> int:
+        return self.days_in_months(ast_year, is_leap)[month - 1]
 
-    def days_in_year(self, ast_year: int) -> int:
-        if self.is_leap_year(ast_year):
-            return self.calendar.days_in_leap_year
-        return self.calendar.days_in_common_year
+    def days_in_year(self, ast_year: int, is_leap: bool = None) -> int:
+        if is_leap is None:
+            is_leap = self.is_leap_year(ast_year)
+        return self.spec.month_offsets[is_leap][-1]
 
-    def months_in_year(self, ast_year: int) -> int:
-        if self.is_leap_year(ast_year):
-            return self.calendar.months_in_leap_year
-        return self.calendar.months_in_common_year
+    def months_in_year(self, ast_year: int, is_leap: bool = None) -> int:
+        if is_leap is None:
+            is_leap = self.is_leap_year(ast_year)
+        return self.spec.months_in_year[is_leap]
 
     def day_of_week(self, ordinal: int) -> Union[int, None]:
         """
         :returns: index into :py:attr:`calendar.weekday_names` or None if
         calendar has no weeks
         """
-        days_in_weeks = self.calendar.days_in_weeks
-        if days_in_weeks:
-            return (ordinal + self.calendar.epoch_weekday - 1) % days_in_weeks
+        spec = self.spec
+        if spec.days_in_weeks:
+            return (ordinal + spec.epoch_weekday - 1) % spec.days_in_weeks
+
+    def day_of_week_many(self, ordinals) -> Union[numpy.ndarray, None]:
+        """
+        vectorized :py:meth:`day_of_week`
+
+        :param ordinals: array-like of ordinals
+        :returns: int64 array of indices into :py:attr:`calendar.weekday_names`
+            or None if calendar has no weeks
+        """
+        spec = self.spec
+        if spec.days_in_weeks:
+            ordinals = numpy.asarray(ordinals, dtype=numpy.int64)
+            return (ordinals + spec.epoch_weekday - 1) % spec.days_in_weeks
+
+    def next_weekday(self, ordinal: int, weekday: int, forward=True) -> int:
+        """
+        If today is a Wednesday, the next Sunday is in 4 days and the
+        previous one was 3 days ago. The same weekday is a week away
+
+        :param weekday: index into :py:attr:`calendar.weekday_names`
+        :returns: ordinal of the next or previous weekday
+        :raises ValueError: for calendars without weeks or an invalid weekday
+        """
+        days_in_weeks = self._days_in_weeks()
+        if not 0 <= weekday < days_in_weeks:
+            raise ValueError(f"{weekday} is not a weekday of {self.calendar}")
+
+        day_of_week = self.day_of_week(ordinal)
+        if forward:
+            return ordinal + (weekday - day_of_week - 1) % days_in_weeks + 1
+        return ordinal - (day_of_week - weekday - 1) % days_in_weeks - 1
+
+    def nth_weekday(
+        self, ast_year: int, month: Union[int, None], weekday: int, nth: int
+    ) -> Ymd_tuple:
+        """
+        i.e the 4th Thursday of November or the last Monday of May
+
+        :param month: None for the nth weekday of a monthless year
+        :param weekday: index into :py:attr:`calendar.weekday_names`
+        :param nth: counts from the start of the month when positive and from
+            the end when negative, -1 is the last weekday of the month
+        :raises ValueError: if the month doesn't have an nth weekday, for
+            calendars without weeks or an invalid weekday
+        """
+        ast_ymd = ast_year, month, 1
+        if nth == 0 or not self.is_valid_ast_ymd(ast_ymd):
+            msg = f"No {nth} weekday in {ast_year, month} of {self.calendar}"
+            raise ValueError(msg)
+
+        ordinal_date = self.ast_ymd_to_ordinal_date(ast_ymd)
+        first_ordinal = self.ordinal_date_to_ordinal(ordinal_date)
+        days_in_month = self._days_in_month_or_year(ast_year, month)
+        last_ordinal = first_ordinal + days_in_month - 1
+        days_in_weeks = self._days_in_weeks()
+        if nth > 0:
+            first = self.next_weekday(first_ordinal - 1, weekday)
+            ordinal = first + (nth - 1) * days_in_weeks
+        else:
+            last = self.next_weekday(last_ordinal + 1, weekday, forward=False)
+            ordinal = last + (nth + 1) * days_in_weeks
+
+        if not first_ordinal <= ordinal <= last_ordinal:
+            msg = f"No {nth} weekday in {ast_year, month} of {self.calendar}"
+            raise ValueError(msg)
+        ordinal_date = self.ordinal_to_ordinal_date(ordinal)
+        return self.ordinal_date_to_ast_ymd(ordinal_date)
+
+    def weekend_mask(
+        self, start_ordinal: int, end_ordinal: int
+    ) -> numpy.ndarray:
+        """
+        :returns: bool array, True for every weekend day from the start
+            ordinal up to, but not including, the end ordinal
+        :raises ValueError: for calendars without weeks
+        """
+        days_in_weeks = self._days_in_weeks()
+        spec = self.spec
+        ordinals = numpy.arange(start_ordinal, end_ordinal, dtype=numpy.int64)
+        weekdays = (ordinals + spec.epoch_weekday - 1) % days_in_weeks
+        return spec.weekend_table[weekdays]
+
+    def _days_in_weeks(self) -> int:
+        """:raises ValueError: for calendars without weeks"""
+        days_in_weeks = self.spec.days_in_weeks
+        if not days_in_weeks:
+            raise ValueError(f"{self.calendar} has no weeks")
+        return days_in_weeks
 
     @property
     def calendar(self) -> ConvertibleCalendar:
@@ -917,3 +1312,12 @@ class ConvertibleDate:
     @calendar.setter
     def calendar(self, _):
         raise AttributeError("Denied. Create new ConvertibleDate.")
+
+    @property
+    def spec(self) -> CalendarSpec:
+        """constants and lookup tables compiled from :py:attr:`calendar`"""
+        return self.calendar.spec
+
+    @spec.setter
+    def spec(self, _):
+        raise AttributeError("Denied. Change calendar instead.")
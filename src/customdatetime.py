@@ -15,36 +15,104 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
-import sympy
+import math
+import numpy
 
+from collections import OrderedDict
 from src.customdate import ConvertibleDate, DateUnit, Ymd_tuple
 from src.customtime import ConvertibleTime, TimeUnit, Hms_tuple
-from typing import Union
+from typing import Iterator, Union
 
 DateTimeEnum = Union[DateUnit, TimeUnit]
 DateTime_interval = list[int, DateTimeEnum]
 
 
+def proper_divisors(num: int) -> list[int]:
+    """:returns: ascending divisors of num, excluding num"""
+    small_divisors = []
+    large_divisors = []
+    for divisor in range(1, math.isqrt(num) + 1):
+        if num % divisor == 0:
+            small_divisors.append(divisor)
+            if divisor * divisor != num:
+                large_divisors.append(num // divisor)
+    return (small_divisors + large_divisors[::-1])[:-1]
+
+
+class LabelCache:
+    """
+    Least recently used human-readable dates and times. Keys are made by
+    :py:meth:`ConvertibleDateTime.label_key`
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._labels = OrderedDict()
+
+    def __len__(self):
+        return len(self._labels)
+
+    def get(self, key: tuple) -> Union[str, None]:
+        """:returns: the cached label or None if it isn't cached"""
+        try:
+            label = self._labels[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._labels.move_to_end(key)
+        self.hits += 1
+        return label
+
+    def put(self, key: tuple, label: str):
+        self._labels[key] = label
+        self._labels.move_to_end(key)
+        if len(self._labels) > self.maxsize:
+            self._labels.popitem(last=False)
+
+    def clear(self):
+        self._labels.clear()
+        self.hits = self.misses = 0
+
+
 class ConvertibleDateTime:
     """
     Manipulates dates and times with ConvertibleDate and ConvertibleTime
 
     * `Day decimal` is the progress into a day. 0.5 represents 12 noon on Earth
     * `Ordinal decimal` or `od` is an `ordinal` plus a `day decimal`
+    * `Instant` is whole seconds since the start of the 0th ordinal. Unlike
+      an ordinal decimal, it stays exact for deep time. Convert to an
+      ordinal decimal only to find a pixel
     """
 
-    def __init__(self, date: ConvertibleDate, time: ConvertibleTime):
+    def __init__(
+        self,
+        date: ConvertibleDate,
+        time: ConvertibleTime,
+        label_cache_size: int = 4096,
+    ):
         self.date = date
         self.time = time
+        self.label_cache = LabelCache(label_cache_size)
         self.initial_interval = [6, DateUnit.MONTH]
-        self.datetime_units = list(DateUnit)
-        self.datetime_units.extend(TimeUnit)  # largest to smallest
+        self._frequency_ladder = None
+        self._interval_ladder = None
+        self._ladder_key = None
+        self.datetime_units = [  # largest to smallest
+            unit
+            for unit in DateUnit
+            if unit != DateUnit.WEEK or self.date.spec.days_in_weeks
+        ]
+        self.datetime_units.extend(TimeUnit)
+        self._update_ladders()  # rebuilt if the calendar or clock changes
 
         # There is a one day gap between the end of the proleptic era and start
         # of the first non-proleptic era. All other eras have at least a one
         # year difference between them
         self.era_start_ordinals = [0]  # proleptic era always ends at 0 ordinal
-        for idx, era_range in enumerate(self.date.calendar.era_ranges):
+        for idx, era_range in enumerate(self.date.spec.era_ranges):
             if idx == 0:  # skip proleptic era
                 continue
 
@@ -64,7 +132,7 @@ class ConvertibleDateTime:
         """
         if unit == DateUnit.YEAR:
             primary_unit = DateUnit.ERA
-        elif unit in (DateUnit.MONTH, DateUnit.DAY):
+        elif unit in (DateUnit.MONTH, DateUnit.WEEK, DateUnit.DAY):
             primary_unit = DateUnit.YEAR
         elif unit in TimeUnit:
             primary_unit = DateUnit.DAY
@@ -90,15 +158,53 @@ class ConvertibleDateTime:
         delta = -delta * factor if reverse else delta * factor
         if unit == DateUnit.DAY:
             return ordinal_decimal + delta
+        elif unit == DateUnit.WEEK:
+            return ordinal_decimal + delta * self.date.spec.days_in_weeks
         interval = [delta, unit]
         return self.shift_od(ordinal_decimal, [interval])
 
+    def extend_instant(
+        self,
+        instant: int,
+        interval: DateTime_interval,
+        factor: int = 1,
+        reverse=False,
+    ) -> int:
+        """
+        :py:meth:`extend_od` for instants
+        :raises ValueError: factor is less than or equal to zero
+        """
+        if factor <= 0:
+            raise ValueError(f"Can't widen span by factor of {factor}")
+
+        delta, unit = interval
+        delta = -delta * factor if reverse else delta * factor
+        seconds_in_day = self.time.clock.seconds_in_day
+        if unit == DateUnit.DAY:
+            return instant + delta * seconds_in_day
+        elif unit == DateUnit.WEEK:
+            days_in_weeks = self.date.spec.days_in_weeks
+            return instant + delta * days_in_weeks * seconds_in_day
+        interval = [delta, unit]
+        return self.shift_instant(instant, [interval])
+
     def shift_od(self, ordinal_decimal: float, intervals: list) -> float:
         """
         :param ordinal_decimal: beginning ordinal decimal
         :param intervals: amount of units to shift by
         :return: an ordinal decimal
         """
+        instant = self.od_to_instant(ordinal_decimal)
+        instant = self.shift_instant(instant, intervals)
+        return self.instant_to_od(instant)
+
+    def shift_instant(self, instant: int, intervals: list) -> int:
+        """
+        :param instant: beginning instant
+        :param intervals: amount of units to shift by
+        :return: an instant
+        :raises ValueError: for an interval that isn't a date or time unit
+        """
         date_intervals = []
         time_intervals = []
         for interval in intervals:
@@ -108,94 +214,343 @@ class ConvertibleDateTime:
             elif unit in TimeUnit:
                 time_intervals.append(interval)
             else:
-                raise ValueError(f"Can't shift ordinal decimal by {unit}")
+                raise ValueError(f"Can't shift instant by {unit}")
 
         if date_intervals:
-            ast_ymd = self.od_to_ast_ymd(ordinal_decimal)
+            ast_ymd = self.instant_to_ast_ymd(instant)
             ast_ymd = self.date.shift_ast_ymd(ast_ymd, date_intervals)
-            ordinal_decimal = self.ast_ymd_to_od(ast_ymd)
+            instant = self.ast_ymd_to_instant(ast_ymd)
         if time_intervals:
-            hms = self.od_to_hms(ordinal_decimal)
+            hms = self.instant_to_hms(instant)
             hms, day_delta = self.time.shift_hms(hms, time_intervals)
-            ordinal_decimal = self.set_hms(ordinal_decimal, hms, day_delta)
-        return ordinal_decimal
+            instant = self.set_instant_hms(instant, hms, day_delta)
+        return instant
 
     def next_od(
         self, ordinal_decimal: float, interval: DateTime_interval, forward=True
     ) -> float:
         """Ordinal decimal variation of next_ast_ymd and next_hms"""
+        instant = self.od_to_instant(ordinal_decimal)
+        instant = self.next_instant(instant, interval, forward)
+        return self.instant_to_od(instant)
+
+    def next_instant(
+        self, instant: int, interval: DateTime_interval, forward=True
+    ) -> int:
+        """Instant variation of next_ast_ymd and next_hms"""
         _, unit = interval
 
         if unit in DateUnit:
-            ast_ymd = self.od_to_ast_ymd(ordinal_decimal)
+            ast_ymd = self.instant_to_ast_ymd(instant)
             ast_ymd = self.date.next_ast_ymd(ast_ymd, interval, forward)
-            return self.ast_ymd_to_od(ast_ymd)
+            return self.ast_ymd_to_instant(ast_ymd)
         elif unit in TimeUnit:
-            hms = self.od_to_hms(ordinal_decimal)
+            hms = self.instant_to_hms(instant)
             hms, day_delta = self.time.next_hms(hms, interval, forward)
-            ordinal_decimal = self.set_hms(ordinal_decimal, hms, day_delta)
-            return ordinal_decimal
-        raise ValueError(f"Can't shift ordinal decimal by {unit}")
+            return self.set_instant_hms(instant, hms, day_delta)
+        raise ValueError(f"Can't shift instant by {unit}")
+
+    def iter_ods(
+        self, start_od: float, end_od: float, interval: DateTime_interval
+    ) -> Iterator[float]:
+        """:py:meth:`iter_instants` as ordinal decimals"""
+        for instant in self.iter_instants(start_od, end_od, interval):
+            yield self.instant_to_od(instant)
+
+    def iter_instants(
+        self, start_od: float, end_od: float, interval: DateTime_interval
+    ) -> Iterator[int]:
+        """
+        Every instant on the interval from the last one before the start to
+        the first one after the end. Years, months, weeks and days are
+        stepped without converting each instant back to a date. Times that
+        evenly divide a day are made at once by :py:meth:`time_instants`
+        """
+        unit = interval[1]
+        seconds_in_day = self.time.clock.seconds_in_day
+        if unit in TimeUnit:
+            seconds_in_freq = self.time.seconds_in_interval(interval)
+            if seconds_in_day % seconds_in_freq == 0:
+                instants = self.time_instants(start_od, end_od, interval)
+                yield from instants.tolist()
+                return
+
+        start_instant = self.od_to_instant(start_od)
+        end_instant = self.od_to_instant(end_od)
+        instant = self.next_instant(start_instant, interval, forward=False)
+        if unit == DateUnit.WEEK:  # every week is as long
+            days_in_interval = interval[0] * self.date.spec.days_in_weeks
+            seconds_in_interval = days_in_interval * seconds_in_day
+            yield instant
+            while instant <= end_instant:
+                instant += seconds_in_interval
+                yield instant
+            return
+        elif unit in (DateUnit.YEAR, DateUnit.MONTH, DateUnit.DAY):
+            ast_ymd = self.instant_to_ast_ymd(instant)
+            for _, ordinal in self.date.gen_ast_ymds(ast_ymd, interval):
+                instant = ordinal * seconds_in_day
+                yield instant
+                if instant > end_instant:
+                    return
+
+        yield instant
+        while instant <= end_instant:
+            instant = self.next_instant(instant, interval)
+            yield instant
+
+    def time_ods(
+        self, start_od: float, end_od: float, interval: DateTime_interval
+    ) -> numpy.ndarray:
+        """:py:meth:`time_instants` as ordinal decimals"""
+        instants = self.time_instants(start_od, end_od, interval)
+        seconds_in_day = self.time.clock.seconds_in_day
+        ordinals, seconds = numpy.divmod(instants, seconds_in_day)
+        return ordinals + seconds / seconds_in_day
+
+    def time_instants(
+        self, start_od: float, end_od: float, interval: DateTime_interval
+    ) -> numpy.ndarray:
+        """
+        :py:meth:`iter_instants` for a time interval, as an int64 array
+        :raises ValueError: if the interval doesn't evenly divide a day
+        """
+        seconds_in_day = self.time.clock.seconds_in_day
+        seconds_in_freq = self.time.seconds_in_interval(interval)
+        if seconds_in_day % seconds_in_freq:
+            raise ValueError(f"{interval} doesn't evenly divide a day")
+
+        start_instant = self.od_to_instant(start_od)
+        end_instant = self.od_to_instant(end_od)
+        first_mark = (start_instant - 1) // seconds_in_freq * seconds_in_freq
+        last_mark = (end_instant // seconds_in_freq + 1) * seconds_in_freq
+        return numpy.arange(first_mark, last_mark + 1, seconds_in_freq)
 
     def get_frequencies(self, unit: DateTimeEnum) -> list:
         """:raises ValueErorr: if unit is not a DateUnit or TimeUnit"""
-        values = None
-        if unit == DateUnit.YEAR:
-            # fmt: off
-            values = [
-                1, 2, 5, 10, 25, 50, 75, 100, 250, 500, 750, 1000, 2500, 5000,
-                7500, 10_000, 25_000, 50_000, 75_000, 100_000,
-            ]
-            # fmt: on
-        elif unit == DateUnit.MONTH:
-            num_common_months = self.date.calendar.months_in_common_year
-            num_leap_months = self.date.calendar.months_in_leap_year
-            least_months_in_year = min(num_common_months, num_leap_months)
-            values = sympy.proper_divisors(least_months_in_year)
-        elif unit == DateUnit.DAY:
-            calendar = self.date.calendar
-            min_common_month_len = min(calendar.days_in_common_year_months)
-            min_leap_month_len = min(calendar.days_in_leap_year_months)
-            min_days_in_month = min(min_leap_month_len, min_common_month_len)
-            multiples_of_five = list(range(0, min_days_in_month + 1, 5))
-            multiples_of_five.remove(0)
-            values = [1, 2]
-            values.extend(multiples_of_five)
-        elif unit == TimeUnit.HOUR:
-            values = sympy.proper_divisors(self.time.clock.hours_in_day)
-        elif unit == TimeUnit.MINUTE:
-            values = sympy.proper_divisors(self.time.clock.minutes_in_hour)
-        elif unit == TimeUnit.SECOND:
-            values = sympy.proper_divisors(self.time.clock.seconds_in_minute)
-
-        if values is None:
+        self._update_ladders()
+        try:
+            return self._frequency_ladder[unit]
+        except KeyError:
             raise ValueError(f"Cannot find valid frequencies for {unit}")
-        return values
+
+    def get_interval_ladder(self) -> tuple[list, list]:
+        """
+        :returns: the approximate days spanned by every interval in
+            :py:attr:`datetime_units` but eras, ascending, and the intervals
+            in the same order. Bisect the spans to find an interval
+        """
+        self._update_ladders()
+        return self._interval_ladder
+
+    def _update_ladders(self):
+        """rebuilds the ladders if the calendar or clock changed"""
+        clock = self.time.clock
+        ladder_key = (
+            self.date.spec,
+            clock.hours_in_day,
+            clock.minutes_in_hour,
+            clock.seconds_in_minute,
+        )
+        if self._ladder_key != ladder_key:
+            self._frequency_ladder = self._make_frequency_ladder()
+            self._interval_ladder = self._make_interval_ladder()
+            self._ladder_key = ladder_key
+
+    def _make_frequency_ladder(self) -> dict:
+        """:returns: valid frequencies of every unit but eras"""
+        spec = self.date.spec
+        clock = self.time.clock
+        common_months, leap_months = spec.days_in_months
+        months_in_years = [spec.months_in_year[False]]
+        days_in_months = list(common_months)
+        if spec.has_leap_year:
+            months_in_years.append(spec.months_in_year[True])
+            days_in_months.extend(leap_months)
+
+        # fmt: off
+        year_frequencies = [
+            1, 2, 5, 10, 25, 50, 75, 100, 250, 500, 750, 1000, 2500, 5000,
+            7500, 10_000, 25_000, 50_000, 75_000, 100_000,
+        ]
+        # fmt: on
+        day_frequencies = [1, 2]
+        day_frequencies.extend(range(5, min(days_in_months) + 1, 5))
+        return {
+            DateUnit.YEAR: year_frequencies,
+            DateUnit.MONTH: proper_divisors(min(months_in_years)),
+            DateUnit.WEEK: [1, 2],
+            DateUnit.DAY: day_frequencies,
+            TimeUnit.HOUR: proper_divisors(clock.hours_in_day),
+            TimeUnit.MINUTE: proper_divisors(clock.minutes_in_hour),
+            TimeUnit.SECOND: proper_divisors(clock.seconds_in_minute),
+        }
+
+    def _make_interval_ladder(self) -> tuple[list, list]:
+        """:returns: see :py:meth:`get_interval_ladder`"""
+        spec = self.date.spec
+        clock = self.time.clock
+        days_in_cycle = spec.cycle_day_offsets[-1]
+        months_in_cycle = spec.cycle_month_offsets[-1]
+        hours_in_day = clock.hours_in_day
+        minutes_in_day = hours_in_day * clock.minutes_in_hour
+        unit_spans = {  # average days in one of each unit
+            DateUnit.YEAR: days_in_cycle / (len(spec.cycle_day_offsets) - 1),
+            DateUnit.WEEK: spec.days_in_weeks,
+            DateUnit.DAY: 1,
+            TimeUnit.HOUR: 1 / hours_in_day,
+            TimeUnit.MINUTE: 1 / minutes_in_day,
+            TimeUnit.SECOND: 1 / (minutes_in_day * clock.seconds_in_minute),
+        }
+        if months_in_cycle:  # monthless calendars have no month intervals
+            unit_spans[DateUnit.MONTH] = days_in_cycle / months_in_cycle
+
+        # sorting is stable, so the larger unit is first for equal spans
+        ladder = sorted(
+            (
+                (frequency * unit_spans[unit], [frequency, unit])
+                for unit in self.datetime_units
+                if unit in unit_spans
+                for frequency in self._frequency_ladder[unit]
+            ),
+            key=lambda span_and_interval: span_and_interval[0],
+        )
+        spans = [span for span, _ in ladder]
+        intervals = [interval for _, interval in ladder]
+        return spans, intervals
 
     def od_to_hr_date(self, ordinal_decimal: float, unit: DateTimeEnum) -> str:
         """:raises ValueError: if unit is not a DateUnit or TimeUnit"""
         if unit in DateUnit:
-            ast_ymd = self.od_to_ast_ymd(ordinal_decimal)
-            return self.date.format_hr_date(ast_ymd)
+            ordinal_or_seconds = math.floor(ordinal_decimal)
         elif unit in TimeUnit:
-            hms = self.od_to_hms(ordinal_decimal)
-            return self.time.hms_to_hr_time(hms)
-        raise ValueError(f"{unit} not a valid date or time unit")
+            instant = self.od_to_instant(ordinal_decimal)
+            ordinal_or_seconds = instant % self.time.clock.seconds_in_day
+        else:
+            raise ValueError(f"{unit} not a valid date or time unit")
+
+        key = self.label_key(ordinal_or_seconds, unit)
+        hr_date = self.label_cache.get(key)
+        if hr_date is None:
+            if unit in DateUnit:
+                ast_ymd = self.od_to_ast_ymd(ordinal_or_seconds)
+                hr_date = self.date.format_hr_date(ast_ymd)
+            else:
+                hms = self.time.seconds_to_hms(ordinal_or_seconds)
+                hr_date = self.time.hms_to_hr_time(hms)
+            self.label_cache.put(key, hr_date)
+        return hr_date
+
+    def ods_to_hr_dates(self, ordinal_decimals, unit: DateTimeEnum) -> list:
+        """
+        :py:meth:`od_to_hr_date` for many ordinal decimals. Times are rounded
+        to instants the same way, then labelled by
+        :py:meth:`instants_to_hr_dates`
+        :raises ValueError: if unit is not a DateUnit or TimeUnit
+        """
+        if unit not in TimeUnit:
+            return [self.od_to_hr_date(od, unit) for od in ordinal_decimals]
+
+        instants = [self.od_to_instant(od) for od in ordinal_decimals]
+        return self.instants_to_hr_dates(instants, unit)
+
+    def instants_to_hr_dates(self, instants, unit: DateTimeEnum) -> list:
+        """
+        labels for many instants. Times missing from the label cache are
+        formatted together
+        :raises ValueError: if unit is not a DateUnit or TimeUnit
+        """
+        seconds_in_day = self.time.clock.seconds_in_day
+        if unit in DateUnit:
+            return [
+                self.od_to_hr_date(instant // seconds_in_day, unit)
+                for instant in instants
+            ]
+        elif unit not in TimeUnit:
+            raise ValueError(f"{unit} not a valid date or time unit")
+
+        seconds = [instant % seconds_in_day for instant in instants]
+        keys = [self.label_key(secs, unit) for secs in seconds]
+        hr_dates = [self.label_cache.get(key) for key in keys]
+        missing = [
+            idx for idx, hr_date in enumerate(hr_dates) if hr_date is None
+        ]
+        if missing:
+            missing_seconds = numpy.array([seconds[idx] for idx in missing])
+            missing_hr_dates = self.time.seconds_to_hr_times(missing_seconds)
+            for idx, hr_date in zip(missing, missing_hr_dates):
+                hr_dates[idx] = hr_date
+                self.label_cache.put(keys[idx], hr_date)
+        return hr_dates
+
+    def label_key(self, ordinal_or_seconds: int, unit: DateTimeEnum) -> tuple:
+        """
+        :param ordinal_or_seconds: ordinal for a DateUnit, seconds into the
+            day for a TimeUnit
+        :returns: label cache key. A calendar change makes a new spec and a
+            clock change a new clock version. Both versions are in the key
+            with the separator, so stale labels are never found and don't
+            keep old specs or clocks alive
+        """
+        if unit in DateUnit:
+            spec_version = self.date.spec.version
+            return spec_version, self.date.date_sep, ordinal_or_seconds, unit
+
+        clock_version = self.time.clock.version
+        return clock_version, self.time.clock_sep, ordinal_or_seconds, unit
 
     def ast_ymd_to_od(self, ast_ymd: Ymd_tuple) -> float:
         ordinal_date = self.date.ast_ymd_to_ordinal_date(ast_ymd)
         return float(self.date.ordinal_date_to_ordinal(ordinal_date))
 
     def od_to_ast_ymd(self, ordinal_decimal: float) -> Ymd_tuple:
-        ordinal = int(ordinal_decimal)
+        ordinal = math.floor(ordinal_decimal)
         ordinal_date = self.date.ordinal_to_ordinal_date(ordinal)
         return self.date.ordinal_date_to_ast_ymd(ordinal_date)
 
     def od_to_hms(self, ordinal_decimal: float) -> Hms_tuple:
-        day_decimal = ordinal_decimal - int(ordinal_decimal)
-        seconds = round(self.time.clock.seconds_in_day * day_decimal)
+        return self.instant_to_hms(self.od_to_instant(ordinal_decimal))
+
+    def od_to_instant(self, ordinal_decimal: float) -> int:
+        """:returns: the instant, rounded to the nearest second"""
+        ordinal = math.floor(ordinal_decimal)
+        day_decimal = ordinal_decimal - ordinal
+        seconds_in_day = self.time.clock.seconds_in_day
+        return ordinal * seconds_in_day + round(seconds_in_day * day_decimal)
+
+    def instant_to_od(self, instant: int) -> float:
+        ordinal, seconds = divmod(instant, self.time.clock.seconds_in_day)
+        return ordinal + seconds / self.time.clock.seconds_in_day
+
+    def ast_ymd_to_instant(self, ast_ymd: Ymd_tuple) -> int:
+        """:returns: the instant at the start of the day"""
+        ordinal_date = self.date.ast_ymd_to_ordinal_date(ast_ymd)
+        ordinal = self.date.ordinal_date_to_ordinal(ordinal_date)
+        return ordinal * self.time.clock.seconds_in_day
+
+    def instant_to_ast_ymd(self, instant: int) -> Ymd_tuple:
+        ordinal = instant // self.time.clock.seconds_in_day
+        ordinal_date = self.date.ordinal_to_ordinal_date(ordinal)
+        return self.date.ordinal_date_to_ast_ymd(ordinal_date)
+
+    def instant_to_hms(self, instant: int) -> Hms_tuple:
+        seconds = instant % self.time.clock.seconds_in_day
         return self.time.seconds_to_hms(seconds)
 
+    def set_instant_hms(
+        self, instant: int, hms: Hms_tuple, day_delta: int = 0
+    ) -> int:
+        """
+        :param instant: starting instant
+        :param hms: hour, minute, second
+        :param day_delta: optional amount of days between starting and final
+            instant
+        :return: instant set to the hms and shifted by day_delta
+        """
+        seconds_in_day = self.time.clock.seconds_in_day
+        ordinal = instant // seconds_in_day + day_delta
+        return ordinal * seconds_in_day + self.time.hms_to_seconds(hms)
+
     def set_hms(
         self, ordinal_decimal: float, hms: Hms_tuple, day_delta: int = 0
     ) -> float:
@@ -206,7 +561,7 @@ class ConvertibleDateTime:
         :return: ordinal decimal set to the hms and shifted by day_delta
         """
         day_decimal = self.hms_to_day_decimal(hms)
-        return int(ordinal_decimal) + day_delta + day_decimal
+        return math.floor(ordinal_decimal) + day_delta + day_decimal
 
     def hms_to_day_decimal(self, hms: Hms_tuple) -> float:
         seconds = self.time.hms_to_seconds(hms)
@@ -15,6 +15,8 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+import numpy
+
 from collections import deque
 from enum import Enum, unique
 from src.db import ConvertibleClock
@@ -138,12 +140,33 @@ class ConvertibleTime:
         if not self.is_valid_hms(hms):
             raise ValueError(f"{hms} is an invalid hms for {self.clock}")
 
+        sign = 1 if forward else -1
+        seconds_in_freq = self.seconds_in_interval(interval)
+        seconds = self.hms_to_seconds(hms)
+        prev_freq = int(seconds / seconds_in_freq) * seconds_in_freq
+
+        if seconds % seconds_in_freq == 0:
+            seconds += seconds_in_freq * sign
+        else:
+            seconds = prev_freq if sign == -1 else prev_freq + seconds_in_freq
+
+        day_delta, seconds = divmod(seconds, self.clock.seconds_in_day)
+        assert abs(day_delta) <= 1, "day shouldn't be shifted twice"
+
+        hms = self.seconds_to_hms(seconds)
+        return hms, day_delta
+
+    def seconds_in_interval(self, interval: Time_interval) -> int:
+        """
+        :returns: seconds between marks of the interval
+        :raises ValueError: if the frequency is not a positive integer or
+            does not fit in the next larger unit; for an invalid unit
+        """
         frequency, timeunit = interval
         if not 0 < frequency == int(frequency):
             msg = f"Frequency: {frequency} is not an integer greater than zero"
             raise ValueError(msg)
 
-        sign = 1 if forward else -1
         if timeunit == TimeUnit.HOUR:
             max_frequency = self.clock.hours_in_day - 1
             seconds_in_unit = self.clock.seconds_in_hour
@@ -159,21 +182,7 @@ class ConvertibleTime:
         if frequency > max_frequency:
             msg = f"There are less than {frequency} {timeunit} in {self.clock}"
             raise ValueError(msg)
-
-        seconds_in_freq = frequency * seconds_in_unit
-        seconds = self.hms_to_seconds(hms)
-        prev_freq = int(seconds / seconds_in_freq) * seconds_in_freq
-
-        if seconds % seconds_in_freq == 0:
-            seconds += seconds_in_freq * sign
-        else:
-            seconds = prev_freq if sign == -1 else prev_freq + seconds_in_freq
-
-        day_delta, seconds = divmod(seconds, self.clock.seconds_in_day)
-        assert abs(day_delta) <= 1, "day shouldn't be shifted twice"
-
-        hms = self.seconds_to_hms(seconds)
-        return hms, day_delta
+        return frequency * seconds_in_unit
 
     def hour(self, seconds: int) -> int:
         """hour of the day"""
@@ -221,6 +230,24 @@ class ConvertibleTime:
             )
         return clock_sep.join([hour_str, minute_str, second_str])
 
+    def seconds_to_hr_times(self, seconds: numpy.ndarray) -> list[str]:
+        """vectorized :py:meth:`hms_to_hr_time` without hour labels"""
+        hour_digits = len(str(self.clock.hours_in_day))
+        minute_digits = len(str(self.clock.minutes_in_hour))
+        second_digits = len(str(self.clock.seconds_in_minute))
+
+        seconds = numpy.asarray(seconds) % self.clock.seconds_in_day
+        hours, seconds = numpy.divmod(seconds, self.clock.seconds_in_hour)
+        minutes, seconds = numpy.divmod(seconds, self.clock.seconds_in_minute)
+        sep = self.clock_sep
+        return [
+            f"{hour:0{hour_digits}}{sep}{minute:0{minute_digits}}"
+            f"{sep}{second:0{second_digits}}"
+            for hour, minute, second in zip(
+                hours.tolist(), minutes.tolist(), seconds.tolist()
+            )
+        ]
+
     def hr_time_to_hms(self, hr_time: str) -> Hms_tuple:
         hour_label = None
         try:
@@ -0,0 +1,350 @@
+"""Human-readable dates from compiled, strftime-style templates"""
+#  Copyright (c) 2021 author(s) of JulianBC.
+#
+#  This file is part of JulianBC.
+#
+#  JulianBC is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  JulianBC is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+import numpy
+import re
+
+from src.customdate import ConvertibleDate, Ymd_tuple
+
+
+class DateFormat:
+    """
+    A template for formatting and parsing dates of one ConvertibleDate.
+    The template is compiled once, names are read from the calendar's spec.
+
+    * `%Y` human-readable year
+    * `%m` month
+    * `%B` month name
+    * `%d` day of the month, or of the year for monthless calendars
+    * `%j` day of the year
+    * `%A` weekday name
+    * `%E` era name
+    * `%%` a literal "%"
+
+    Parsing needs `%Y`, `%E` and either `%j` or `%d` with `%m` or `%B`.
+    Monthless calendars only need `%d`
+    """
+
+    tokens = "YmBdjAE"
+    _token_pattern = re.compile("%(.)", re.DOTALL)
+
+    def __init__(self, date: ConvertibleDate, template: str):
+        """:raises ValueError: for an unknown or repeated token"""
+        self.date = date
+        self.template = template
+
+        self.fields = []
+        """tokens in the order they appear"""
+        literals = []  # between, before and after the tokens
+        literal = ""
+        previous_end = 0
+        for match in self._token_pattern.finditer(template):
+            token_start, token_end = match.span()
+            literal += template[previous_end:token_start]
+            previous_end = token_end
+            token = match.group(1)
+            if token == "%":
+                literal += "%"
+                continue
+            elif token not in self.tokens:
+                raise ValueError(f"%{token} is not a date format token")
+            elif token in self.fields:
+                raise ValueError(f"%{token} is repeated in {template}")
+
+            self.fields.append(token)
+            literals.append(literal)
+            literal = ""
+        literals.append(literal + template[previous_end:])
+
+        format_string = []
+        pattern = []
+        for idx, literal in enumerate(literals):
+            format_string.append(literal.replace("{", "{{").replace("}", "}}"))
+            pattern.append(re.escape(literal))
+            if idx < len(self.fields):
+                format_string.append("{}")
+                pattern.append(self.fields[idx])
+        self._format_string = "".join(format_string)
+        self._pattern_parts = pattern
+        self._parsers = None
+        self._parser_spec = None
+
+    def format(self, ast_ymd: Ymd_tuple) -> str:
+        """
+        :raises ValueError: for an invalid date, missing months or weekdays
+        """
+        cd = self.date
+        spec = cd.spec
+        ast_year, month, day = ast_ymd
+        if not cd.is_valid_ast_ymd(ast_ymd):
+            raise ValueError(f"{ast_ymd} is an invalid date for {cd.calendar}")
+
+        if month is None and ("m" in self.fields or "B" in self.fields):
+            raise ValueError(f"{cd.calendar} has no months to format")
+
+        hr_year = era_idx = day_of_year = None
+        values = []
+        for field in self.fields:
+            if field in "YE" and era_idx is None:
+                hr_year, era_idx = cd.ast_to_hr(ast_year)
+            elif field in "jA" and day_of_year is None:
+                day_of_year = cd.ast_ymd_to_ordinal_date(ast_ymd)[1]
+
+            if field == "Y":
+                values.append(hr_year)
+            elif field == "m":
+                values.append(month)
+            elif field == "B":
+                is_leap = cd.is_leap_year(ast_year)
+                values.append(spec.month_names[is_leap][month - 1])
+            elif field == "d":
+                values.append(day)
+            elif field == "j":
+                values.append(day_of_year)
+            elif field == "A":
+                ordinal = cd.ordinal_date_to_ordinal((ast_year, day_of_year))
+                values.append(self._weekday_names()[cd.day_of_week(ordinal)])
+            else:
+                values.append(spec.eras[era_idx])
+        return self._format_string.format(*values)
+
+    def format_many(self, ast_ymds) -> list[str]:
+        """
+        :py:meth:`format` for many dates. Each field is found for every date
+        at once.
+
+        :param ast_ymds: iterable of ast_ymds, or an int array shaped (n, 3)
+        :raises ValueError: for an invalid date, missing months or weekdays
+        """
+        cd = self.date
+        spec = cd.spec
+        ast_years, months, days = cd._unzip_ast_ymds(ast_ymds)
+        if months is None and ("m" in self.fields or "B" in self.fields):
+            raise ValueError(f"{cd.calendar} has no months to format")
+
+        ast_years = numpy.asarray(ast_years, dtype=numpy.int64)
+        ordinals = cd.ast_ymd_to_ordinals(ast_years, months, days)
+
+        hr_years = era_idxs = None
+        if "Y" in self.fields or "E" in self.fields:
+            hr_years, era_idxs = cd.ast_to_hr_many(ast_years)
+
+        columns = []
+        for field in self.fields:
+            if field == "Y":
+                columns.append(hr_years.tolist())
+            elif field == "m":
+                columns.append(numpy.asarray(months).tolist())
+            elif field == "B":
+                is_leap = cd.is_leap_year_many(ast_years).tolist()
+                month_names = spec.month_names
+                columns.append(
+                    [
+                        month_names[leap][month - 1]
+                        for leap, month in zip(
+                            is_leap, numpy.asarray(months).tolist()
+                        )
+                    ]
+                )
+            elif field == "d":
+                columns.append(numpy.asarray(days).tolist())
+            elif field == "j":
+                days_before_years = cd._days_before_years(ast_years)
+                columns.append((ordinals - days_before_years).tolist())
+            elif field == "A":
+                weekday_names = self._weekday_names()
+                weekdays = (ordinals + spec.epoch_weekday - 1) % len(
+                    weekday_names
+                )
+                columns.append(
+                    [weekday_names[idx] for idx in weekdays.tolist()]
+                )
+            else:
+                eras = spec.eras
+                columns.append([eras[idx] for idx in era_idxs.tolist()])
+
+        format_string = self._format_string
+        if not columns:
+            return [format_string.format()] * ordinals.size
+        return [format_string.format(*row) for row in zip(*columns)]
+
+    def parse(self, hr_date: str) -> Ymd_tuple:
+        """
+        inverse operation of :py:meth:`format`
+
+        :raises ValueError: if hr_date doesn't match the template, the
+            template can't be parsed or the date is invalid
+        """
+        match = self._compiled_parser().fullmatch(hr_date)
+        if match is None:
+            raise ValueError(f"{hr_date} doesn't match {self.template}")
+        return self._match_to_ast_ymd(match)
+
+    def parse_many(self, hr_dates) -> list[Ymd_tuple]:
+        """
+        :py:meth:`parse` for an iterable of human-readable dates. Each field
+        is converted for every date at once
+
+        :raises ValueError: if any hr_date can't be parsed
+        """
+        cd = self.date
+        spec = cd.spec
+        hr_dates = list(hr_dates)
+        if not hr_dates:
+            return []
+
+        # one search over every line is much faster than matching each date
+        lines = "\n".join(hr_dates)
+        rows = []
+        if lines.count("\n") == len(hr_dates) - 1:
+            rows = self._compiled_parser(multiline=True).findall(lines)
+        if len(rows) != len(hr_dates):
+            fullmatch = self._compiled_parser().fullmatch
+            for hr_date in hr_dates:
+                if fullmatch(hr_date) is None:
+                    msg = f"{hr_date} doesn't match {self.template}"
+                    raise ValueError(msg)
+            rows = [fullmatch(hr_date).groups() for hr_date in hr_dates]
+        columns = dict(zip(self.fields, zip(*rows)))
+
+        era_indices = {era: idx for idx, era in enumerate(spec.eras)}
+        era_idxs = [era_indices[era] for era in columns["E"]]
+        hr_years = numpy.fromiter(map(int, columns["Y"]), numpy.int64)
+        ast_years = cd.hr_to_ast_many(hr_years, era_idxs)
+
+        if "j" in columns:
+            days_of_year = numpy.fromiter(map(int, columns["j"]), numpy.int64)
+            is_leap = cd.is_leap_year_many(ast_years).astype(numpy.intp)
+            days_in_years = spec.month_offset_table[is_leap, -1]
+            is_valid = (1 <= days_of_year) & (days_of_year <= days_in_years)
+            if not is_valid.all():
+                bad_hr_date = hr_dates[numpy.argmin(is_valid)]
+                raise ValueError(f"{bad_hr_date} is an invalid date")
+            ordinals = cd._days_before_years(ast_years) + days_of_year
+            ast_years, months, days = cd.ordinals_to_ast_ymd(ordinals)
+        else:
+            months = None
+            if "m" in columns:
+                months = numpy.fromiter(map(int, columns["m"]), numpy.int64)
+            elif "B" in columns:
+                month_indices = [
+                    {name: idx + 1 for idx, name in enumerate(names)}
+                    for names in spec.month_names
+                ]
+                is_leap = cd.is_leap_year_many(ast_years).tolist()
+                try:
+                    months = [
+                        month_indices[leap][name]
+                        for leap, name in zip(is_leap, columns["B"])
+                    ]
+                except KeyError as error:
+                    raise ValueError(f"{error} is an invalid month name")
+            days = numpy.fromiter(map(int, columns["d"]), numpy.int64)
+            cd.ast_ymd_to_ordinals(ast_years, months, days)  # validates
+
+        ast_years = ast_years.tolist()
+        days = numpy.asarray(days).tolist()
+        if months is None:
+            return [(year, None, day) for year, day in zip(ast_years, days)]
+        months = numpy.asarray(months).tolist()
+        return list(zip(ast_years, months, days))
+
+    def _match_to_ast_ymd(self, match: re.Match) -> Ymd_tuple:
+        cd = self.date
+        spec = cd.spec
+        fields = match.groupdict()
+        era_idx = spec.eras.index(fields["E"])
+        ast_year = cd.hr_to_ast(int(fields["Y"]), era_idx)
+
+        if fields.get("j"):
+            ordinal_date = ast_year, int(fields["j"])
+            if not cd.is_valid_ordinal_date(ordinal_date):
+                raise ValueError(f"{match.string} is an invalid date")
+            return cd.ordinal_date_to_ast_ymd(ordinal_date)
+
+        month = None
+        if fields.get("m"):
+            month = int(fields["m"])
+        elif fields.get("B"):
+            month_names = spec.month_names[cd.is_leap_year(ast_year)]
+            try:
+                month = month_names.index(fields["B"]) + 1
+            except ValueError:
+                raise ValueError(f"{match.string} is an invalid date")
+
+        ast_ymd = ast_year, month, int(fields["d"])
+        if not cd.is_valid_ast_ymd(ast_ymd):
+            raise ValueError(f"{match.string} is an invalid date")
+        return ast_ymd
+
+    def _compiled_parser(self, multiline=False) -> re.Pattern:
+        """
+        compiles the template into a regular expression, again if the
+        calendar changed
+
+        :param multiline: match whole lines of many dates instead
+
+        :raises ValueError: if the template doesn't have the fields to parse
+        """
+        spec = self.date.spec
+        if self._parser_spec is spec:
+            return self._parsers[multiline]
+
+        fields = self.fields
+        has_day = "j" in fields or (
+            "d" in fields
+            and (
+                "m" in fields or "B" in fields or not any(spec.months_in_year)
+            )
+        )
+        if "Y" not in fields or "E" not in fields or not has_day:
+            raise ValueError(f"Can't parse dates with {self.template}")
+
+        def names(*name_lists) -> str:
+            # longest first, so a name isn't matched by its prefix
+            unique_names = {
+                name for name_list in name_lists for name in name_list
+            }
+            ordered_names = sorted(unique_names, key=len, reverse=True)
+            return "|".join(re.escape(name) for name in ordered_names)
+
+        sub_patterns = {
+            "Y": r"\d+",
+            "m": r"\d+",
+            "d": r"\d+",
+            "j": r"\d+",
+            "B": names(*spec.month_names),
+            "A": names(spec.weekday_names),
+            "E": names(spec.eras),
+        }
+        pattern = "".join(
+            f"(?P<{part}>{sub_patterns[part]})" if idx % 2 else part
+            for idx, part in enumerate(self._pattern_parts)
+        )
+        self._parsers = (
+            re.compile(pattern),
+            re.compile(f"^{pattern}$", re.MULTILINE),
+        )
+        self._parser_spec = spec
+        return self._parsers[multiline]
+
+    def _weekday_names(self) -> tuple:
+        """:raises ValueError: if the calendar has no weeks"""
+        weekday_names = self.date.spec.weekday_names
+        if not weekday_names:
+            raise ValueError(f"{self.date.calendar} has no weekdays")
+        return weekday_names
@@ -1,3 +1,6 @@
 # flake8: noqa E401
+from .eon.calendarspec import CalendarSpec
+from .eon.conversionindex import ConversionIndex
 from .eon.customcalendar import CalendarConversion, ConvertibleCalendar
 from .eon.customclock import ConvertibleClock
+from .eon.event import Event, EventRollup
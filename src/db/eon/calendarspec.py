@@ -0,0 +1,323 @@
+"""Constants and lookup tables derived from a calendar's columns"""
+#  Copyright (c) 2021 author(s) of JulianBC.
+#
+#  This file is part of JulianBC.
+#
+#  JulianBC is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  JulianBC is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+import itertools
+import numpy
+
+from collections import deque
+
+_versions = itertools.count(1)
+
+
+class CalendarSpec:
+    """
+    Immutable snapshot of a :py:class:`ConvertibleCalendar`.
+
+    Holds plain Python copies of every constant and lookup table date
+    calculations need, so they never touch instrumented attributes.
+    Compiled by :py:attr:`ConvertibleCalendar.spec`, which drops it
+    whenever the calendar changes.
+
+    Tables indexed by a leap year flag use False for common years and True
+    for leap years.
+    """
+
+    calendar_columns = (  # every column the spec is compiled from
+        "has_leap_year",
+        "common_year_month_names",
+        "days_in_common_year_months",
+        "leap_year_month_names",
+        "days_in_leap_year_months",
+        "leap_year_cycles",
+        "leap_year_cycle_start",
+        "leap_year_cycle_ordinals",
+        "leap_year_offset",
+        "special_common_years",
+        "special_leap_years",
+        "eras",
+        "era_ranges",
+        "weekday_names",
+        "epoch_weekday",
+        "weekday_start",
+        "weekends",
+    )
+
+    __slots__ = (
+        "version",
+        "has_leap_year",
+        "days_in_common_year",
+        "days_in_leap_year",
+        "all_cycle_ordinals",
+        "common_year_cycle_ordinals",
+        "leap_year_cycle_length",
+        "leap_year_bitmap",
+        "leap_year_mask",
+        "forward_elapsed_leap_years",
+        "backward_elapsed_leap_years",
+        "cycle_day_offsets",
+        "cycle_day_offset_array",
+        "cycle_month_offsets",
+        "months_in_year",
+        "month_names",
+        "days_in_months",
+        "month_offsets",
+        "month_offset_table",
+        "special_leap_years",
+        "special_common_years",
+        "special_years",
+        "net_special_leaps",
+        "special_year_array",
+        "net_special_leap_array",
+        "eras",
+        "era_ranges",
+        "era_bounds",
+        "era_start_ast_years",
+        "weekday_names",
+        "days_in_weeks",
+        "epoch_weekday",
+        "weekday_start",
+        "weekends",
+        "weekend_table",
+    )
+
+    def __init__(self, calendar):
+        """:param calendar: a ConvertibleCalendar, flushed or not"""
+        _set = super().__setattr__
+        _set("version", next(_versions))  # unique to this spec
+        has_leap_year = bool(calendar.has_leap_year)
+        _set("has_leap_year", has_leap_year)
+
+        #
+        # Months and years
+        #
+        common_months = tuple(calendar.days_in_common_year_months)
+        leap_months = tuple(calendar.days_in_leap_year_months or ())
+        _set("days_in_months", (common_months, leap_months))
+        _set(
+            "month_names",
+            (
+                tuple(calendar.common_year_month_names),
+                tuple(calendar.leap_year_month_names or ()),
+            ),
+        )
+        _set(
+            "months_in_year",
+            (
+                len(calendar.common_year_month_names),
+                len(calendar.leap_year_month_names or ()),
+            ),
+        )
+        # day of the year before each month starts, the last entry is the
+        # length of the year
+        _set(
+            "month_offsets",
+            (
+                tuple(itertools.accumulate(common_months, initial=0)),
+                tuple(itertools.accumulate(leap_months, initial=0)),
+            ),
+        )
+        # month offsets as rows of one array, padded with the length of the
+        # year so both rows are as long as the longest year
+        padded_length = max(len(common_months), len(leap_months)) + 1
+        month_offset_table = numpy.array(
+            [
+                offsets + offsets[-1:] * (padded_length - len(offsets))
+                for offsets in self.month_offsets
+            ],
+            dtype=numpy.int64,
+        )
+        month_offset_table.setflags(write=False)
+        _set("month_offset_table", month_offset_table)
+        days_in_common_year = sum(common_months)
+        days_in_leap_year = sum(leap_months) if has_leap_year else 0
+        _set("days_in_common_year", days_in_common_year)
+        _set("days_in_leap_year", days_in_leap_year)
+
+        #
+        # Leap year cycles
+        #
+        all_cycle_ordinals = deque()
+        if has_leap_year:
+            start = calendar.leap_year_cycle_start
+            all_cycle_ordinals.extend(
+                itertools.chain.from_iterable(
+                    [  # common and leap year cycle ordinals
+                        range(start, cycle + start)
+                        for cycle in calendar.leap_year_cycles
+                    ]
+                )
+            )
+            all_cycle_ordinals.rotate(calendar.leap_year_offset)
+        leap_ordinals = set(calendar.leap_year_cycle_ordinals or ())
+        _set("all_cycle_ordinals", tuple(all_cycle_ordinals))
+        _set(
+            "common_year_cycle_ordinals",
+            tuple(
+                _ord
+                for _ord in all_cycle_ordinals
+                if _ord not in leap_ordinals
+            ),
+        )
+        _set("leap_year_cycle_length", len(all_cycle_ordinals))
+
+        # one byte per index of the leap year cycle, truthy for leap years
+        is_leap_cycle_year = [
+            _ord in leap_ordinals for _ord in all_cycle_ordinals
+        ]
+        leap_year_bitmap = bytes(is_leap_cycle_year)
+        _set("leap_year_bitmap", leap_year_bitmap)
+        _set("leap_year_mask", numpy.frombuffer(leap_year_bitmap, dtype=bool))
+
+        # normal leap years elapsed before each index of the leap year cycle,
+        # counting forwards from the epoch or backwards through proleptic
+        # years
+        _set(
+            "forward_elapsed_leap_years",
+            tuple(itertools.accumulate(is_leap_cycle_year, initial=0)),
+        )
+        _set(
+            "backward_elapsed_leap_years",
+            tuple(
+                itertools.accumulate(reversed(is_leap_cycle_year), initial=0)
+            ),
+        )
+
+        # days elapsed before each index of the leap year cycle.
+        # A leapless calendar is a one year cycle of common years
+        days_in_cycle_years = [days_in_common_year]
+        if has_leap_year:
+            days_in_cycle_years = [
+                days_in_leap_year if is_leap else days_in_common_year
+                for is_leap in is_leap_cycle_year
+            ]
+        cycle_day_offsets = tuple(
+            itertools.accumulate(days_in_cycle_years, initial=0)
+        )
+        _set("cycle_day_offsets", cycle_day_offsets)
+        _set("cycle_day_offset_array", self._frozen_array(cycle_day_offsets))
+
+        # months elapsed before each index of the leap year cycle
+        months_in_cycle_years = [self.months_in_year[False]]
+        if has_leap_year:
+            months_in_cycle_years = [
+                self.months_in_year[is_leap] for is_leap in is_leap_cycle_year
+            ]
+        _set(
+            "cycle_month_offsets",
+            tuple(itertools.accumulate(months_in_cycle_years, initial=0)),
+        )
+
+        #
+        # Special years
+        #
+        special_leap_years = frozenset(calendar.special_leap_years or ())
+        special_common_years = frozenset(calendar.special_common_years or ())
+        _set("special_leap_years", special_leap_years)
+        _set("special_common_years", special_common_years)
+
+        # special years that change a year's normal leap status, sorted, with
+        # a prefix of their net effect: +1 for each common year made leap and
+        # -1 for each leap year made common
+        special_year_effects = sorted(
+            [
+                (special_leap, 1)
+                for special_leap in special_leap_years
+                if not self.is_normal_leap_year(special_leap)
+            ]
+            + [
+                (special_common, -1)
+                for special_common in special_common_years
+                if self.is_normal_leap_year(special_common)
+            ]
+        )
+        special_years = tuple(year for year, _ in special_year_effects)
+        net_special_leaps = tuple(
+            itertools.accumulate(
+                (effect for _, effect in special_year_effects), initial=0
+            )
+        )
+        _set("special_years", special_years)
+        _set("net_special_leaps", net_special_leaps)
+        _set("special_year_array", self._frozen_array(special_years))
+        _set("net_special_leap_array", self._frozen_array(net_special_leaps))
+
+        #
+        # Eras
+        #
+        _set("eras", tuple(calendar.eras))
+        _set("era_ranges", tuple(tuple(r) for r in calendar.era_ranges))
+        # ast start year, ast end year, hr start year, hr end year and the
+        # direction hr years count in, for every era
+        era_bounds = []
+        years_before_era = 0  # the proleptic era is never counted
+        for era_idx, era_range in enumerate(calendar.era_ranges):
+            start_hr_year = float(era_range[0])
+            end_hr_year = float(era_range[1])
+            years_in_era = abs(end_hr_year - start_hr_year) + 1
+            direction = 1 if end_hr_year > start_hr_year else -1
+
+            ast_range = years_before_era + 1, years_before_era + years_in_era
+            if start_hr_year == float("-inf"):
+                ast_range = float("-inf"), 0
+            era_bounds.append(
+                (*ast_range, start_hr_year, end_hr_year, direction)
+            )
+            if era_idx:
+                years_before_era += years_in_era
+        _set("era_bounds", tuple(era_bounds))
+        _set(  # excludes the proleptic era, for bisecting
+            "era_start_ast_years",
+            tuple(bounds[0] for bounds in era_bounds[1:]),
+        )
+
+        #
+        # Weeks
+        #
+        _set("weekday_names", tuple(calendar.weekday_names or ()))
+        _set("days_in_weeks", len(self.weekday_names))
+        _set("epoch_weekday", calendar.epoch_weekday)
+        _set("weekday_start", calendar.weekday_start)
+        weekends = tuple(sorted(set(calendar.weekends or ())))
+        _set("weekends", weekends)
+        # truthy at the index of each weekend day, for masking weekdays
+        weekend_table = numpy.zeros(self.days_in_weeks, dtype=bool)
+        weekend_table[list(weekends)] = True
+        weekend_table.setflags(write=False)
+        _set("weekend_table", weekend_table)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Denied. Change calendar instead.")
+
+    def __delattr__(self, key):
+        raise AttributeError("Denied. Change calendar instead.")
+
+    @staticmethod
+    def _frozen_array(values: tuple) -> numpy.ndarray:
+        """:returns: read-only int64 copy of values"""
+        array = numpy.array(values, dtype=numpy.int64)
+        array.setflags(write=False)
+        return array
+
+    def is_normal_leap_year(self, ast_year: int) -> bool:
+        """:returns: leap year status ignoring special years"""
+        if not self.has_leap_year:
+            return False
+
+        # floored modulo walks proleptic years backwards through the cycle
+        leap_year_bitmap = self.leap_year_bitmap
+        cycle_index = (int(ast_year) - 1) % len(leap_year_bitmap)
+        return bool(leap_year_bitmap[cycle_index])
@@ -0,0 +1,144 @@
+"""Sync offsets between every pair of calendars that can be converted"""
+#  Copyright (c) 2021 author(s) of JulianBC.
+#
+#  This file is part of JulianBC.
+#
+#  JulianBC is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  JulianBC is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+from collections import deque
+from typing import Union
+
+
+class ConversionIndex:
+    """
+    Calendars linked by conversions, directly or through other calendars,
+    and the potential of each: its ordinal for one shared reference day.
+    The sync offset between any two of them is the difference of their
+    potentials.
+
+    Every indexed calendar keeps a reference to its index, so it's dropped
+    from all of them at once when a conversion changes
+    """
+
+    def __init__(self):
+        self.potentials = dict()
+        self.is_consistent = True
+        """False if two chains of conversions disagree about an offset"""
+
+    @classmethod
+    def index(cls, calendar) -> "ConversionIndex":
+        """
+        indexes every calendar reachable from the given one through its
+        conversions, including ones that haven't been flushed yet
+        """
+        index = cls()
+        index.potentials[calendar] = 0
+        calendar._conversion_index = index
+        unvisited = deque([calendar])
+        while unvisited:
+            for conversion in unvisited.popleft().conversions():
+                other_calendar = index._add(conversion)
+                if other_calendar is not None:
+                    other_calendar._conversion_index = index
+                    unvisited.append(other_calendar)
+        return index
+
+    @staticmethod
+    def connect(conversion):
+        """
+        Merges the indexes of a conversion's calendars. The calendars are
+        indexed again when next used if either wasn't indexed
+        """
+        source_calendar = conversion.source_calendar
+        target_calendar = conversion.target_calendar
+        source_index = source_calendar._conversion_index
+        target_index = target_calendar._conversion_index
+        if source_index is None or target_index is None:
+            ConversionIndex.drop(source_calendar)
+            ConversionIndex.drop(target_calendar)
+        elif source_index is target_index:
+            source_index._add(conversion)
+        elif len(source_index.potentials) >= len(target_index.potentials):
+            source_index._merge(target_index, conversion)
+        else:
+            target_index._merge(source_index, conversion)
+
+    @staticmethod
+    def drop(calendar):
+        """forgets the index, if any, of the calendar and every one in it"""
+        if calendar is None or calendar._conversion_index is None:
+            return
+        index = calendar._conversion_index
+        for indexed_calendar in index.potentials:
+            if indexed_calendar._conversion_index is index:
+                indexed_calendar._conversion_index = None
+
+    def sync_offset(self, calendar, other_calendar) -> Union[int, None]:
+        """
+        :returns: days to add to an ordinal of the other calendar to make
+            the same day's ordinal in the calendar, None if the calendars
+            aren't both in this index
+        """
+        potentials = self.potentials
+        if calendar not in potentials or other_calendar not in potentials:
+            return None
+        return potentials[calendar] - potentials[other_calendar]
+
+    def _add(self, conversion):
+        """
+        :returns: the conversion's calendar that wasn't indexed yet, if any
+        """
+        potentials = self.potentials
+        source_calendar = conversion.source_calendar
+        target_calendar = conversion.target_calendar
+        offset = (
+            conversion.target_sync_ordinal - conversion.source_sync_ordinal
+        )
+        if target_calendar not in potentials:
+            potentials[target_calendar] = potentials[source_calendar] + offset
+            return target_calendar
+        elif source_calendar not in potentials:
+            potentials[source_calendar] = potentials[target_calendar] - offset
+            return source_calendar
+        elif (
+            potentials[target_calendar] - potentials[source_calendar] != offset
+        ):
+            self.is_consistent = False
+        return None
+
+    def _merge(self, other: "ConversionIndex", conversion):
+        """moves the calendars of the other index, linked by conversion"""
+        potentials = self.potentials
+        source_calendar = conversion.source_calendar
+        target_calendar = conversion.target_calendar
+        offset = (
+            conversion.target_sync_ordinal - conversion.source_sync_ordinal
+        )
+        if source_calendar in potentials:
+            shift = (
+                potentials[source_calendar]
+                + offset
+                - other.potentials[target_calendar]
+            )
+        else:
+            shift = (
+                potentials[target_calendar]
+                - offset
+                - other.potentials[source_calendar]
+            )
+
+        for calendar, potential in other.potentials.items():
+            if calendar._conversion_index is other:
+                potentials[calendar] = potential + shift
+                calendar._conversion_index = self
+        self.is_consistent = self.is_consistent and other.is_consistent
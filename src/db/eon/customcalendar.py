@@ -18,6 +18,8 @@
 import itertools
 
 from src.db import utils
+from src.db.eon.calendarspec import CalendarSpec
+from src.db.eon.conversionindex import ConversionIndex
 from sqlalchemy import (
     BigInteger,
     Boolean,
@@ -32,6 +34,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import column_property, relationship, Session, validates
+from sqlalchemy.orm.attributes import NEVER_SET, NO_VALUE
 from typing import Union
 
 
@@ -369,21 +372,44 @@ class ConvertibleCalendar(utils.Base):
         back_populates="target_calendar",
     )
 
+    _spec = None  # compiled on first use of spec
+    _conversion_index = None  # built on first use of conversion_index
+
     def __repr__(self):
         return f"{self.name}(Epoch: {self.jd_epoch})"
 
+    @property
+    def spec(self) -> CalendarSpec:
+        """Constants and lookup tables for date calculations"""
+        if self._spec is None:
+            self._spec = CalendarSpec(self)
+        return self._spec
+
+    @staticmethod
+    def invalidate_spec(target: "ConvertibleCalendar", *_):
+        """Designed to be an event listener, drops a possibly stale spec"""
+        target._spec = None
+
+    @property
+    def conversion_index(self) -> ConversionIndex:
+        """
+        Offsets to every calendar this one can be converted to, even through
+        other calendars
+        """
+        if self._conversion_index is None:
+            ConversionIndex.index(self)
+        return self._conversion_index
+
     def calendars(self) -> list:
-        """All the calendars this one can be converted to and from"""
-        target_calendars = [
-            conversion.target_calendar
-            for conversion in self._target_conversions
-        ]
-        source_calendars = [
-            conversion.source_calendar
-            for conversion in self._source_conversions
+        """
+        All the calendars this one can be converted to and from, even
+        through other calendars
+        """
+        return [
+            calendar
+            for calendar in self.conversion_index.potentials
+            if calendar is not self
         ]
-        calendars = list(itertools.chain(target_calendars, source_calendars))
-        return calendars
 
     def conversions(self) -> list:
         """All conversions this calendar is involved in"""
@@ -393,25 +419,79 @@ class ConvertibleCalendar(utils.Base):
         return conversions
 
     def sync_ordinal(self, cal: "ConvertibleCalendar") -> Union[int, None]:
-        """:returns: this calendar's sync ordinal for the given calendar"""
+        """
+        :returns: this calendar's sync ordinal for the given calendar. Without
+            a conversion between them, the ordinal of the day the conversion
+            index is relative to
+        """
         conversion = self.conversion(cal)
         if conversion is None:
+            index = self.conversion_index
+            if index.is_consistent and cal in index.potentials:
+                return index.potentials[self]
             return None
 
         if conversion.target_calendar is self:
             return conversion.target_sync_ordinal
         return conversion.source_sync_ordinal
 
+    def sync_offset(self, cal: "ConvertibleCalendar") -> Union[int, None]:
+        """
+        :returns: days to add to an ordinal of the given calendar to make the
+            same day's ordinal in this calendar
+        """
+        index = self.conversion_index
+        if index.is_consistent:
+            sync_offset = index.sync_offset(self, cal)
+            if sync_offset is not None:
+                return sync_offset
+
+        # linked by a conversion that isn't flushed yet, or inconsistently
+        conversion = self.conversion(cal)
+        if conversion is None:
+            return None
+
+        sync_offset = (
+            conversion.target_sync_ordinal - conversion.source_sync_ordinal
+        )
+        if conversion.target_calendar is self:
+            return sync_offset
+        return -sync_offset
+
+    def sync_offsets(self) -> dict:
+        """
+        :returns: days to add to an ordinal of this calendar to make the same
+            day's ordinal in each of :py:meth:`calendars`
+        """
+        index = self.conversion_index
+        if index.is_consistent:
+            potential = index.potentials[self]
+            return {
+                calendar: other_potential - potential
+                for calendar, other_potential in index.potentials.items()
+                if calendar is not self
+            }
+
+        sync_offsets = dict()
+        for conversion in self.conversions():
+            sync_offset = (
+                conversion.target_sync_ordinal - conversion.source_sync_ordinal
+            )
+            if conversion.source_calendar is self:
+                sync_offsets[conversion.target_calendar] = sync_offset
+            else:
+                sync_offsets[conversion.source_calendar] = -sync_offset
+        return sync_offsets
+
     def conversion(
         self, calendar: "ConvertibleCalendar"
     ) -> Union["CalendarConversion", None]:
         """:returns: CalendarConversion for this and the given calendar"""
-        conversions = self.conversions()
-        for conversion in conversions:
-            if {conversion.target_calendar, conversion.source_calendar} == {
-                self,
-                calendar,
-            }:
+        for conversion in self._target_conversions:
+            if conversion.target_calendar is calendar:
+                return conversion
+        for conversion in self._source_conversions:
+            if conversion.source_calendar is calendar:
                 return conversion
         return None
 
@@ -426,6 +506,20 @@ event.listen(
     "before_update",
     ConvertibleCalendar.validate_disjoint_special_years,
 )
+event.listen(
+    ConvertibleCalendar,
+    "after_update",
+    lambda _, __, target: ConvertibleCalendar.invalidate_spec(target),
+)
+event.listen(
+    ConvertibleCalendar, "refresh", ConvertibleCalendar.invalidate_spec
+)
+for _column in CalendarSpec.calendar_columns:
+    event.listen(  # changes before a flush shouldn't use a stale spec either
+        getattr(ConvertibleCalendar, _column),
+        "set",
+        ConvertibleCalendar.invalidate_spec,
+    )
 
 
 class CalendarConversion(utils.Base):
@@ -462,62 +556,108 @@ class CalendarConversion(utils.Base):
         """
         If Calendar1 and Calendar2 can be converted and Calendar2 and Calendar3
         can be converted, make a conversion between Calendar1 and Calendar3.
+        Only calendars linked to ones changed by the flush are checked.
         Designed to be an event listener before flush
-        """
-        calendars_in_session = [
-            object_
-            for object_ in session.new.union(session.dirty)
-            if isinstance(object_, ConvertibleCalendar)
-        ]
-        for source_calendar in calendars_in_session:
-            convertible_calendars = set(source_calendar.calendars())
-            for calendar in convertible_calendars:
-                linked_calendars = set(
-                    cal
-                    for cal in calendar.calendars()
-                    if cal.id != source_calendar.id
-                )
-                if linked_calendars.issubset(convertible_calendars):
-                    continue
-
-                mutual_calendar = calendar
-                missing_calendars = linked_calendars - convertible_calendars
-                for missing_calendar in missing_calendars:
-                    mutual2missing_sync_ordinal = mutual_calendar.sync_ordinal(
-                        missing_calendar
-                    )
-                    old_missing_sync_ordinal = missing_calendar.sync_ordinal(
-                        mutual_calendar
-                    )
-
-                    mutual2source_sync_ordinal = mutual_calendar.sync_ordinal(
-                        source_calendar
-                    )
-                    old_source_sync_ordinal = source_calendar.sync_ordinal(
-                        mutual_calendar
-                    )
-
-                    mutual_ordinal_diff = (
-                        mutual2source_sync_ordinal
-                        - mutual2missing_sync_ordinal
-                    )
-                    new_missing_sync_ordinal = (
-                        old_missing_sync_ordinal + mutual_ordinal_diff
-                    )
-                    new_source_sync_ordinal = (
-                        old_source_sync_ordinal + mutual_ordinal_diff
-                    )
 
+        Set ``session.info["pairwise_closure"]`` to False to skip this for a
+        session. Only their conversion indexes link its calendars then
+        """
+        if not session.info.get("pairwise_closure", True):
+            return
+
+        changed_calendars = []
+        for object_ in session.new.union(session.dirty):
+            if isinstance(object_, ConvertibleCalendar):
+                changed_calendars.append(object_)
+            elif isinstance(object_, CalendarConversion):
+                changed_calendars.append(object_.source_calendar)
+
+        closed_calendars = {None}
+        for changed_calendar in changed_calendars:
+            if changed_calendar in closed_calendars:
+                continue
+
+            # may not include conversions added since it was built
+            ConversionIndex.drop(changed_calendar)
+            potentials = changed_calendar.conversion_index.potentials
+            closed_calendars.update(potentials)
+
+            linked_calendars = list(potentials)
+            for idx, source_calendar in enumerate(linked_calendars, start=1):
+                convertible_calendars = set()
+                for conversion in source_calendar.conversions():
+                    convertible_calendars.add(conversion.source_calendar)
+                    convertible_calendars.add(conversion.target_calendar)
+
+                for target_calendar in linked_calendars[idx:]:
+                    if target_calendar in convertible_calendars:
+                        continue
+
+                    # both sync ordinals are the index's reference day
                     session.add(
                         CalendarConversion(
                             source_calendar=source_calendar,
-                            source_sync_ordinal=new_source_sync_ordinal,
-                            target_calendar=missing_calendar,
-                            target_sync_ordinal=new_missing_sync_ordinal,
+                            source_sync_ordinal=potentials[source_calendar],
+                            target_calendar=target_calendar,
+                            target_sync_ordinal=potentials[target_calendar],
                         )
                     )
 
+    @staticmethod
+    def drop_stale_indexes(target: "CalendarConversion", _, oldvalue, *__):
+        """
+        Designed to be an event listener, drops the conversion indexes of a
+        conversion's calendars when the conversion changes
+        """
+        if oldvalue is NO_VALUE or oldvalue is NEVER_SET or oldvalue is None:
+            return  # a new conversion is indexed after it's flushed
+        if isinstance(oldvalue, ConvertibleCalendar):
+            ConversionIndex.drop(oldvalue)
+        ConversionIndex.drop(target.source_calendar)
+        ConversionIndex.drop(target.target_calendar)
+
+    @staticmethod
+    def index_conversions(session: Session, *_):
+        """
+        Adds new conversions to the conversion indexes of their calendars and
+        drops the indexes deleted conversions were in. Designed to be an
+        event listener after flush
+        """
+        for object_ in session.new:
+            if isinstance(object_, CalendarConversion):
+                ConversionIndex.connect(object_)
+        for object_ in session.deleted:
+            if isinstance(object_, CalendarConversion):
+                ConversionIndex.drop(object_.source_calendar)
+                ConversionIndex.drop(object_.target_calendar)
+            elif isinstance(object_, ConvertibleCalendar):
+                ConversionIndex.drop(object_)
+
+    @staticmethod
+    def drop_indexes(session: Session, *_):
+        """
+        Designed to be an event listener after rollback, drops the conversion
+        indexes of the session's calendars
+        """
+        for object_ in session.identity_map.values():
+            if isinstance(object_, ConvertibleCalendar):
+                ConversionIndex.drop(object_)
+
 
 event.listen(
     Session, "before_flush", CalendarConversion.make_mutual_conversions
 )
+event.listen(Session, "after_flush", CalendarConversion.index_conversions)
+event.listen(Session, "after_soft_rollback", CalendarConversion.drop_indexes)
+for _attribute in (
+    "source_calendar",
+    "target_calendar",
+    "source_sync_ordinal",
+    "target_sync_ordinal",
+):
+    event.listen(
+        getattr(CalendarConversion, _attribute),
+        "set",
+        CalendarConversion.drop_stale_indexes,
+        active_history=True,
+    )
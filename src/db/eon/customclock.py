@@ -15,11 +15,15 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+import itertools
+
 from src.db import utils
-from sqlalchemy import CheckConstraint, Column, Integer, Unicode
+from sqlalchemy import CheckConstraint, Column, event, Integer, Unicode
 from sqlalchemy.future import select
 from sqlalchemy.orm import column_property, object_session
 
+_versions = itertools.count(1)
+
 
 class ConvertibleClock(utils.Base):
     """User-defined time"""
@@ -48,9 +52,26 @@ class ConvertibleClock(utils.Base):
     seconds_in_hour = column_property(seconds_in_minute * minutes_in_hour)
     seconds_in_day = column_property(seconds_in_hour * hours_in_day)
 
+    _version = None  # changed with the units of the clock
+
     def __repr__(self):
         return f"{self.name}(Seconds in a Day: {self.seconds_in_day})"
 
+    @property
+    def version(self) -> int:
+        """
+        Unique to this clock, changes whenever the units of the clock might
+        have
+        """
+        if self._version is None:
+            self._version = next(_versions)
+        return self._version
+
+    @staticmethod
+    def change_version(target: "ConvertibleClock", *_):
+        """Designed to be an event listener, marks the clock as changed"""
+        target._version = next(_versions)
+
     def convertible_clocks(self) -> list:
         session = object_session(self)
         return (
@@ -63,3 +84,12 @@ class ConvertibleClock(utils.Base):
             .scalars()
             .all()
         )
+
+
+event.listen(ConvertibleClock, "refresh", ConvertibleClock.change_version)
+for _column in ("seconds_in_minute", "minutes_in_hour", "hours_in_day"):
+    event.listen(
+        getattr(ConvertibleClock, _column),
+        "set",
+        ConvertibleClock.change_version,
+    )
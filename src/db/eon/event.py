@@ -0,0 +1,247 @@
+"""Event models"""
+#  Copyright (c) 2021 author(s) of JulianBC.
+#
+#  This file is part of JulianBC.
+#
+#  JulianBC is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  JulianBC is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+import bisect
+import numpy
+
+from src.db import utils
+from src.db.eon.customcalendar import ConvertibleCalendar
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    DDL,
+    event,
+    Float,
+    ForeignKey,
+    Integer,
+    Unicode,
+)
+from sqlalchemy.future import select
+from sqlalchemy.orm import relationship, Session
+from sqlalchemy.sql import column, table
+from typing import Optional, Sequence
+
+# Spans of events for SQLite's R*Tree module. The spans are rounded outward
+# to 32-bit floats, so matches are checked against the events again. The
+# calendar is only checked then too, as a dimension most events share it
+# makes searches over a hundred times slower
+event_rtree = table(
+    "event_rtree", column("id"), column("min_od"), column("max_od")
+)
+
+# Widths in days of the buckets events are counted in, narrowest first
+ROLLUP_WIDTHS = tuple(10 ** exponent for exponent in range(8))
+
+
+class Event(utils.Base):
+    """Something that happened from one ordinal decimal to another"""
+
+    __tablename__ = "event"
+    id = Column(Integer, primary_key=True)
+    name = Column(Unicode(255), nullable=False)
+    calendar_id = Column(
+        Integer, ForeignKey("convertible_calendar.id"), nullable=False
+    )
+    start_od = Column(Float, nullable=False)
+    end_od = Column(
+        Float,
+        CheckConstraint(
+            "end_od >= start_od", name=f"ck_{__tablename__}_end_od"
+        ),
+        nullable=False,
+    )
+
+    calendar = relationship(ConvertibleCalendar)
+
+    def __repr__(self):
+        return f"{self.name}({self.start_od} to {self.end_od})"
+
+    @staticmethod
+    def histogram(
+        session: Session,
+        calendar: ConvertibleCalendar,
+        edges: Sequence[float],
+    ) -> list[int]:
+        """
+        counts the events of the calendar that start between each pair of
+        consecutive edges. The widest rollup no wider than every bin is
+        used, so a count can be off by one bucket of it at either edge.
+        Bins narrower than a day count the events themselves
+
+        :param edges: ordinal decimals in ascending order, at least two
+        """
+        edges = numpy.asarray(edges, dtype=float)
+        idx = bisect.bisect_right(ROLLUP_WIDTHS, numpy.diff(edges).min())
+        if idx == 0:
+            start_ods = (
+                session.execute(
+                    select(Event.start_od).where(
+                        Event.calendar_id == calendar.id,
+                        Event.start_od >= edges[0],
+                        Event.start_od <= edges[-1],
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            return numpy.histogram(start_ods, edges)[0].tolist()
+
+        width = ROLLUP_WIDTHS[idx - 1]
+        rows = session.execute(
+            select(EventRollup.bucket, EventRollup.count).where(
+                EventRollup.calendar_id == calendar.id,
+                EventRollup.width == width,
+                EventRollup.bucket >= edges[0] // width,
+                EventRollup.bucket <= edges[-1] // width,
+            )
+        ).all()
+        buckets = numpy.array([bucket for bucket, _ in rows], dtype=float)
+        counts = [count for _, count in rows]
+        midpoints = (buckets + 0.5) * width
+        return (
+            numpy.histogram(midpoints, edges, weights=counts)[0]
+            .astype(int)
+            .tolist()
+        )
+
+    @staticmethod
+    def overlapping(
+        session: Session,
+        calendar: ConvertibleCalendar,
+        start_od: float,
+        end_od: float,
+        limit: Optional[int] = None,
+    ) -> list["Event"]:
+        """
+        :param limit: most events to return, the earliest starting ones
+        :returns: events of the calendar that overlap start_od to end_od,
+            inclusive, by start
+        """
+        candidate_ids = select(event_rtree.c.id).where(
+            event_rtree.c.min_od <= end_od,
+            event_rtree.c.max_od >= start_od,
+        )
+        query = (
+            select(Event)
+            .where(
+                Event.id.in_(candidate_ids),
+                Event.calendar_id == calendar.id,
+                Event.start_od <= end_od,
+                Event.end_od >= start_od,
+            )
+            .order_by(Event.start_od)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return session.execute(query).scalars().all()
+
+
+class EventRollup(utils.Base):
+    """
+    How many events of a calendar start in a bucket, the days from
+    bucket * width up to the next bucket. Kept up to date by triggers
+    """
+
+    __tablename__ = "event_rollup"
+    calendar_id = Column(
+        Integer, ForeignKey("convertible_calendar.id"), primary_key=True
+    )
+    width = Column(Integer, primary_key=True)
+    bucket = Column(Integer, primary_key=True)
+    count = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"{self.count} events from {self.bucket * self.width} days"
+
+
+def _floor_sql(expression: str) -> str:
+    """SQL rounding down, as SQLite may be built without math functions"""
+    truncated = f"CAST({expression} AS INTEGER)"
+    return f"({truncated} - ({expression} < {truncated}))"
+
+
+def _count_sql(width: int) -> str:
+    """SQL counting the new row of a trigger in its bucket of the width"""
+    bucket = _floor_sql(f"new.start_od / {width}")
+    return f"""
+        INSERT INTO event_rollup (calendar_id, width, bucket, count)
+        VALUES (new.calendar_id, {width}, {bucket}, 1)
+        ON CONFLICT (calendar_id, width, bucket)
+        DO UPDATE SET count = count + 1;"""
+
+
+def _uncount_sql(width: int) -> str:
+    """SQL uncounting the old row of a trigger in its bucket of the width"""
+    where = f"""
+        WHERE calendar_id = old.calendar_id
+        AND width = {width}
+        AND bucket = {_floor_sql(f"old.start_od / {width}")}"""
+    return f"""
+        UPDATE event_rollup SET count = count - 1 {where};
+        DELETE FROM event_rollup {where} AND count = 0;"""
+
+
+_count_rollups = "".join(_count_sql(width) for width in ROLLUP_WIDTHS)
+_uncount_rollups = "".join(_uncount_sql(width) for width in ROLLUP_WIDTHS)
+
+for _ddl in (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS event_rtree
+    USING rtree(id, min_od, max_od)
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS event_rtree_insert AFTER INSERT ON event
+    BEGIN
+        INSERT INTO event_rtree VALUES (new.id, new.start_od, new.end_od);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS event_rtree_update
+    AFTER UPDATE OF id, start_od, end_od ON event
+    BEGIN
+        UPDATE event_rtree
+        SET id = new.id, min_od = new.start_od, max_od = new.end_od
+        WHERE id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS event_rtree_delete AFTER DELETE ON event
+    BEGIN
+        DELETE FROM event_rtree WHERE id = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS event_rollup_insert AFTER INSERT ON event
+    BEGIN {_count_rollups}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS event_rollup_update
+    AFTER UPDATE OF calendar_id, start_od ON event
+    BEGIN {_uncount_rollups} {_count_rollups}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS event_rollup_delete AFTER DELETE ON event
+    BEGIN {_uncount_rollups}
+    END
+    """,
+):
+    event.listen(Event.__table__, "after_create", DDL(_ddl))
+event.listen(
+    Event.__table__, "after_drop", DDL("DROP TABLE IF EXISTS event_rtree")
+)
@@ -14,9 +14,16 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+import functools
+import os
 import uuid
 
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.future import create_engine
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import QueuePool, StaticPool
+from typing import Union
 
 
 def string_sanitization(collection: list) -> list:
@@ -49,3 +56,60 @@ NAMING_CONVENTION = {
 
 Base = declarative_base()
 Base.metadata.naming_convention = NAMING_CONVENTION
+
+
+def make_engine(
+    path: Union[str, os.PathLike, None] = None,
+    mmap_size: int = 2 ** 28,
+    cache_size: int = 2 ** 15,
+    busy_timeout: int = 5000,
+    pool_size: int = 4,
+) -> Engine:
+    """
+    SQLite engine with the missing tables of every imported model created.
+    An engine for a database file may be shared by the UI thread and
+    background workers. The in-memory database lives on one connection whose
+    transactions would interleave across threads, so use it from one thread
+    at a time, e.g. in tests or the single-threaded UI
+
+    :param path: database file, the database is in memory if None
+    :param mmap_size: bytes of the database file mapped into memory
+    :param cache_size: KiB of page cache for each connection
+    :param busy_timeout: milliseconds to wait for another connection's lock
+    :param pool_size: connections kept open to a database file
+    """
+    if path is None:  # the database is gone once its connection closes
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+    else:
+        engine = create_engine(
+            f"sqlite:///{os.fspath(path)}",
+            connect_args={"check_same_thread": False},
+            poolclass=QueuePool,
+            pool_size=pool_size,
+            future=True,
+        )
+
+    pragmas = {
+        "synchronous": "NORMAL",
+        "mmap_size": int(mmap_size),
+        "cache_size": -int(cache_size),
+        "busy_timeout": int(busy_timeout),
+    }
+    if path is not None:
+        pragmas["journal_mode"] = "WAL"  # readers don't block the writer
+    event.listen(engine, "connect", functools.partial(set_pragmas, pragmas))
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def set_pragmas(pragmas: dict, dbapi_connection, _):
+    """Designed to be a partial event listener on connect"""
+    cursor = dbapi_connection.cursor()
+    for pragma, value in pragmas.items():
+        cursor.execute(f"PRAGMA {pragma} = {value}")
+    cursor.close()
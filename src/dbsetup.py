@@ -14,21 +14,23 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+import os
+
 from src.customdatetime import (
     ConvertibleDate,
     ConvertibleDateTime,
     ConvertibleTime,
 )
-from sqlalchemy.future import create_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
 from src.db import ConvertibleCalendar, ConvertibleClock
-from src.db.utils import Base
+from src.db.utils import make_engine
+
+# a database file to keep, or None for a database in memory
+DATABASE_PATH = os.environ.get("JULIANBC_DATABASE")
 
-engine = create_engine("sqlite://", future=True)
+engine = make_engine(DATABASE_PATH)
 Session = scoped_session(sessionmaker(bind=engine))
 session = Session()
-Base.metadata.create_all(engine)
-session.commit()
 gregorian = ConvertibleCalendar(
     name="Gregorian",
     weekday_names=(
@@ -101,7 +103,14 @@ gregorian = ConvertibleCalendar(
     era_ranges=[("-inf", 1), (1, "inf")],
     jd_epoch=1721426,
 )
-earth_clock = ConvertibleClock(name="Earth")
+# a database file from an earlier run already has them
+gregorian = (
+    session.query(ConvertibleCalendar).filter_by(name="Gregorian").first()
+    or gregorian
+)
+earth_clock = session.query(ConvertibleClock).filter_by(
+    name="Earth"
+).first() or ConvertibleClock(name="Earth")
 session.add_all([gregorian, earth_clock])
 session.commit()
 gregorian_cd = ConvertibleDate(calendar=gregorian)
@@ -14,9 +14,82 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+from kivy.clock import Clock
+from kivy.graphics import Color, InstructionGroup, Rectangle
+from kivy.properties import NumericProperty, ObjectProperty
 from kivy.uix.floatlayout import FloatLayout
 from src.ui.focusedkeylisten import PassiveFocusBehavior
 
 
 class EventView(PassiveFocusBehavior, FloatLayout):
-    """Where the end-user manipulates events"""
+    """
+    Where the end-user manipulates events. Draws the events of its Timeline,
+    or a histogram of them when the Timeline only counts them
+    """
+
+    timeline = ObjectProperty()
+    event_color = ObjectProperty(Color(144 / 255, 202 / 255, 249 / 255))
+    event_height = NumericProperty("12sp")
+    event_spacing = NumericProperty("2sp")
+    min_event_width = NumericProperty("2sp")
+
+    def __init__(self, **kwargs):
+        self.event_group = InstructionGroup()
+        self.draw_events_trigger = Clock.create_trigger(self.draw_events)
+        super().__init__(**kwargs)
+        self.canvas.after.add(self.event_group)
+        self.bind(pos=self.draw_events_trigger, size=self.draw_events_trigger)
+
+    def on_timeline(self, *_):
+        self.timeline.bind(
+            start_od=self.draw_events_trigger,
+            end_od=self.draw_events_trigger,
+            events=self.draw_events_trigger,
+            event_counts=self.draw_events_trigger,
+        )
+
+    def draw_events(self, *_):
+        self.event_group.clear()
+        if self.timeline is None:
+            return
+
+        self.event_group.add(self.event_color)
+        if self.timeline.events:
+            self.draw_event_rows()
+        elif self.timeline.event_counts:
+            self.draw_histogram()
+
+    def draw_event_rows(self):
+        """
+        draws visible events in rows from the top, each in the row that's
+        been free the longest. Events overlap when every row is taken
+        """
+        row_height = self.event_height + self.event_spacing
+        row_rights = [float("-inf")] * max(1, int(self.height // row_height))
+        for event in self.timeline.events:  # by start
+            x = self.timeline.od_to_x(event.start_od)
+            right = max(
+                self.timeline.od_to_x(event.end_od), x + self.min_event_width
+            )
+            if right < self.x or x > self.right:
+                continue
+
+            row = row_rights.index(min(row_rights))
+            row_rights[row] = right + self.event_spacing
+            pos = x, self.top - (row + 1) * row_height
+            size = right - x, self.event_height
+            self.event_group.add(Rectangle(pos=pos, size=size))
+
+    def draw_histogram(self):
+        """draws the events starting in each column, the most at full height"""
+        tl = self.timeline
+        max_count = max(tl.event_counts)
+        for idx, count in enumerate(tl.event_counts):
+            if count == 0:
+                continue
+
+            x = tl.od_to_x(tl.event_count_ods[idx])
+            width = tl.od_to_x(tl.event_count_ods[idx + 1]) - x
+            pos = x, self.y
+            size = width, self.height * count / max_count
+            self.event_group.add(Rectangle(pos=pos, size=size))
@@ -62,13 +62,18 @@ class Mark(Widget):
     interval_width = NumericProperty(allownone=True)
     force_visible = BooleanProperty(False)
 
-    def draw_marks(self, *_, mark_ods: list = None) -> list:
-        """:raises AssertionError: when 2 marks should be visible but aren't"""
+    def draw_marks(self, *_, mark_instants: list = None) -> list:
+        """
+        Marks are found and placed as instants, so they stay exact in deep
+        time. Only their x positions are floats
+
+        :raises AssertionError: when 2 marks should be visible but aren't
+        """
 
         def make_mark_x() -> tuple[float, list, list]:
             """:return: current mark x, all mark x's, all visible mark x's"""
 
-            x = self.timeline.od_to_x(mark_od)
+            x = self.timeline.instant_to_x(mark_instant)
             mark_xs.append(x)
             if self.timeline.x <= x <= self.timeline.right:
                 visible_mark_xs.append(x)
@@ -81,7 +86,7 @@ class Mark(Widget):
 
         def add_label_to_canvas(alignment=None, location: str = None):
             alignment = alignment or self.label_align
-            hr_date = tl.cdt.od_to_hr_date(mark_od, unit)
+            hr_date = hr_dates[idx]
             label = self.make_label(mark_x, hr_date, alignment)
 
             if (
@@ -112,24 +117,26 @@ class Mark(Widget):
         tl = self.timeline
 
         unit = self.interval[1]
-        if mark_ods:  # skip expensive ordinal calculations if we can
-            for mark_od in mark_ods:
+        if mark_instants:  # skip expensive ordinal calculations if we can
+            for mark_instant in mark_instants:
                 mark_x, mark_xs, visible_mark_xs = make_mark_x()
         elif tl.cdt.is_datetime_unit(unit, "era"):
-            mark_ods = tl.cdt.era_start_ordinals
+            seconds_in_day = tl.cdt.time.clock.seconds_in_day
+            mark_instants = [
+                ordinal * seconds_in_day
+                for ordinal in tl.cdt.era_start_ordinals
+            ]
         else:
             # extend_od() widens time span without considering the interval
-            # so the first mark_od needs to be set with next_od()
-            mark_od = tl.cdt.next_od(
-                tl.extended_start_od, self.interval, forward=False
+            # so the first mark_instant is before the extended start
+            mark_instants = list(
+                tl.cdt.iter_instants(
+                    tl.extended_start_od, tl.extended_end_od, self.interval
+                )
             )
-            mark_ods = [mark_od]
-            while mark_od <= tl.extended_end_od:
+            for mark_instant in mark_instants[:-1]:  # the last is past the end
                 mark_x, mark_xs, visible_mark_xs = make_mark_x()
 
-                mark_od = tl.cdt.next_od(mark_od, self.interval)
-                mark_ods.append(mark_od)
-
         # interval_width is only valid if there are at least two visible marks
         force_visible = self.force_visible
         interval_width = float(numpy.diff(visible_mark_xs).mean())
@@ -142,22 +149,22 @@ class Mark(Widget):
 
         if force_visible and self.interval_width is None and self.has_label:
             # force labels to be visible if there are less than 2 visible marks
-            off_screen_mark_od = tl.cdt.next_od(
-                tl.start_od, self.interval, forward=False
+            start_instant = tl.cdt.od_to_instant(tl.start_od)
+            off_screen_mark_instant = tl.cdt.next_instant(
+                start_instant, self.interval, forward=False
+            )
+            off_screen_mark_x = tl.instant_to_x(off_screen_mark_instant)
+            mid_mark_instant = tl.cdt.next_instant(
+                start_instant, self.interval
             )
-            off_screen_mark_x = tl.od_to_x(off_screen_mark_od)
-            mid_mark_od = tl.cdt.next_od(tl.start_od, self.interval)
-            mid_mark_x = tl.od_to_x(mid_mark_od)  # may still be off screen
+            mid_mark_x = tl.instant_to_x(mid_mark_instant)  # may be off screen
 
-            mark_ods = [off_screen_mark_od, mid_mark_od]
             mark_xs = [off_screen_mark_x, mid_mark_x]
-
-            for idx, mark_x in enumerate(mark_xs):  # the marks without labels
-                mark_od = mark_ods[idx]
+            for mark_x in mark_xs:  # the marks without labels
                 add_mark_to_canvas()
 
             marks_drawn = True
-            mark_ods = [tl.start_od, tl.end_od]
+            mark_instants = [start_instant, tl.cdt.od_to_instant(tl.end_od)]
             mark_xs = [tl.x, tl.right]  # really should be called label pos
             alignments = [self.LABEL_LEFT, self.LABEL_RIGHT]
             pin_locations = "left", "right"
@@ -166,9 +173,12 @@ class Mark(Widget):
             alignments = None
             pin_locations = None
 
-        for idx, mark_x in enumerate(mark_xs):
-            mark_od = mark_ods[idx]
+        if self.has_label:
+            hr_dates = tl.cdt.instants_to_hr_dates(
+                mark_instants[: len(mark_xs)], unit
+            )
 
+        for idx, mark_x in enumerate(mark_xs):
             if not marks_drawn:
                 add_mark_to_canvas()
 
@@ -182,7 +192,7 @@ class Mark(Widget):
                 add_label_to_canvas()
             else:
                 add_label_to_canvas(label_align, pin_location)
-        return mark_ods
+        return mark_instants
 
     def make_label(self, x: int, text: str, alignment: str) -> TextBoundLabel:
         """:raises: ValueError if alignment is isn't a valid option"""
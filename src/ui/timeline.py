@@ -14,7 +14,9 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
+import bisect
 import datetime
+import numpy
 
 from kivy.clock import Clock
 from kivy.properties import (
@@ -27,6 +29,8 @@ from kivy.properties import (
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.screenmanager import Screen
 from kivy.uix.scrollview import ScrollView
+from sqlalchemy.orm import object_session
+from src.db import Event
 from src.ui.collapse import CollapseBehavior
 from src.ui.focus import AbstractFocus
 from src.ui.focusedkeylisten import FocusKeyListenBehavior
@@ -77,6 +81,11 @@ class Timeline(
     too_many_marks_factor = NumericProperty(1)
 
     extend_time_span_by = NumericProperty(1)
+    events = ListProperty()  # Events in the extended time span
+    event_counts = ListProperty()  # Events starting in each column instead
+    event_count_ods = ListProperty()  # edges of the columns
+    max_visible_events = NumericProperty(200)
+    event_column_width = NumericProperty(4)  # pixels
 
     def _get_extended_start_od(self):
         factor = self.extend_time_span_by
@@ -112,11 +121,20 @@ class Timeline(
 
     def __init__(self, **kwargs):
         self.draw_marks_trigger = Clock.create_trigger(self.draw_marks)
+        self.fetch_events_trigger = Clock.create_trigger(self.fetch_events)
         super().__init__(**kwargs)
         self.bind(
             size=self.draw_marks_trigger,
             extended_start_od=self.draw_marks_trigger,
             extended_end_od=self.draw_marks_trigger,
+        )
+        self.bind(
+            cdt=self.fetch_events_trigger,
+            width=self.fetch_events_trigger,
+            extended_start_od=self.fetch_events_trigger,
+            extended_end_od=self.fetch_events_trigger,
+        )
+        self.bind(
             secondary_mark_interval=self.update_mark_interval,
             scroll_by=self.scroll_start_and_end,
             zoom_by=self.zoom_start_and_end,
@@ -145,78 +163,36 @@ class Timeline(
                 self.secondary_mark_interval, increase=False
             )
 
-    def change_interval(
-        self, interval: list, increase=True, recursive=False
-    ) -> list:
-        """change mark_interval so labels don't overlap and/or are visible"""
-        frequency, unit = interval
-        changed_interval = self.change_interval_unit(interval, increase)
-        if changed_interval is not None:
-            return changed_interval
-
-        # increasing the number of marks means decreasing the frequency
-        sign = -1 if increase else 1
-        new_frequency = frequency
-        frequencies = self.cdt.get_frequencies(unit)
-        if not recursive:  # change_interval_unit() already changed frequency
-            idx = frequencies.index(frequency)
-            new_idx = idx + sign
-            new_frequency = frequencies[new_idx]
-
-        new_od = self.cdt.extend_od(self.start_od, [new_frequency, unit])
-        new_interval_width = self.od_to_x(new_od)  # an approximation
-
-        max_label_width = self.secondary_mark.max_label_width
-        while self.bad_mark_spacing(
-            max_label_width, new_interval_width, spacing="too_many"
-        ) or self.bad_mark_spacing(new_interval_width, self.width):
-            interval = [new_frequency, unit]
-            interval = self.change_interval_unit(interval, increase)
-            if interval is not None:
-                return interval
-
-            idx = frequencies.index(new_frequency)
-            new_idx = idx + sign
-            new_frequency = frequencies[new_idx]
-            new_od = self.cdt.extend_od(self.start_od, [new_frequency, unit])
-            new_interval_width = self.od_to_x(new_od)
-
-            increase = self.bad_mark_spacing(new_interval_width, self.width)
-        return [new_frequency, unit]
-
-    def change_interval_unit(
-        self, interval: list, increase=True
-    ) -> Union[list, None]:
+    def change_interval(self, interval: list, increase=True) -> list:
         """
-        Change the unit of an interval. Assumes self.cdt.datetime_units is
-        sorted largest to smallest
+        change mark_interval so labels don't overlap and/or are visible.
+        Bisects :py:meth:`ConvertibleDateTime.get_interval_ladder` for the
+        widest interval with enough marks, or the narrowest interval whose
+        labels fit when there are too many marks
 
-        :raises ValueError: when increasing a Year unit or decreasing a second
-            unit.
+        :param interval: the current interval, which is always changed
+        :param increase: True if there are too few marks
         """
-        frequency, unit = interval
-        frequencies = self.cdt.get_frequencies(unit)
-        decrease_unit = increase and frequency == min(frequencies)
-        increase_unit = not increase and frequency == max(frequencies)
-
-        if increase_unit:
-            if self.cdt.is_datetime_unit(unit, "year"):
-                raise ValueError("Interval unit can't be more than a year")
-
-            unit_idx = self.cdt.datetime_units.index(unit)
-            bigger_unit = self.cdt.datetime_units[unit_idx - 1]
-            frequency = min(self.cdt.get_frequencies(bigger_unit))
-            interval = [frequency, bigger_unit]
-            return self.change_interval(interval, increase, recursive=True)
-        elif decrease_unit:
-            if self.cdt.is_datetime_unit(unit, "second"):
-                raise ValueError("Interval unit can't be less than a second")
-
-            unit_idx = self.cdt.datetime_units.index(unit)
-            smaller_unit = self.cdt.datetime_units[unit_idx + 1]
-            frequency = max(self.cdt.get_frequencies(smaller_unit))
-            interval = [frequency, smaller_unit]
-            return self.change_interval(interval, increase, recursive=True)
+        spans, intervals = self.cdt.get_interval_ladder()
+        days_per_pixel = self.time_span / self.width
+        min_span = (  # labels don't overlap
+            self.secondary_mark.max_label_width
+            * self.too_many_marks_factor
+            * days_per_pixel
+        )
+        max_span = self.time_span / self.too_few_marks_factor  # enough marks
+
+        idx = bisect.bisect_left(spans, min_span)
+        if increase:
+            idx = max(idx, bisect.bisect_right(spans, max_span) - 1)
+        if interval in intervals:  # spans are approximate, always move
+            current_idx = intervals.index(interval)
+            if increase:
+                idx = min(idx, current_idx - 1)
+            else:
+                idx = max(idx, current_idx + 1)
+        idx = min(max(idx, 0), len(intervals) - 1)
+        return list(intervals[idx])
 
     def bad_mark_spacing(
         self,
@@ -238,8 +214,42 @@ class Timeline(
 
     def draw_marks(self, _):
         self.primary_mark.draw_marks()
-        secondary_mark_ods = self.secondary_mark.draw_marks()
-        self.event_view_mark.draw_marks(mark_ods=secondary_mark_ods)
+        secondary_mark_instants = self.secondary_mark.draw_marks()
+        self.event_view_mark.draw_marks(mark_instants=secondary_mark_instants)
+
+    def fetch_events(self, *_):
+        """
+        query only the events of the calendar that overlap the extended time
+        span. When more than max_visible_events overlap it, only count how
+        many start in each column of event_column_width instead
+        """
+        self.events = []
+        self.event_counts = []
+        self.event_count_ods = []
+        calendar = self.cdt.date.calendar
+        session = object_session(calendar)
+        if session is None:  # the calendar isn't stored
+            return
+
+        events = Event.overlapping(
+            session,
+            calendar,
+            self.extended_start_od,
+            self.extended_end_od,
+            limit=int(self.max_visible_events) + 1,
+        )
+        if len(events) <= self.max_visible_events:
+            self.events = events
+            return
+
+        extended_width = self.dod_to_dx(self.extended_time_span)
+        columns = int(numpy.ceil(extended_width / self.event_column_width))
+        event_count_ods = numpy.linspace(
+            self.extended_start_od, self.extended_end_od, max(columns, 1) + 1
+        )
+        event_counts = Event.histogram(session, calendar, event_count_ods)
+        self.event_count_ods = event_count_ods.tolist()
+        self.event_counts = event_counts
 
     def disable_zoom(self, *_):
         self.disable_zoom_in = self.disable_zoom_out = self.shift_key
@@ -283,6 +293,15 @@ class Timeline(
         dod = od - self.start_od
         return self.x + self.dod_to_dx(dod)
 
+    def instant_to_x(self, instant: int) -> float:
+        """
+        convert instant to x position. The start is subtracted exactly, so
+        only the visible change in time becomes a float
+        """
+        dinstant = instant - self.cdt.od_to_instant(self.start_od)
+        dod = dinstant / self.cdt.time.clock.seconds_in_day
+        return self.x + self.dod_to_dx(dod)
+
     def dod_to_dx(self, dod: float) -> float:
         """convert change in ordinal decimal to change in pixels"""
         return self.width * (dod / self.time_span)
@@ -8,4 +8,6 @@ from .db_factories.eon_factories.customcalendar_factories import (
 from .db_factories.eon_factories.customclock_factories import ConvertibleClockFactory
 # fmt: on
 
+from .db_factories.eon_factories.event_factories import EventFactory
+
 from .customtime_factories import ConvertibleTimeFactory
@@ -0,0 +1,21 @@
+from tests.factories.db_factories.eon_factories.customcalendar_factories import (  # noqa: E501
+    ConvertibleCalendarFactory,
+)
+from tests.factories.utils import BaseFactory, factory
+from src.db import Event
+
+
+class EventFactory(BaseFactory):
+    class Meta:
+        model = Event
+
+    id = factory.Sequence(lambda n: n)
+    name = factory.Faker("sentence", nb_words=3)
+    calendar = factory.SubFactory(ConvertibleCalendarFactory)
+    start_od = factory.Faker("pyfloat", min_value=-1e6, max_value=1e6)
+    end_od = factory.LazyAttribute(
+        lambda event: event.start_od + event.duration
+    )
+
+    class Params:
+        duration = factory.Faker("pyfloat", min_value=0, max_value=1e3)
@@ -1,3 +1,4 @@
+import numpy
 import pytest
 
 from src.customdate import ConvertibleDate, DateUnit
@@ -372,6 +373,69 @@ class ConvertibleDateTest(CalendarTestCase):
             == ordinal_date
         )
 
+    def test_ordinal_date_to_ast_ymd_for_every_day_of_the_year(self):
+        calendar = self.calendar_factory.build(
+            days_in_common_year_months=(31, 2, 30, 1),
+            common_year_month_names=("a", "b", "c", "d"),
+            special_common_years=(),
+            special_leap_years=(),
+        )
+        cd = ConvertibleDate(calendar=calendar)
+        ast_year = FAKE.random_int(min=-9999)
+        while cd.is_leap_year(ast_year):
+            ast_year += 1
+
+        ast_ymds = [(ast_year, 1, day) for day in range(1, 32)]
+        ast_ymds += [(ast_year, 2, 1), (ast_year, 2, 2)]
+        ast_ymds += [(ast_year, 3, day) for day in range(1, 31)]
+        ast_ymds += [(ast_year, 4, 1)]
+        for day_of_year, ast_ymd in enumerate(ast_ymds, start=1):
+            ordinal_date = ast_year, day_of_year
+            assert cd.ordinal_date_to_ast_ymd(ordinal_date) == ast_ymd
+            assert cd.ast_ymd_to_ordinal_date(ast_ymd) == ordinal_date
+
+    #
+    # ConvertibleDate.ordinals_to_ast_ymd, ConvertibleDate.ast_ymd_to_ordinals
+    #
+    def test_ordinals_to_ast_ymd_and_ast_ymd_to_ordinals(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        start = FAKE.random_int(min=-99999, max=99999)
+        ordinals = numpy.arange(start, start + FAKE.random_int(min=1000))
+        ast_years, months, days = cd.ordinals_to_ast_ymd(ordinals)
+        for ordinal, ast_ymd in zip(ordinals, zip(ast_years, months, days)):
+            ordinal_date = cd.ordinal_to_ordinal_date(ordinal)
+            assert ast_ymd == cd.ordinal_date_to_ast_ymd(ordinal_date)
+        new_ordinals = cd.ast_ymd_to_ordinals(ast_years, months, days)
+        assert (new_ordinals == ordinals).all()
+
+    def test_ordinals_to_ast_ymd_and_ast_ymd_to_ordinals_with_no_months(self):
+        monthless_calendar, days_in_year = self.random_monthless_calendar()
+        cd = ConvertibleDate(calendar=monthless_calendar)
+        ordinals = numpy.array([-days_in_year, 0, 1, days_in_year + 1])
+        ast_years, months, days = cd.ordinals_to_ast_ymd(ordinals)
+        assert months is None
+        assert ast_years.tolist() == [-1, 0, 1, 2]
+        assert days.tolist() == [days_in_year, days_in_year, 1, 1]
+        new_ordinals = cd.ast_ymd_to_ordinals(ast_years, None, days)
+        assert (new_ordinals == ordinals).all()
+
+    def test_ast_ymd_to_ordinals_raises(self):
+        calendar = self.calendar_factory.build()
+        cd = ConvertibleDate(calendar=calendar)
+        ast_year = FAKE.random_int(min=-9999)
+        months_in_year = cd.months_in_year(ast_year)
+        days_in_month = cd.days_in_month(ast_year, months_in_year)
+        with pytest.raises(ValueError):
+            cd.ast_ymd_to_ordinals(ast_year, months_in_year + 1, 1)
+        with pytest.raises(ValueError):
+            cd.ast_ymd_to_ordinals(ast_year, 0, 1)
+        with pytest.raises(ValueError):
+            cd.ast_ymd_to_ordinals(
+                [ast_year, ast_year],
+                [1, months_in_year],
+                [1, days_in_month + 1],
+            )
+
     #
     # ConvertibleDate.shift_ast_ymd
     #
@@ -402,10 +466,10 @@ class ConvertibleDateTest(CalendarTestCase):
     @pytest.mark.db
     def test_shift_ast_ymd_with_diff_months_in_leap_and_common_years(self):
         days_in_common_year_months = FAKE.random_choices(
-            elements=[x for x in range(200)], length=11
+            elements=[x for x in range(1, 200)], length=11
         )
         days_in_leap_year_months = FAKE.random_choices(
-            elements=[x for x in range(200)], length=12
+            elements=[x for x in range(1, 200)], length=12
         )
         days_in_common_year_months.append(30)
         days_in_leap_year_months.append(31)
@@ -432,6 +496,48 @@ class ConvertibleDateTest(CalendarTestCase):
             assert cd.shift_ast_ymd((0, 13, 31), plus_one_year) == (1, 12, 30)
             assert cd.shift_ast_ymd((-4, 13, 31), sub_one_year) == (-5, 12, 30)
 
+    #
+    # ConvertibleDate.shift_month
+    #
+    def test_shift_month_with_diff_months_in_leap_and_common_years(self):
+        calendar = self.calendar_factory.build(
+            common_year_month_names=FAKE.words(nb=12),
+            days_in_common_year_months=[30] * 12,
+            leap_year_month_names=FAKE.words(nb=13),
+            days_in_leap_year_months=[30] * 13,
+            leap_year_cycles=[4],
+            leap_year_cycle_start=1,
+            leap_year_cycle_ordinals=[4],
+            special_common_years=(),
+            special_leap_years=(),
+            leap_year_offset=0,
+        )
+        cd = ConvertibleDate(calendar=calendar)
+        cycles = FAKE.random_int(min=1, max=10_000_000)
+        months_in_cycle = 12 * 3 + 13
+        assert cd.shift_month(4, 13, 1) == (5, 1)
+        assert cd.shift_month(5, 1, -1) == (4, 13)
+        assert cd.shift_month(3, 12, 1) == (4, 1)
+        assert cd.shift_month(3, 12, 14) == (5, 1)
+        assert cd.shift_month(1, 1, months_in_cycle * cycles) == (
+            1 + 4 * cycles,
+            1,
+        )
+        assert cd.shift_month(1, 1, -months_in_cycle * cycles) == (
+            1 - 4 * cycles,
+            1,
+        )
+        assert cd.shift_month(4, 13, months_in_cycle * cycles) == (
+            4 + 4 * cycles,
+            13,
+        )
+
+    def test_shift_month_raises_with_monthless_calendar(self):
+        monthless_calendar, _ = self.random_monthless_calendar()
+        cd = ConvertibleDate(calendar=monthless_calendar)
+        with pytest.raises(ValueError):
+            cd.shift_month(FAKE.random_int(), 1, FAKE.random_int(min=1))
+
     #
     # Next dateunit
     #
@@ -624,27 +730,61 @@ class ConvertibleDateTest(CalendarTestCase):
         with pytest.raises(ValueError):
             cd.next_month(FAKE.pyint(), FAKE.pyint(), bad_frequency)
 
-    @patch("src.customdate.ConvertibleDate.is_valid_month", return_value=True)
-    def test_next_month_properly_overflows(self, _):
+    def test_next_month_properly_overflows(self):
         calendar = self.random_leapless_calendar()
         num_months = len(calendar.common_year_month_names)
         cd = ConvertibleDate(calendar=calendar)
-        frequency = 2
+        frequency = FAKE.random_int(min=1, max=num_months)
+        last_multiple = num_months // frequency * frequency
+        ast_year = FAKE.random_int(min=-9999)
+        assert cd.next_month(ast_year, last_multiple, frequency) == (
+            ast_year + 1,
+            frequency,
+            1,
+        )
+        assert cd.next_month(ast_year, frequency, frequency, False) == (
+            ast_year - 1,
+            last_multiple,
+            1,
+        )
+
+    def test_next_month_skips_years_without_the_month(self):
+        calendar = self.calendar_factory.build(
+            common_year_month_names=FAKE.words(nb=12),
+            days_in_common_year_months=[30] * 12,
+            leap_year_month_names=FAKE.words(nb=13),
+            days_in_leap_year_months=[30] * 13,
+            leap_year_cycles=[4],
+            leap_year_cycle_start=1,
+            leap_year_cycle_ordinals=[4],
+            special_common_years=(),
+            special_leap_years=(),
+            leap_year_offset=0,
+        )
+        cd = ConvertibleDate(calendar=calendar)
+        assert cd.next_month(1, 1, 13) == (4, 13, 1)
+        assert cd.next_month(7, 1, 13, False) == (4, 13, 1)
+
+    def test_next_ast_year_for_large_frequency(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        assert cd.next_ast_year(1, 100_000) == (100_000, 1, 1)
+        assert cd.next_ast_year(1, 100_000, False) == (0, 1, 1)
+        assert cd.next_ast_year(0, 100_000, False) == (-100_000, 1, 1)
+
+    def test_next_day_with_no_months(self):
+        monthless_calendar, days_in_year = self.random_monthless_calendar()
+        cd = ConvertibleDate(calendar=monthless_calendar)
         ast_year = FAKE.random_int(min=-9999)
-        month = num_months
-        cd._overflow_month = Mock()
-        cd._overflow_month.side_effect = [(ast_year, 1), (ast_year + 1, 2)]
-        day = cd.next_month(ast_year, month, frequency)[2]
-        assert day == 1
-        assert cd._overflow_month.call_count >= 2
-        cd._overflow_month.reset_mock()
-
-        month = 1
-        forward = False
-        cd._overflow_month.side_effect = [(ast_year, 3), (ast_year - 1, 2)]
-        day = cd.next_month(ast_year, month, frequency, forward)[2]
-        assert day == 1
-        assert cd._overflow_month.call_count >= 2
+        assert cd.next_day((ast_year, None, days_in_year), 1) == (
+            ast_year + 1,
+            None,
+            1,
+        )
+        assert cd.next_day((ast_year, None, 1), 1, False) == (
+            ast_year - 1,
+            None,
+            days_in_year,
+        )
 
     def test_next_day_for_invalid_frequency(self):
         calendar = self.calendar_factory.build(
@@ -655,6 +795,53 @@ class ConvertibleDateTest(CalendarTestCase):
         with pytest.raises(ValueError):
             cd.next_day(FAKE.pytuple(), bad_frequency)
 
+    def test_next_week(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        days_in_weeks = len(cd.calendar.weekday_names)
+        frequency = FAKE.random_int(min=1, max=4)
+        ordinal = FAKE.random_int(min=-9999)
+        ast_ymd = cd.ordinal_date_to_ast_ymd(
+            cd.ordinal_to_ordinal_date(ordinal)
+        )
+
+        next_ast_ymd = cd.next_week(ast_ymd, frequency)
+        next_ordinal = cd.ordinal_date_to_ordinal(
+            cd.ast_ymd_to_ordinal_date(next_ast_ymd)
+        )
+        prev_ast_ymd = cd.next_week(ast_ymd, frequency, forward=False)
+        prev_ordinal = cd.ordinal_date_to_ordinal(
+            cd.ast_ymd_to_ordinal_date(prev_ast_ymd)
+        )
+        assert cd.day_of_week(next_ordinal) == cd.calendar.weekday_start
+        assert cd.day_of_week(prev_ordinal) == cd.calendar.weekday_start
+        assert 0 < next_ordinal - ordinal <= frequency * days_in_weeks
+        assert 0 < ordinal - prev_ordinal <= frequency * days_in_weeks
+        assert (next_ordinal - prev_ordinal) % (frequency * days_in_weeks) == 0
+        with pytest.raises(ValueError):
+            cd.next_week(ast_ymd, 0)
+
+    def test_gen_ast_ymds(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        for dateunit in (DateUnit.YEAR, DateUnit.MONTH, DateUnit.DAY):
+            interval = [1, dateunit]
+            ast_ymd = FAKE.random_int(min=-9999), 1, 1
+            generator = cd.gen_ast_ymds(ast_ymd, interval)
+            for _ in range(FAKE.random_int(min=1, max=50)):
+                gen_ast_ymd, ordinal = next(generator)
+                assert gen_ast_ymd == ast_ymd
+                assert ordinal == cd.ordinal_date_to_ordinal(
+                    cd.ast_ymd_to_ordinal_date(ast_ymd)
+                )
+                ast_ymd = cd.next_ast_ymd(ast_ymd, interval)
+
+    def test_gen_ast_ymds_raises(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        generator = cd.gen_ast_ymds(
+            FAKE.pytuple(), [FAKE.random_int(), DateUnit.ERA]
+        )
+        with pytest.raises(ValueError):
+            next(generator)
+
     # test ConvertibleDate._overflow_month in test_gregorian.py
 
     def test__get_delta(self):
@@ -728,9 +915,41 @@ class ConvertibleDateTest(CalendarTestCase):
         )
         assert cdt.hr_to_ast(*cdt.ast_to_hr(ast_year)) == ast_year
 
-    @patch(
-        "src.customdate.ConvertibleDate.gen_years_before_era",
-    )
+    def test_ast_to_hr_and_era_with_many_eras(self):
+        num_reigns = 300
+        era_ranges = [("-inf", 1)]
+        for _ in range(num_reigns):  # every reign restarts at year 1
+            era_ranges.append((1, FAKE.random_int(min=1, max=50)))
+        era_ranges.append((1, "inf"))
+        eras = [f"era {idx}" for idx in range(len(era_ranges))]
+        calendar = self.calendar_factory.build(
+            era_ranges=era_ranges, eras=eras
+        )
+        cdt = ConvertibleDate(calendar=calendar)
+        ast_year = 1
+        for era_idx, era_range in enumerate(era_ranges[1:-1], start=1):
+            for hr_year in range(era_range[0], era_range[1] + 1):
+                assert cdt.ast_to_hr(ast_year) == (hr_year, era_idx)
+                assert cdt.hr_to_ast(hr_year, era_idx) == ast_year
+                assert cdt.era(ast_year) == eras[era_idx]
+                ast_year += 1
+        assert cdt.ast_to_hr(ast_year) == (1, len(eras) - 1)
+        assert cdt.era(ast_year) == eras[-1]
+
+    def test_ast_to_hr_many_and_hr_to_ast_many(self):
+        era_ranges = [("-inf", 1), (1, 50), (30, 1), (1, "inf")]
+        calendar = self.calendar_factory.build(
+            era_ranges=era_ranges, eras=FAKE.words(nb=len(era_ranges))
+        )
+        cdt = ConvertibleDate(calendar=calendar)
+        ast_years = [FAKE.random_int(min=-999, max=999) for _ in range(100)]
+        hr_years, era_idxs = cdt.ast_to_hr_many(ast_years)
+        assert list(zip(hr_years.tolist(), era_idxs.tolist())) == [
+            cdt.ast_to_hr(ast_year) for ast_year in ast_years
+        ]
+        assert cdt.hr_to_ast_many(hr_years, era_idxs).tolist() == ast_years
+
+    @patch("src.customdate.ConvertibleDate._era_idx", return_value=None)
     def test_ast_to_hr_can_raise(self, _):
         calendar = self.calendar_factory.build()
         cdt = ConvertibleDate(calendar=calendar)
@@ -906,9 +1125,7 @@ class ConvertibleDateTest(CalendarTestCase):
         assert cdt.era(tiny_era_ast_year) == eras[2]
         assert cdt.era(final_era_ast_year) == eras[3]
 
-    @patch(
-        "src.customdate.ConvertibleDate.gen_years_before_era",
-    )
+    @patch("src.customdate.ConvertibleDate._era_idx", return_value=None)
     def test_era_can_raise(self, _):
         calendar = self.calendar_factory.build()
         year = FAKE.random_int(min=1)
@@ -1027,6 +1244,30 @@ class ConvertibleDateTest(CalendarTestCase):
         cdt = ConvertibleDate(calendar=calendar)
         assert cdt.is_leap_year(special_common_year) is False
 
+    #
+    # ConvertibleDate.is_leap_year_many
+    #
+    def test_is_leap_year_many(self):
+        calendar = self.calendar_factory.build()
+        cdt = ConvertibleDate(calendar=calendar)
+        ast_years = list(range(-999, 1000)) + list(calendar.special_leap_years)
+        ast_years += list(calendar.special_common_years)
+        assert cdt.is_leap_year_many(ast_years).tolist() == [
+            cdt.is_leap_year(ast_year) for ast_year in ast_years
+        ]
+        assert cdt.is_leap_year_many(
+            ast_years, count_special=False
+        ).tolist() == [
+            cdt.is_leap_year(ast_year, count_special=False)
+            for ast_year in ast_years
+        ]
+
+    def test_is_leap_year_many_with_no_leap_year(self):
+        calendar = self.calendar_factory.build(has_leap_year=False)
+        cdt = ConvertibleDate(calendar=calendar)
+        ast_years = [FAKE.random_int(-9999, 9999) for _ in range(10)]
+        assert not cdt.is_leap_year_many(ast_years).any()
+
     #
     # ConvertibleDate.is_valid_ast_ymd
     #
@@ -1166,6 +1407,74 @@ class ConvertibleDateTest(CalendarTestCase):
         _ordinal = FAKE.random_int()
         cdt = ConvertibleDate(calendar=weekless_calendar)
         assert cdt.day_of_week(_ordinal) is None
+        assert cdt.day_of_week_many([_ordinal]) is None
+        with pytest.raises(ValueError):
+            cdt.next_weekday(_ordinal, 0)
+        with pytest.raises(ValueError):
+            cdt.weekend_mask(_ordinal, _ordinal + 1)
+        with pytest.raises(ValueError):
+            cdt.next_week((1, 1, 1), 1)
+
+    def test_day_of_week_many(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        ordinals = [FAKE.random_int(min=-9999) for _ in range(100)]
+        assert cd.day_of_week_many(ordinals).tolist() == [
+            cd.day_of_week(ordinal) for ordinal in ordinals
+        ]
+
+    def test_next_weekday(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        days_in_weeks = len(cd.calendar.weekday_names)
+        ordinal = FAKE.random_int(min=-9999)
+        weekday = FAKE.random_int(max=days_in_weeks - 1)
+        next_ordinal = cd.next_weekday(ordinal, weekday)
+        prev_ordinal = cd.next_weekday(ordinal, weekday, forward=False)
+        assert cd.day_of_week(next_ordinal) == weekday
+        assert cd.day_of_week(prev_ordinal) == weekday
+        assert 0 < next_ordinal - ordinal <= days_in_weeks
+        assert 0 < ordinal - prev_ordinal <= days_in_weeks
+        with pytest.raises(ValueError):
+            cd.next_weekday(ordinal, days_in_weeks)
+
+    def test_nth_weekday(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        days_in_weeks = len(cd.calendar.weekday_names)
+        ast_year = FAKE.random_int(min=-9999)
+        month = FAKE.random_int(min=1, max=cd.months_in_year(ast_year))
+        weekday = FAKE.random_int(max=days_in_weeks - 1)
+        days = [
+            day
+            for day in range(1, cd.days_in_month(ast_year, month) + 1)
+            if cd.day_of_week(
+                cd.ordinal_date_to_ordinal(
+                    cd.ast_ymd_to_ordinal_date((ast_year, month, day))
+                )
+            )
+            == weekday
+        ]
+        for nth in range(1, len(days) + 1):
+            expected_ymd = (ast_year, month, days[nth - 1])
+            assert (
+                cd.nth_weekday(ast_year, month, weekday, nth) == expected_ymd
+            )
+            expected_ymd = (ast_year, month, days[-nth])
+            assert (
+                cd.nth_weekday(ast_year, month, weekday, -nth) == expected_ymd
+            )
+        with pytest.raises(ValueError):
+            cd.nth_weekday(ast_year, month, weekday, len(days) + 1)
+        with pytest.raises(ValueError):
+            cd.nth_weekday(ast_year, month, weekday, 0)
+
+    def test_weekend_mask(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        start_ordinal = FAKE.random_int(min=-9999)
+        end_ordinal = start_ordinal + FAKE.random_int(max=100)
+        weekend_mask = cd.weekend_mask(start_ordinal, end_ordinal)
+        assert weekend_mask.tolist() == [
+            cd.day_of_week(ordinal) in cd.calendar.weekends
+            for ordinal in range(start_ordinal, end_ordinal)
+        ]
 
     def test_calendar(self):
         cd = ConvertibleDate(calendar=self.calendar_factory.build())
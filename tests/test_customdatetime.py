@@ -15,13 +15,21 @@
 #  You should have received a copy of the GNU General Public License
 #  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
 import copy
+import math
+import numpy
 import pytest
 
 from enum import Enum
 from tests.factories import ConvertibleCalendarFactory, ConvertibleTimeFactory
 from tests.utils import FAKE, TimeTestCase
 from src.customdate import ConvertibleDate, DateUnit
-from src.customdatetime import ConvertibleDateTime, TimeUnit
+from src.db import CalendarSpec, ConvertibleClock
+from src.customdatetime import (
+    ConvertibleDateTime,
+    LabelCache,
+    TimeUnit,
+    proper_divisors,
+)
 from src.dbsetup import gregorian_cdt
 from src.ui.mark import Mark
 from src.ui.timeline import Timeline
@@ -32,6 +40,32 @@ class DumEnum(Enum):
     DUM = 0
 
 
+def test_proper_divisors():
+    num = FAKE.random_int(min=1)
+    assert proper_divisors(num) == [
+        divisor for divisor in range(1, num) if num % divisor == 0
+    ]
+    assert proper_divisors(1) == []
+    assert proper_divisors(36) == [1, 2, 3, 4, 6, 9, 12, 18]
+
+
+def test_label_cache():
+    label_cache = LabelCache(maxsize=2)
+    assert label_cache.get(1) is None
+    label_cache.put(1, "one")
+    label_cache.put(2, "two")
+    assert label_cache.get(1) == "one"  # 2 is now the least recently used
+    label_cache.put(3, "three")
+    assert label_cache.get(2) is None
+    assert label_cache.get(3) == "three"
+    assert len(label_cache) == 2
+    assert (label_cache.hits, label_cache.misses) == (2, 2)
+
+    label_cache.clear()
+    assert len(label_cache) == 0
+    assert (label_cache.hits, label_cache.misses) == (0, 0)
+
+
 class ConvertibleDateTimeTest(TimeTestCase):
     def setUp(self):
         super(ConvertibleDateTimeTest, self).setUp()
@@ -39,8 +73,8 @@ class ConvertibleDateTimeTest(TimeTestCase):
         self.time_factory = ConvertibleTimeFactory
         # fmt: off
         self.datetime_units = [
-            DateUnit.ERA, DateUnit.YEAR, DateUnit.MONTH, DateUnit.DAY,
-            TimeUnit.HOUR, TimeUnit.MINUTE, TimeUnit.SECOND,
+            DateUnit.ERA, DateUnit.YEAR, DateUnit.MONTH, DateUnit.WEEK,
+            DateUnit.DAY, TimeUnit.HOUR, TimeUnit.MINUTE, TimeUnit.SECOND,
         ]
         # fmt: on
         self.timeline = Timeline(
@@ -58,16 +92,21 @@ class ConvertibleDateTimeTest(TimeTestCase):
         assert isinstance(cdt.initial_interval[1], DateUnit) or isinstance(
             cdt.initial_interval[1], TimeUnit
         )
-        # fmt: off
-        assert cdt.datetime_units == [
-            DateUnit.ERA, DateUnit.YEAR, DateUnit.MONTH, DateUnit.DAY,
-            TimeUnit.HOUR, TimeUnit.MINUTE, TimeUnit.SECOND,
-        ]
-        # fmt: on
+        assert cdt.datetime_units == self.datetime_units
         assert 0 in cdt.era_start_ordinals
         assert mock_hr_to_ast.return_value in cdt.era_start_ordinals
         mock_hr_to_ast.assert_called()
 
+        weekless_calendar = self.calendar_factory.build(
+            weekday_names=(),
+            epoch_weekday=None,
+            weekday_start=None,
+            weekends=(),
+        )
+        cd = ConvertibleDate(calendar=weekless_calendar)
+        cdt = ConvertibleDateTime(date=cd, time=self.time_factory.build())
+        assert DateUnit.WEEK not in cdt.datetime_units
+
     def test__str__(self):
         cd = ConvertibleDate(calendar=self.calendar_factory.build())
         ct = self.time_factory.build()
@@ -91,6 +130,10 @@ class ConvertibleDateTimeTest(TimeTestCase):
         assert frequency == 1
         assert unit == DateUnit.YEAR
 
+        frequency, unit = cdt.get_primary_interval(DateUnit.WEEK)
+        assert frequency == 1
+        assert unit == DateUnit.YEAR
+
         frequency, unit = cdt.get_primary_interval(DateUnit.DAY)
         assert frequency == 1
         assert unit == DateUnit.YEAR
@@ -148,6 +191,18 @@ class ConvertibleDateTimeTest(TimeTestCase):
         assert cdt.extend_od(od, interval) == od + delta
         patch_shift_od.assert_not_called()
 
+    @patch("src.customdatetime.ConvertibleDateTime.shift_od")
+    def test_extend_od_for_week_interval(self, patch_shift_od):
+        delta = FAKE.random_int(min=-9999)
+        interval = [delta, DateUnit.WEEK]
+
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        cdt = ConvertibleDateTime(date=cd, time=self.time_factory.build())
+        od = FAKE.pyfloat()
+        days_in_weeks = len(cd.calendar.weekday_names)
+        assert cdt.extend_od(od, interval) == od + delta * days_in_weeks
+        patch_shift_od.assert_not_called()
+
     @patch("src.customdatetime.ConvertibleDateTime.shift_od")
     def test_extend_od_for_non_day_interval(self, patch_shift_od):
         units = [DateUnit.YEAR, DateUnit.MONTH]
@@ -172,35 +227,35 @@ class ConvertibleDateTimeTest(TimeTestCase):
         with pytest.raises(ValueError):
             cdt.extend_od(ordinal_decimal, interval, bad_factor)
 
-    @patch("src.customdatetime.ConvertibleDateTime.od_to_ast_ymd")
+    @patch("src.customdatetime.ConvertibleDateTime.instant_to_ast_ymd")
     @patch("src.customdate.ConvertibleDate.shift_ast_ymd")
-    @patch("src.customdatetime.ConvertibleDateTime.ast_ymd_to_od")
-    @patch("src.customdatetime.ConvertibleDateTime.od_to_hms")
+    @patch("src.customdatetime.ConvertibleDateTime.ast_ymd_to_instant")
+    @patch("src.customdatetime.ConvertibleDateTime.instant_to_hms")
     @patch("src.customtime.ConvertibleTime.shift_hms")
-    @patch("src.customdatetime.ConvertibleDateTime.set_hms")
-    def test_shift_od(self, *patches):
-        patch_set_hms = patches[0]
+    @patch("src.customdatetime.ConvertibleDateTime.set_instant_hms")
+    def test_shift_instant(self, *patches):
+        patch_set_instant_hms = patches[0]
         patch_shift_hms = patches[1]
-        patch_od_to_hms = patches[2]
-        patch_ast_ymd_to_od = patches[3]
+        patch_instant_to_hms = patches[2]
+        patch_ast_ymd_to_instant = patches[3]
         patch_shift_ast_ymd = patches[4]
-        patch_od_to_ast_ymd = patches[5]
+        patch_instant_to_ast_ymd = patches[5]
 
-        fake_ordinal_decimal1 = FAKE.pyfloat()
-        fake_ordinal_decimal2 = FAKE.pyfloat()
+        fake_instant1 = FAKE.random_int(min=-9999)
+        fake_instant2 = FAKE.random_int(min=-9999)
         fake_day_delta = FAKE.random_int(min=1)
-        fake_ordinal_decimal3 = FAKE.pyfloat()
+        fake_instant3 = FAKE.random_int(min=-9999)
         fake_ast_ymd1 = FAKE.random_int(), FAKE.random_int(), FAKE.random_int()
         fake_ast_ymd2 = FAKE.random_int(), FAKE.random_int(), FAKE.random_int()
         fake_hms1 = FAKE.random_int(), FAKE.random_int(), FAKE.random_int()
         fake_hms2 = FAKE.random_int(), FAKE.random_int(), FAKE.random_int()
 
-        patch_od_to_ast_ymd.return_value = fake_ast_ymd1
+        patch_instant_to_ast_ymd.return_value = fake_ast_ymd1
         patch_shift_ast_ymd.return_value = fake_ast_ymd2
-        patch_ast_ymd_to_od.return_value = fake_ordinal_decimal2
-        patch_od_to_hms.return_value = fake_hms1
+        patch_ast_ymd_to_instant.return_value = fake_instant2
+        patch_instant_to_hms.return_value = fake_hms1
         patch_shift_hms.return_value = fake_hms2, fake_day_delta
-        patch_set_hms.return_value = fake_ordinal_decimal3
+        patch_set_instant_hms.return_value = fake_instant3
 
         date_intervals = []
         for i in range(FAKE.random_int(min=1, max=3)):
@@ -213,89 +268,281 @@ class ConvertibleDateTimeTest(TimeTestCase):
 
         cd = ConvertibleDate(calendar=self.calendar_factory.build())
         cdt = ConvertibleDateTime(date=cd, time=self.time_factory.build())
-        assert cdt.shift_od(fake_ordinal_decimal1, []) == fake_ordinal_decimal1
-        assert (
-            cdt.shift_od(fake_ordinal_decimal1, intervals)
-            == fake_ordinal_decimal3
-        )
-        patch_od_to_ast_ymd.assert_called_once_with(fake_ordinal_decimal1)
+        assert cdt.shift_instant(fake_instant1, []) == fake_instant1
+        assert cdt.shift_instant(fake_instant1, intervals) == fake_instant3
+        patch_instant_to_ast_ymd.assert_called_once_with(fake_instant1)
         patch_shift_ast_ymd.assert_called_once_with(
             fake_ast_ymd1, date_intervals
         )
-        patch_ast_ymd_to_od.assert_called_once_with(fake_ast_ymd2)
-        patch_od_to_hms.assert_called_once_with(fake_ordinal_decimal2)
+        patch_ast_ymd_to_instant.assert_called_once_with(fake_ast_ymd2)
+        patch_instant_to_hms.assert_called_once_with(fake_instant2)
         patch_shift_hms.assert_called_once_with(fake_hms1, time_intervals)
-        patch_set_hms.assert_called_once_with(
-            fake_ordinal_decimal2, fake_hms2, fake_day_delta
+        patch_set_instant_hms.assert_called_once_with(
+            fake_instant2, fake_hms2, fake_day_delta
+        )
+
+    @patch("src.customdatetime.ConvertibleDateTime.shift_instant")
+    def test_shift_od(self, patch_shift_instant):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        cdt = ConvertibleDateTime(date=cd, time=self.earth_ct)
+        ordinal = FAKE.random_int(min=-9999, max=9999)
+        intervals = [[FAKE.random_int(), DateUnit.YEAR]]
+        patch_shift_instant.return_value = (ordinal + 1) * 86400 + 21600
+        assert cdt.shift_od(ordinal + 0.5, intervals) == ordinal + 1.25
+        patch_shift_instant.assert_called_once_with(
+            ordinal * 86400 + 43200, intervals
         )
 
     def test_shift_od_raises(self):
         cd = ConvertibleDate(calendar=self.calendar_factory.build())
         cdt = ConvertibleDateTime(date=cd, time=self.time_factory.build())
         with pytest.raises(ValueError):
-            cdt.shift_od(FAKE.pyfloat(), [[FAKE.random_int(), DumEnum.DUM]])
+            cdt.shift_instant(
+                FAKE.random_int(), [[FAKE.random_int(), DumEnum.DUM]]
+            )
 
-    @patch("src.customdatetime.ConvertibleDateTime.od_to_ast_ymd")
+    @patch("src.customdatetime.ConvertibleDateTime.instant_to_ast_ymd")
     @patch("src.customdate.ConvertibleDate.next_ast_ymd")
-    @patch("src.customdatetime.ConvertibleDateTime.ast_ymd_to_od")
-    def test_next_od_for_date_unit(self, *patches):
-        patch_ast_ymd_to_od = patches[0]
+    @patch("src.customdatetime.ConvertibleDateTime.ast_ymd_to_instant")
+    def test_next_instant_for_date_unit(self, *patches):
+        patch_ast_ymd_to_instant = patches[0]
         patch_next_ast_ymd = patches[1]
-        patch_od_to_ast_ymd = patches[2]
+        patch_instant_to_ast_ymd = patches[2]
 
-        od1 = FAKE.pyfloat()
-        od2 = FAKE.pyfloat()
+        instant1 = FAKE.random_int(min=-9999)
+        instant2 = FAKE.random_int(min=-9999)
         ast_ymd1 = FAKE.random_int(), FAKE.random_int(), FAKE.random_int()
         ast_ymd2 = FAKE.random_int(), FAKE.random_int(), FAKE.random_int()
         interval = [FAKE.random_int(), FAKE.random_element(elements=DateUnit)]
         forward = FAKE.pybool()
 
-        patch_od_to_ast_ymd.return_value = ast_ymd1
+        patch_instant_to_ast_ymd.return_value = ast_ymd1
         patch_next_ast_ymd.return_value = ast_ymd2
-        patch_ast_ymd_to_od.return_value = od2
+        patch_ast_ymd_to_instant.return_value = instant2
 
         cd = ConvertibleDate(calendar=self.calendar_factory.build())
         cdt = ConvertibleDateTime(date=cd, time=self.time_factory.build())
-        assert cdt.next_od(od1, interval, forward) == od2
-        patch_od_to_ast_ymd.assert_called_once_with(od1)
+        assert cdt.next_instant(instant1, interval, forward) == instant2
+        patch_instant_to_ast_ymd.assert_called_once_with(instant1)
         patch_next_ast_ymd.assert_called_once_with(ast_ymd1, interval, forward)
-        patch_ast_ymd_to_od.assert_called_once_with(ast_ymd2)
+        patch_ast_ymd_to_instant.assert_called_once_with(ast_ymd2)
 
-    @patch("src.customdatetime.ConvertibleDateTime.od_to_hms")
+    @patch("src.customdatetime.ConvertibleDateTime.instant_to_hms")
     @patch("src.customtime.ConvertibleTime.next_hms")
-    @patch("src.customdatetime.ConvertibleDateTime.set_hms")
-    def test_next_od_for_time_unit(self, *patches):
-        patch_set_hms = patches[0]
+    @patch("src.customdatetime.ConvertibleDateTime.set_instant_hms")
+    def test_next_instant_for_time_unit(self, *patches):
+        patch_set_instant_hms = patches[0]
         patch_next_hms = patches[1]
-        patch_od_to_hms = patches[2]
+        patch_instant_to_hms = patches[2]
 
         fake_hms1 = FAKE.random_int(), FAKE.random_int(), FAKE.random_int()
         fake_hms2 = FAKE.random_int(), FAKE.random_int(), FAKE.random_int()
-        fake_od = FAKE.random_int()
+        fake_instant = FAKE.random_int()
         day_delta = FAKE.random_int()
         interval = [FAKE.random_int(), FAKE.random_element(elements=TimeUnit)]
         forward = FAKE.pybool()
 
-        patch_od_to_hms.return_value = fake_hms1
+        patch_instant_to_hms.return_value = fake_hms1
         patch_next_hms.return_value = fake_hms2, day_delta
-        patch_set_hms.return_value = fake_od
+        patch_set_instant_hms.return_value = fake_instant
 
         cd = ConvertibleDate(calendar=self.calendar_factory.build())
         cdt = ConvertibleDateTime(date=cd, time=self.time_factory.build())
-        assert cdt.next_od(fake_od, interval, forward) == fake_od
-        patch_od_to_hms.assert_called_once_with(fake_od)
+        assert (
+            cdt.next_instant(fake_instant, interval, forward) == fake_instant
+        )
+        patch_instant_to_hms.assert_called_once_with(fake_instant)
         patch_next_hms.assert_called_once_with(fake_hms1, interval, forward)
-        patch_set_hms.assert_called_once_with(fake_od, fake_hms2, day_delta)
+        patch_set_instant_hms.assert_called_once_with(
+            fake_instant, fake_hms2, day_delta
+        )
+
+    @patch("src.customdatetime.ConvertibleDateTime.next_instant")
+    def test_next_od(self, patch_next_instant):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        cdt = ConvertibleDateTime(date=cd, time=self.earth_ct)
+        ordinal = FAKE.random_int(min=-9999, max=9999)
+        interval = [FAKE.random_int(), FAKE.random_element(elements=DateUnit)]
+        forward = FAKE.pybool()
+        patch_next_instant.return_value = (ordinal - 1) * 86400 + 64800
+        assert cdt.next_od(ordinal + 0.25, interval, forward) == ordinal - 0.25
+        patch_next_instant.assert_called_once_with(
+            ordinal * 86400 + 21600, interval, forward
+        )
 
     def test_next_od_raises(self):
         cd = ConvertibleDate(calendar=self.calendar_factory.build())
         cdt = ConvertibleDateTime(date=cd, time=self.time_factory.build())
         with pytest.raises(ValueError):
-            cdt.next_od(FAKE.pyfloat(), [FAKE.random_int(), DumEnum.DUM])
+            cdt.next_instant(
+                FAKE.random_int(), [FAKE.random_int(), DumEnum.DUM]
+            )
+
+    @pytest.mark.db
+    def test_iter_ods(self):
+        cdt = gregorian_cdt
+        start_od = FAKE.random_int(min=-10_000, max=10_000) + FAKE.pyfloat(
+            min_value=0, max_value=1
+        )
+        for interval in [
+            [FAKE.random_int(min=1, max=5), DateUnit.YEAR],
+            [FAKE.random_element(elements=(1, 2, 3, 4, 6)), DateUnit.MONTH],
+            [FAKE.random_int(min=1, max=2), DateUnit.WEEK],
+            [FAKE.random_int(min=1, max=10), DateUnit.DAY],
+            [FAKE.random_int(min=1, max=6), TimeUnit.HOUR],
+        ]:
+            end_od = start_od + 40 * interval[0]
+            expected = [cdt.next_od(start_od, interval, forward=False)]
+            while expected[-1] <= end_od:
+                expected.append(cdt.next_od(expected[-1], interval))
+            assert list(cdt.iter_ods(start_od, end_od, interval)) == expected
+
+    @pytest.mark.db
+    def test_iter_instants(self):
+        cdt = gregorian_cdt
+        start_od = FAKE.random_int(min=-10_000, max=10_000) + FAKE.pyfloat(
+            min_value=0, max_value=1
+        )
+        for interval in [
+            [FAKE.random_int(min=1, max=5), DateUnit.YEAR],
+            [FAKE.random_int(min=1, max=2), DateUnit.WEEK],
+            [FAKE.random_int(min=1, max=6), TimeUnit.HOUR],
+            [FAKE.random_element(elements=(5, 7)), TimeUnit.HOUR],
+        ]:
+            end_od = start_od + 40 * interval[0]
+            start_instant = cdt.od_to_instant(start_od)
+            expected = [
+                cdt.next_instant(start_instant, interval, forward=False)
+            ]
+            while expected[-1] <= cdt.od_to_instant(end_od):
+                expected.append(cdt.next_instant(expected[-1], interval))
+            assert (
+                list(cdt.iter_instants(start_od, end_od, interval)) == expected
+            )
+
+        # a second apart where ordinal decimals can't tell them apart
+        start_od = float(FAKE.random_int(min=10**12, max=10**13))
+        instants = list(
+            cdt.iter_instants(start_od, start_od, [1, TimeUnit.SECOND])
+        )
+        assert numpy.diff(instants).tolist() == [1] * (len(instants) - 1)
+
+    @pytest.mark.db
+    def test_instants_to_hr_dates(self):
+        cdt = gregorian_cdt
+        instants = [
+            FAKE.random_int(min=-9999, max=9999) * 86400
+            + FAKE.random_int(max=86399)
+            for _ in range(10)
+        ]
+        assert cdt.instants_to_hr_dates(instants, DateUnit.DAY) == [
+            cdt.od_to_hr_date(instant // 86400, DateUnit.DAY)
+            for instant in instants
+        ]
+        assert cdt.instants_to_hr_dates(instants, TimeUnit.HOUR) == [
+            cdt.od_to_hr_date(cdt.instant_to_od(instant), TimeUnit.HOUR)
+            for instant in instants
+        ]
+        with pytest.raises(ValueError):
+            cdt.instants_to_hr_dates(instants, DumEnum.DUM)
+
+    @pytest.mark.db
+    def test_time_ods(self):
+        cdt = gregorian_cdt
+        start_od = FAKE.random_int(min=-9999, max=9999) + 0.25
+        end_od = start_od + 0.5
+        ods = cdt.time_ods(start_od, end_od, [6, TimeUnit.HOUR])
+        assert ods.tolist() == [start_od - 0.25 + n * 0.25 for n in range(5)]
+
+        ods = cdt.time_ods(start_od, end_od, [1, TimeUnit.SECOND])
+        assert ods.size == 86400 / 2 + 3  # both ends are on a mark
+        assert ods[0] < start_od and ods[-2] <= end_od < ods[-1]
+
+    @pytest.mark.db
+    def test_time_ods_raises(self):
+        with pytest.raises(ValueError):  # 5 hours don't divide a day
+            gregorian_cdt.time_ods(0, 1, [5, TimeUnit.HOUR])
+
+    @pytest.mark.db
+    def test_ods_to_hr_dates(self):
+        cdt = gregorian_cdt
+        ods = [
+            FAKE.random_int(min=-9999, max=9999)
+            + FAKE.random_int(max=86399) / 86400
+            for _ in range(10)
+        ]
+        for unit in (DateUnit.DAY, TimeUnit.HOUR):
+            assert cdt.ods_to_hr_dates(ods, unit) == [
+                cdt.od_to_hr_date(od, unit) for od in ods
+            ]
+
+    @pytest.mark.db
+    def test_od_to_instant(self):
+        cdt = gregorian_cdt
+        ordinal = FAKE.random_int(min=-9999, max=9999)
+        seconds = FAKE.random_int(max=86399)
+        assert cdt.od_to_instant(ordinal) == ordinal * 86400
+        assert (
+            cdt.od_to_instant(ordinal + seconds / 86400)
+            == ordinal * 86400 + seconds
+        )
+
+    @pytest.mark.db
+    def test_instant_to_od(self):
+        cdt = gregorian_cdt
+        ordinal = FAKE.random_int(min=-9999, max=9999)
+        assert cdt.instant_to_od(ordinal * 86400) == ordinal
+        assert cdt.instant_to_od(ordinal * 86400 + 64800) == ordinal + 0.75
+        assert cdt.instant_to_od(-21600) == -0.25
+
+    @pytest.mark.db
+    def test_instants_are_exact_in_deep_time(self):
+        cdt = gregorian_cdt
+        ast_ymd = FAKE.random_int(min=10**12, max=10**13), 6, 15
+        instant = cdt.ast_ymd_to_instant(ast_ymd)
+        assert cdt.instant_to_ast_ymd(instant) == ast_ymd
+
+        hms = FAKE.random_int(max=23), FAKE.random_int(max=59), 1
+        instant = cdt.set_instant_hms(instant, hms, 1)
+        assert cdt.instant_to_hms(instant) == hms
+        assert cdt.instant_to_ast_ymd(instant) == (ast_ymd[0], 6, 16)
+
+        next_instant = cdt.next_instant(instant, [1, TimeUnit.SECOND])
+        assert next_instant == instant + 1
+        shifted_instant = cdt.shift_instant(instant, [[-1, TimeUnit.SECOND]])
+        assert shifted_instant == instant - 1
+        extended_instant = cdt.extend_instant(instant, [2, DateUnit.DAY])
+        assert extended_instant == instant + 2 * 86400
+        extended_instant = cdt.extend_instant(
+            instant, [1, DateUnit.MONTH], reverse=True
+        )
+        assert cdt.instant_to_ast_ymd(extended_instant) == (ast_ymd[0], 5, 16)
+
+    @pytest.mark.db
+    def test_ods_and_instants_agree_before_ordinal_zero(self):
+        cdt = gregorian_cdt
+        ordinal = FAKE.random_int(min=-9999, max=0)
+        day_decimal = FAKE.pyfloat(min_value=0.01, max_value=0.99)
+        ordinal_decimal = ordinal - day_decimal
+        instant = cdt.od_to_instant(ordinal_decimal)
+        assert instant // 86400 == ordinal - 1
+        assert cdt.od_to_ast_ymd(ordinal_decimal) == cdt.instant_to_ast_ymd(
+            instant
+        )
+        assert cdt.set_hms(ordinal_decimal, (6, 0, 0)) == ordinal - 0.75
+
+    def test_extend_instant_raises(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        cdt = ConvertibleDateTime(date=cd, time=self.time_factory.build())
+        with pytest.raises(ValueError):
+            cdt.extend_instant(
+                FAKE.random_int(),
+                [FAKE.random_int(), DateUnit.DAY],
+                FAKE.random_int(min=-9999, max=0),
+            )
 
     @pytest.mark.db
-    @patch("sympy.proper_divisors")
-    def test_get_frequencies(self, patch_proper_divisors):
+    def test_get_frequencies(self):
         def all_ints(frequencies: list) -> bool:
             return all([isinstance(freq, int) for freq in frequencies])
 
@@ -303,36 +550,73 @@ class ConvertibleDateTimeTest(TimeTestCase):
         ct = self.time_factory.build()
         clk = ct.clock
         cdt = ConvertibleDateTime(date=cd, time=ct)
-        with self.session:
-            self.session.add_all([clk, cd.calendar])
-            self.session.flush()
-            year_frequencies = cdt.get_frequencies(DateUnit.YEAR)
-            assert all_ints(year_frequencies)
+        year_frequencies = cdt.get_frequencies(DateUnit.YEAR)
+        assert all_ints(year_frequencies)
 
-            cdt.get_frequencies(DateUnit.MONTH)
-            patch_proper_divisors.assert_called_once()
-            patch_proper_divisors.reset_mock()
+        least_months_in_year = min(cd.spec.months_in_year)
+        assert cdt.get_frequencies(DateUnit.MONTH) == proper_divisors(
+            least_months_in_year
+        )
 
-            day_frequencies = cdt.get_frequencies(DateUnit.DAY)
-            assert all_ints(day_frequencies)
+        week_frequencies = cdt.get_frequencies(DateUnit.WEEK)
+        assert all_ints(week_frequencies)
 
-            cdt.get_frequencies(TimeUnit.HOUR)
-            patch_proper_divisors.assert_called_once_with(clk.hours_in_day)
-            patch_proper_divisors.reset_mock()
+        day_frequencies = cdt.get_frequencies(DateUnit.DAY)
+        assert all_ints(day_frequencies)
 
-            cdt.get_frequencies(TimeUnit.MINUTE)
-            patch_proper_divisors.assert_called_once_with(clk.minutes_in_hour)
-            patch_proper_divisors.reset_mock()
+        assert cdt.get_frequencies(TimeUnit.HOUR) == proper_divisors(
+            clk.hours_in_day
+        )
+        assert cdt.get_frequencies(TimeUnit.MINUTE) == proper_divisors(
+            clk.minutes_in_hour
+        )
+        assert cdt.get_frequencies(TimeUnit.SECOND) == proper_divisors(
+            clk.seconds_in_minute
+        )
 
-            cdt.get_frequencies(TimeUnit.SECOND)
-            patch_proper_divisors.assert_called_once_with(
-                clk.seconds_in_minute
-            )
-            patch_proper_divisors.reset_mock()
+        with pytest.raises(ValueError):
+            cdt.get_frequencies(DateUnit.ERA)
+        with pytest.raises(ValueError):
+            # noinspection PyTypeChecker
+            cdt.get_frequencies(DumEnum.DUM)
 
-            with pytest.raises(ValueError):
-                # noinspection PyTypeChecker
-                cdt.get_frequencies(DumEnum.DUM)
+    @patch("src.customdatetime.proper_divisors", return_value=[1])
+    def test_get_frequencies_is_cached(self, patch_proper_divisors):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        ct = self.time_factory.build()
+        cdt = ConvertibleDateTime(date=cd, time=ct)
+        assert patch_proper_divisors.call_count == 4  # built with cdt
+        patch_proper_divisors.reset_mock()
+
+        for unit in DateUnit.MONTH, TimeUnit.HOUR, TimeUnit.SECOND:
+            cdt.get_frequencies(unit)
+        patch_proper_divisors.assert_not_called()
+
+        cd.calendar.special_common_years = ()
+        cdt.get_frequencies(DateUnit.MONTH)
+        assert patch_proper_divisors.call_count == 4
+        patch_proper_divisors.reset_mock()
+
+        ct.clock.hours_in_day += 1
+        cdt.get_frequencies(TimeUnit.HOUR)
+        patch_proper_divisors.assert_any_call(ct.clock.hours_in_day)
+
+    def test_get_interval_ladder(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        cdt = ConvertibleDateTime(date=cd, time=self.time_factory.build())
+        ladder = cdt.get_interval_ladder()
+        assert cdt.get_interval_ladder() is ladder
+        spans, intervals = ladder
+        assert spans == sorted(spans)
+        assert len(intervals) == sum(
+            len(cdt.get_frequencies(unit)) for unit in cdt.datetime_units[1:]
+        )
+        assert spans[intervals.index([1, DateUnit.DAY])] == 1
+        days_in_weeks = len(cd.calendar.weekday_names)
+        assert spans[intervals.index([1, DateUnit.WEEK])] == days_in_weeks
+
+        cd.calendar.special_common_years = ()
+        assert cdt.get_interval_ladder() is not ladder
 
     @pytest.mark.db
     @patch("src.customtime.ConvertibleTime.hms_to_hr_time")
@@ -360,6 +644,86 @@ class ConvertibleDateTimeTest(TimeTestCase):
             # noinspection PyTypeChecker
             cdt.od_to_hr_date(ordinal_decimal, DumEnum.DUM)
 
+    @patch("src.customtime.ConvertibleTime.hms_to_hr_time")
+    @patch("src.customdate.ConvertibleDate.format_hr_date")
+    def test_od_to_hr_date_uses_label_cache(self, *patches):
+        patch_format_hr_date, patch_hms_to_hr_time = patches
+        calendar = self.calendar_factory.build()
+        cd = ConvertibleDate(calendar=calendar)
+        cdt = ConvertibleDateTime(date=cd, time=self.earth_ct)
+        ordinal = FAKE.random_int(min=1, max=9999)
+
+        for _ in range(3):  # same day and second, but different ods
+            cdt.od_to_hr_date(
+                ordinal + FAKE.random.uniform(0, 0.5), DateUnit.DAY
+            )
+            cdt.od_to_hr_date(ordinal + 0.5, TimeUnit.HOUR)
+            cdt.od_to_hr_date(ordinal + 1.5, TimeUnit.HOUR)
+        patch_format_hr_date.assert_called_once()
+        patch_hms_to_hr_time.assert_called_once()
+        assert cdt.label_cache.hits == 7
+        assert cdt.label_cache.misses == 2
+
+        calendar.special_common_years = ()  # drops the calendar's spec
+        cdt.od_to_hr_date(ordinal, DateUnit.DAY)
+        assert patch_format_hr_date.call_count == 2
+
+    @patch("src.customtime.ConvertibleTime.hms_to_hr_time")
+    @patch("src.customdate.ConvertibleDate.format_hr_date")
+    def test_od_to_hr_date_before_ordinal_zero(self, *patches):
+        patch_hms_to_hr_time = patches[1]
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        cdt = ConvertibleDateTime(date=cd, time=self.earth_ct)
+        ordinal = FAKE.random_int(min=-9999, max=0)
+        with patch.object(cdt, "od_to_ast_ymd") as patch_od_to_ast_ymd:
+            cdt.od_to_hr_date(ordinal - 0.5, DateUnit.DAY)
+            patch_od_to_ast_ymd.assert_called_once_with(ordinal - 1)
+        cdt.od_to_hr_date(ordinal - 0.5, TimeUnit.HOUR)
+        patch_hms_to_hr_time.assert_called_once_with((12, 0, 0))
+
+    @pytest.mark.db
+    def test_label_key_follows_clock_and_separators(self):
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        cdt = ConvertibleDateTime(date=cd, time=self.earth_ct)
+        od = FAKE.random_int(min=1, max=9999) + 3661 / 86400
+        assert cdt.od_to_hr_date(od, TimeUnit.SECOND) == "01:01:01"
+        hr_date = cdt.od_to_hr_date(od, DateUnit.DAY)
+
+        clock = self.earth_ct.clock
+        clock.minutes_in_hour, clock.seconds_in_minute = 30, 120  # same day
+        self.session.commit()  # recalculates seconds_in_hour
+        assert cdt.od_to_hr_date(od, TimeUnit.SECOND) == "01:00:061"
+        assert cdt.ods_to_hr_dates([od], TimeUnit.SECOND) == ["01:00:061"]
+
+        self.earth_ct.clock_sep = "."
+        assert cdt.od_to_hr_date(od, TimeUnit.SECOND) == "01.00.061"
+        cd.date_sep = "-"
+        assert cdt.od_to_hr_date(od, DateUnit.DAY) == hr_date.replace("/", "-")
+
+        for key in cdt.label_cache._labels:  # no stale spec or clock is kept
+            assert not any(
+                isinstance(part, (CalendarSpec, ConvertibleClock))
+                for part in key
+            )
+
+    @patch("src.customtime.ConvertibleTime.seconds_to_hr_times")
+    def test_ods_to_hr_dates_uses_label_cache(self, patch_seconds_to_hr_times):
+        patch_seconds_to_hr_times.side_effect = lambda seconds: [
+            str(secs) for secs in seconds
+        ]
+        cd = ConvertibleDate(calendar=self.calendar_factory.build())
+        cdt = ConvertibleDateTime(
+            date=cd, time=self.earth_ct, label_cache_size=2
+        )
+        cdt.ods_to_hr_dates([0.25, 0.5], TimeUnit.HOUR)
+        assert cdt.ods_to_hr_dates([1.5, 2.75], TimeUnit.HOUR) == [
+            "43200",
+            "64800",
+        ]
+        assert patch_seconds_to_hr_times.call_count == 2
+        assert patch_seconds_to_hr_times.call_args.args[0].tolist() == [64800]
+        assert (cdt.label_cache.hits, cdt.label_cache.misses) == (1, 3)
+
     @patch("src.customdate.ConvertibleDate.ast_ymd_to_ordinal_date")
     @patch("src.customdate.ConvertibleDate.ordinal_date_to_ordinal")
     def test_ast_ymd_to_od(self, *patches):
@@ -381,7 +745,7 @@ class ConvertibleDateTimeTest(TimeTestCase):
         patch_ordinal_date_to_ast_ymd = patches[0]
         patch_ordinal_to_ordinal_date = patches[1]
         fake_ordinal_decimal = FAKE.pyfloat()
-        fake_ordinal = int(fake_ordinal_decimal)
+        fake_ordinal = math.floor(fake_ordinal_decimal)
         fake_ord_date = FAKE.random_int(), FAKE.random_int()
         patch_ordinal_to_ordinal_date.return_value = fake_ord_date
 
@@ -87,8 +87,8 @@ class ConvertibleTimeTest(TimeTestCase):
         mins = FAKE.random_int(min=-9999)
         secs = FAKE.random_int(min=-9999)
         pydelta = datetime.timedelta(hours=hours, minutes=mins, seconds=secs)
-        day_delta = pydelta.days
         shifted_pydt = self.py_dt + pydelta
+        day_delta = (shifted_pydt.date() - self.py_dt.date()).days
         expected_hms = (
             shifted_pydt.hour,
             shifted_pydt.minute,
@@ -212,6 +212,22 @@ class ConvertibleTimeTest(TimeTestCase):
         with pytest.raises(ValueError):
             assert earth_ct.next_hms(self.hms, [fake_float, timeunit])
 
+    def test_seconds_in_interval(self):
+        earth_ct = self.earth_ct
+        assert earth_ct.seconds_in_interval([6, TimeUnit.HOUR]) == 21600
+        assert earth_ct.seconds_in_interval([15, TimeUnit.MINUTE]) == 900
+        assert earth_ct.seconds_in_interval([30, TimeUnit.SECOND]) == 30
+        with pytest.raises(ValueError):
+            earth_ct.seconds_in_interval([FAKE.random_int(min=24), "hour"])
+        with pytest.raises(ValueError):
+            earth_ct.seconds_in_interval(
+                [FAKE.random_int(min=60), TimeUnit.MINUTE]
+            )
+        with pytest.raises(ValueError):
+            earth_ct.seconds_in_interval(
+                [FAKE.pyfloat(max_value=-1), TimeUnit.SECOND]
+            )
+
     @patch("src.customtime.ConvertibleTime.is_valid_hms", return_value=True)
     def test_seconds_to_hms_and_hms_to_seconds_are_reversible(self, *_):
         assert (
@@ -274,6 +290,16 @@ class ConvertibleTimeTest(TimeTestCase):
         assert self.earth_ct.hms_to_hr_time(self.hms, True) == split_hr_time
         assert self.earth_ct.hms_to_hr_time(self.hms, False) == mil_hr_time
 
+    def test_seconds_to_hr_times(self):
+        seconds = [FAKE.random_int(max=86399) for _ in range(10)]
+        assert self.earth_ct.seconds_to_hr_times(seconds) == [
+            self.earth_ct.hms_to_hr_time(self.earth_ct.seconds_to_hms(secs))
+            for secs in seconds
+        ]
+        assert self.earth_ct.seconds_to_hr_times([self.seconds]) == [
+            self.py_dt.time().strftime("%H:%M:%S")
+        ]
+
     @patch("src.customtime.ConvertibleTime.is_valid_hms", return_value=True)
     @patch(
         "src.customtime.ConvertibleTime.day_demarcations",
@@ -0,0 +1,89 @@
+import pytest
+
+from src.dateformat import DateFormat
+from tests.test_real_dates.utils import RealCalendarTestCase, FAKE
+
+
+class DateFormatTest(RealCalendarTestCase):
+    def setUp(self):
+        super(DateFormatTest, self).setUp()
+        self.main_calendar = self.gregorian
+
+    def random_ast_ymds(self, count: int) -> list:
+        cd = self.gregorian_cd
+        return [
+            cd.ordinal_date_to_ast_ymd(
+                cd.ordinal_to_ordinal_date(
+                    FAKE.random_int(min=-999999, max=999999)
+                )
+            )
+            for _ in range(count)
+        ]
+
+    def test_init_raises(self):
+        with pytest.raises(ValueError):
+            DateFormat(self.gregorian_cd, "%Y %Q")
+        with pytest.raises(ValueError):
+            DateFormat(self.gregorian_cd, "%Y %m %Y")
+
+    def test_format(self):
+        cd = self.gregorian_cd
+        date_format = DateFormat(cd, "%A, %B %d, %Y %E (day %j) 100%%")
+        assert (
+            date_format.format((2021, 3, 14))
+            == "Sunday, March 14, 2021 CE (day 73) 100%"
+        )
+        assert (
+            date_format.format((-4, 2, 29))
+            == "Thursday, February 29, 5 BCE (day 60) 100%"
+        )
+        with pytest.raises(ValueError):
+            date_format.format((2021, 2, 29))
+
+    def test_format_matches_format_hr_date(self):
+        cd = self.gregorian_cd
+        date_format = DateFormat(cd, "%Y/%m/%d/%E")
+        ast_ymd = self.random_ast_ymds(1)[0]
+        assert date_format.format(ast_ymd) == cd.format_hr_date(ast_ymd)
+
+    def test_parse(self):
+        cd = self.gregorian_cd
+        date_format = DateFormat(cd, "%d %B %Y %E {%%}")
+        assert date_format.parse("14 March 2021 CE {%}") == (2021, 3, 14)
+        assert date_format.parse("29 February 5 BCE {%}") == (-4, 2, 29)
+        with pytest.raises(ValueError):
+            date_format.parse("29 February 2021 CE {%}")
+        with pytest.raises(ValueError):
+            date_format.parse("14 Smarch 2021 CE {%}")
+
+    def test_parse_raises_for_incomplete_template(self):
+        date_format = DateFormat(self.gregorian_cd, "%d %B %E")
+        with pytest.raises(ValueError):
+            date_format.parse("14 March CE")
+
+    def test_format_and_parse_are_reversible(self):
+        templates = ["%Y/%m/%d/%E", "%j %Y %E", "%A %d %B %Y %E"]
+        ast_ymd = self.random_ast_ymds(1)[0]
+        for template in templates:
+            date_format = DateFormat(self.gregorian_cd, template)
+            assert date_format.parse(date_format.format(ast_ymd)) == ast_ymd
+
+    def test_format_many_and_parse_many(self):
+        templates = ["%Y/%m/%d/%E", "%j %Y %E", "%A %d %B %Y %E"]
+        ast_ymds = self.random_ast_ymds(FAKE.random_int(min=1, max=100))
+        for template in templates:
+            date_format = DateFormat(self.gregorian_cd, template)
+            hr_dates = [date_format.format(ast_ymd) for ast_ymd in ast_ymds]
+            assert date_format.format_many(ast_ymds) == hr_dates
+            assert date_format.parse_many(hr_dates) == ast_ymds
+        assert date_format.parse_many([]) == []
+
+    def test_parse_many_raises(self):
+        date_format = DateFormat(self.gregorian_cd, "%Y/%m/%d/%E")
+        hr_dates = date_format.format_many(self.random_ast_ymds(10))
+        with pytest.raises(ValueError):
+            date_format.parse_many(hr_dates + ["2021/2/29/CE"])
+        with pytest.raises(ValueError):
+            date_format.parse_many(hr_dates + ["2021/3/14"])
+        with pytest.raises(ValueError):
+            date_format.parse_many(hr_dates + ["2021/3/14/CE\n2021/3/14/CE"])
@@ -631,6 +631,45 @@ class ConvertibleCalendarTest(CalendarTestCase, FactoriesMixin):
                 era_ranges=(("-inf", 1), (1, FAKE.random_int(min=2)))
             )
 
+    #
+    # Spec
+    #
+    def test_spec(self):
+        calendar = self.calendar_factory.build()
+        spec = calendar.spec
+        assert calendar.spec is spec
+        assert spec.days_in_common_year == sum(
+            calendar.days_in_common_year_months
+        )
+        assert spec.eras == tuple(calendar.eras)
+        assert spec.month_names[0] == tuple(calendar.common_year_month_names)
+        assert spec.weekday_names == tuple(calendar.weekday_names)
+        assert spec.weekend_table.tolist() == [
+            idx in calendar.weekends
+            for idx in range(len(calendar.weekday_names))
+        ]
+        with pytest.raises(AttributeError):
+            spec.days_in_common_year = FAKE.random_int()
+        with pytest.raises(AttributeError):
+            del spec.eras
+
+    def test_spec_is_dropped_when_calendar_changes(self):
+        calendar = self.calendar_factory.build()
+        stale_spec = calendar.spec
+        calendar.special_common_years = ()
+        assert calendar.spec is not stale_spec
+        assert calendar.spec.version != stale_spec.version
+
+    @pytest.mark.db
+    def test_spec_is_dropped_on_refresh(self):
+        calendar = self.calendar_factory.build()
+        with self.session:
+            self.session.add(calendar)
+            self.session.commit()
+            stale_spec = calendar.spec
+            self.session.refresh(calendar)
+            assert calendar.spec is not stale_spec
+
     #
     # Collections
     #
@@ -703,6 +742,97 @@ class ConvertibleCalendarTest(CalendarTestCase, FactoriesMixin):
             assert source_calendar.sync_ordinal(unrelated_calendar) is None
             assert target_calendar.sync_ordinal(unrelated_calendar) is None
 
+    def test_sync_offset(self):
+        with self.session:
+            conversion = self.conversion_factory.build()
+            source_calendar = conversion.source_calendar
+            target_calendar = conversion.target_calendar
+            sync_offset = (
+                conversion.target_sync_ordinal - conversion.source_sync_ordinal
+            )
+            unrelated_calendar = (
+                self.conversion_factory.build().source_calendar
+            )
+            assert target_calendar.sync_offset(source_calendar) == sync_offset
+            assert source_calendar.sync_offset(target_calendar) == -sync_offset
+            assert unrelated_calendar.sync_offset(source_calendar) is None
+            assert source_calendar.sync_offset(unrelated_calendar) is None
+
+    def test_sync_offsets(self):
+        with self.session:
+            conversion = self.conversion_factory.build()
+            source_calendar = conversion.source_calendar
+            target_calendar = conversion.target_calendar
+            other_conversion = self.conversion_factory.build(
+                target_calendar=source_calendar
+            )
+            other_calendar = other_conversion.source_calendar
+            assert source_calendar.sync_offsets() == {
+                target_calendar: target_calendar.sync_offset(source_calendar),
+                other_calendar: other_calendar.sync_offset(source_calendar),
+            }
+
+    def test_sync_offset_through_other_calendars(self):
+        conversion1_2 = self.conversion_factory.build()
+        calendar1 = conversion1_2.source_calendar
+        calendar2 = conversion1_2.target_calendar
+        conversion2_3 = self.conversion_factory.build(
+            source_calendar=calendar2
+        )
+        calendar3 = conversion2_3.target_calendar
+        assert calendar3.sync_offset(calendar1) == (
+            calendar3.sync_offset(calendar2) + calendar2.sync_offset(calendar1)
+        )
+        assert calendar1.sync_offset(calendar3) == -calendar3.sync_offset(
+            calendar1
+        )
+        assert calendar1.conversion_index is calendar3.conversion_index
+
+    def test_sync_offset_with_inconsistent_conversions(self):
+        conversion1_2 = self.conversion_factory.build()
+        calendar1 = conversion1_2.source_calendar
+        calendar2 = conversion1_2.target_calendar
+        conversion2_3 = self.conversion_factory.build(
+            source_calendar=calendar2
+        )
+        calendar3 = conversion2_3.target_calendar
+        sync_offset1_3 = (
+            conversion2_3.target_sync_ordinal
+            - conversion2_3.source_sync_ordinal
+            + conversion1_2.target_sync_ordinal
+            - conversion1_2.source_sync_ordinal
+        )
+        conversion1_3 = self.conversion_factory.build(
+            source_calendar=calendar1,
+            target_calendar=calendar3,
+            source_sync_ordinal=0,
+            target_sync_ordinal=sync_offset1_3 + 1,
+        )
+        assert not calendar1.conversion_index.is_consistent
+        assert calendar3.sync_offset(calendar1) == (
+            conversion1_3.target_sync_ordinal
+        )
+
+    def test_conversion_index_is_dropped_when_a_conversion_changes(self):
+        conversion = self.conversion_factory.build()
+        source_calendar = conversion.source_calendar
+        target_calendar = conversion.target_calendar
+        unrelated_calendar = self.conversion_factory.build().source_calendar
+        stale_index = source_calendar.conversion_index
+        conversion.target_sync_ordinal += 1
+        assert source_calendar.conversion_index is not stale_index
+        assert target_calendar.sync_offset(source_calendar) == (
+            conversion.target_sync_ordinal - conversion.source_sync_ordinal
+        )
+
+        stale_index = source_calendar.conversion_index
+        conversion.target_calendar = unrelated_calendar
+        assert source_calendar.conversion_index is not stale_index
+        assert target_calendar.sync_offset(source_calendar) is None
+        assert unrelated_calendar.sync_offset(source_calendar) == (
+            conversion.target_sync_ordinal - conversion.source_sync_ordinal
+        )
+
 
 @pytest.mark.db
 def test_calendar_conversion_factory():
@@ -728,9 +858,11 @@ class CalendarConversionTest(CalendarTestCase, FactoriesMixin):
             calendar2 = conversion1_2.target_calendar
             conversion2_3 = self.conversion_factory(source_calendar=calendar2)
             calendar3 = conversion2_3.target_calendar
-            expected_sync_ordinal_difference = abs(
-                conversion1_2.source_sync_ordinal
-                - conversion2_3.target_sync_ordinal
+            expected_sync_offset = (
+                conversion2_3.target_sync_ordinal
+                - conversion2_3.source_sync_ordinal
+                + conversion1_2.target_sync_ordinal
+                - conversion1_2.source_sync_ordinal
             )
             self.session.flush()
 
@@ -747,16 +879,124 @@ class CalendarConversionTest(CalendarTestCase, FactoriesMixin):
                 "before_flush",
                 CalendarConversion.make_mutual_conversions,
             )
-            assert (
-                abs(
-                    conversion1_3.source_sync_ordinal
-                    - conversion1_3.target_sync_ordinal
-                )
-                == expected_sync_ordinal_difference
+            sync_offset = (
+                conversion1_3.target_sync_ordinal
+                - conversion1_3.source_sync_ordinal
             )
             if calendar1.id == conversion1_3.source_calendar.id:
                 assert calendar3.id == conversion1_3.target_calendar.id
+                assert sync_offset == expected_sync_offset
             elif calendar3.id == conversion1_3.source_calendar.id:
                 assert calendar1.id == conversion1_3.target_calendar.id
+                assert sync_offset == -expected_sync_offset
             else:
                 self.fail("Automatic conversion not made")
+
+    @pytest.mark.db
+    def test_make_mutual_conversions_closes_the_component(self):
+        with self.session:
+            conversions = [self.conversion_factory()]
+            for _ in range(3):
+                conversions.append(
+                    self.conversion_factory(
+                        source_calendar=conversions[-1].target_calendar
+                    )
+                )
+            calendars = [conversions[0].source_calendar] + [
+                conversion.target_calendar for conversion in conversions
+            ]
+            unrelated_conversion = self.conversion_factory()
+            self.session.flush()
+
+            for calendar1, calendar2 in itertools.combinations(calendars, 2):
+                conversion = calendar1.conversion(calendar2)
+                assert conversion is not None
+                sync_offset = (
+                    conversion.target_sync_ordinal
+                    - conversion.source_sync_ordinal
+                )
+                if conversion.source_calendar is calendar2:
+                    sync_offset = -sync_offset
+                assert sync_offset == calendar2.sync_offset(calendar1)
+            assert unrelated_conversion.source_calendar.calendars() == [
+                unrelated_conversion.target_calendar
+            ]
+
+    @pytest.mark.db
+    def test_make_mutual_conversions_without_pairwise_closure(self):
+        info = self.session.info
+        with patch.dict(info, pairwise_closure=False), self.session:
+            conversion1_2 = self.conversion_factory()
+            calendar1 = conversion1_2.source_calendar
+            calendar2 = conversion1_2.target_calendar
+            conversion2_3 = self.conversion_factory(source_calendar=calendar2)
+            calendar3 = conversion2_3.target_calendar
+            self.session.flush()
+
+            assert len(list(self.session)) == 5  # 3 calendars, 2 conversions
+            assert calendar1.conversion(calendar3) is None
+            assert set(calendar1.calendars()) == {calendar2, calendar3}
+            assert calendar3.sync_offset(calendar1) == (
+                calendar3.sync_offset(calendar2)
+                + calendar2.sync_offset(calendar1)
+            )
+            assert calendar3.sync_offset(calendar1) == (
+                calendar3.sync_ordinal(calendar1)
+                - calendar1.sync_ordinal(calendar3)
+            )
+            assert calendar1.sync_offsets() == {
+                calendar2: calendar2.sync_offset(calendar1),
+                calendar3: calendar3.sync_offset(calendar1),
+            }
+
+    @pytest.mark.db
+    def test_index_conversions(self):
+        info = self.session.info
+        with patch.dict(info, pairwise_closure=False), self.session:
+            conversion1_2 = self.conversion_factory()
+            calendar1 = conversion1_2.source_calendar
+            calendar2 = conversion1_2.target_calendar
+            conversion3_4 = self.conversion_factory()
+            calendar3 = conversion3_4.source_calendar
+            calendar4 = conversion3_4.target_calendar
+            self.session.flush()
+            index1 = calendar1.conversion_index
+            index3 = calendar3.conversion_index
+            assert index1 is not index3
+
+            conversion2_3 = self.conversion_factory(
+                source_calendar=calendar2, target_calendar=calendar3
+            )
+            sync_offset2_3 = (
+                conversion2_3.target_sync_ordinal
+                - conversion2_3.source_sync_ordinal
+            )
+            self.session.flush()
+
+            assert event.contains(
+                Session, "after_flush", CalendarConversion.index_conversions
+            )
+            assert calendar1.conversion_index in (index1, index3)
+            assert calendar4.conversion_index is calendar1.conversion_index
+            assert calendar4.sync_offset(calendar1) == (
+                calendar4.sync_offset(calendar3)
+                + sync_offset2_3
+                + calendar2.sync_offset(calendar1)
+            )
+
+            self.session.delete(conversion2_3)
+            self.session.flush()
+            assert calendar1.conversion_index is not index1
+            assert calendar1.conversion_index is not index3
+
+    @pytest.mark.db
+    def test_drop_indexes(self):
+        with self.session:
+            conversion = self.conversion_factory()
+            calendar = conversion.source_calendar
+            self.session.commit()
+            self.conversion_factory(source_calendar=calendar)
+            self.session.flush()
+            stale_index = calendar.conversion_index
+            self.session.rollback()
+            assert calendar.conversion_index is not stale_index
@@ -30,6 +30,18 @@ class ConvertibleTimeTest(DatabaseTestCase):
             == f"{name}(Seconds in a Day: {seconds_in_day})"
         )
 
+    def test_version(self):
+        clock = self.clock_factory.build()
+        version = clock.version
+        assert self.clock_factory.build().version != version
+        clock.name = FAKE.word()
+        assert clock.version == version
+
+        for unit in ("seconds_in_minute", "minutes_in_hour", "hours_in_day"):
+            setattr(clock, unit, FAKE.random_int(min=1))
+            assert clock.version != version
+            version = clock.version
+
     @pytest.mark.db
     def test_validate_positive(self):
         negative_seconds_clock = self.clock_factory.build(
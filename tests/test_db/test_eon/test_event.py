@@ -0,0 +1,176 @@
+import numpy
+import pytest
+
+from src.db import Event, EventRollup
+from src.db.eon.event import ROLLUP_WIDTHS
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from tests.factories import ConvertibleCalendarFactory, EventFactory
+from tests.utils import DatabaseTestCase, FAKE
+
+
+@pytest.mark.db
+def test_event_factory():
+    # noinspection PyBroadException
+    try:
+        EventFactory()
+    except Exception:
+        assert False, "default EventFactory raised an error"
+
+
+class EventTest(DatabaseTestCase):
+    def setUp(self):
+        super(EventTest, self).setUp()
+        self.event_factory = EventFactory
+
+    def rtree_ods(self) -> dict:
+        rows = self.session.execute(
+            text("SELECT id, min_od, max_od FROM event_rtree")
+        )
+        return {id_: (min_od, max_od) for id_, min_od, max_od in rows}
+
+    def rollup_counts(self, calendar, width: int) -> dict:
+        rollups = self.session.query(EventRollup).filter_by(
+            calendar_id=calendar.id, width=width
+        )
+        return {rollup.bucket: rollup.count for rollup in rollups}
+
+    def test___repr__(self):
+        event = self.event_factory.build()
+        assert (
+            repr(event) == f"{event.name}({event.start_od} to {event.end_od})"
+        )
+
+    @pytest.mark.db
+    def test_end_od_constraint(self):
+        start_od = FAKE.pyfloat(min_value=-1e6, max_value=1e6)
+        event = self.event_factory.build(
+            start_od=start_od,
+            end_od=start_od - FAKE.pyfloat(min_value=1, max_value=1e3),
+        )
+        with pytest.raises(IntegrityError), self.session:
+            self.session.add(event)
+            self.session.flush()
+
+    @pytest.mark.db
+    def test_overlapping(self):
+        calendar = ConvertibleCalendarFactory()
+        events = self.event_factory.create_batch(
+            FAKE.random_int(min=1, max=100), calendar=calendar
+        )
+        other_events = self.event_factory.create_batch(
+            FAKE.random_int(min=1, max=10),
+            start_od=events[0].start_od,
+            end_od=events[0].end_od,
+        )
+        self.session.flush()
+        start_od = FAKE.pyfloat(min_value=-1e6, max_value=1e6)
+        end_od = start_od + FAKE.pyfloat(min_value=0, max_value=1e6)
+        expected_events = sorted(
+            (
+                event
+                for event in events
+                if event.start_od <= end_od and event.end_od >= start_od
+            ),
+            key=lambda event: event.start_od,
+        )
+        assert (
+            Event.overlapping(self.session, calendar, start_od, end_od)
+            == expected_events
+        )
+
+        first_event = events[0]
+        overlapping_events = Event.overlapping(
+            self.session, calendar, first_event.end_od, first_event.end_od
+        )
+        assert first_event in overlapping_events
+        assert not set(other_events) & set(overlapping_events)
+
+    @pytest.mark.db
+    def test_overlapping_limit(self):
+        calendar = ConvertibleCalendarFactory()
+        start_od = FAKE.pyfloat(min_value=-1e6, max_value=1e6)
+        end_od = start_od + FAKE.pyfloat(min_value=0, max_value=1e3)
+        earlier_events = self.event_factory.create_batch(  # end in the span
+            FAKE.random_int(min=2, max=50),
+            calendar=calendar,
+            start_od=start_od - FAKE.pyfloat(min_value=1, max_value=1e3),
+            end_od=FAKE.pyfloat(min_value=start_od, max_value=end_od),
+        )
+        later_events = self.event_factory.create_batch(
+            FAKE.random_int(min=1, max=50),
+            calendar=calendar,
+            start_od=FAKE.pyfloat(min_value=start_od, max_value=end_od),
+        )
+        self.session.flush()
+        events = sorted(
+            earlier_events + later_events, key=lambda event: event.start_od
+        )
+        limit = FAKE.random_int(min=1, max=len(earlier_events))
+        assert (
+            Event.overlapping(self.session, calendar, start_od, end_od, limit)
+            == events[:limit]
+        )
+        assert (
+            Event.overlapping(
+                self.session, calendar, start_od, end_od, len(events) + 1
+            )
+            == events
+        )
+
+    @pytest.mark.db
+    def test_rtree_follows_events(self):
+        event = self.event_factory()
+        self.session.flush()
+        min_od, max_od = self.rtree_ods()[event.id]
+        assert min_od <= event.start_od and max_od >= event.end_od
+
+        event.start_od -= FAKE.pyfloat(min_value=1e3, max_value=1e4)
+        self.session.flush()
+        min_od, max_od = self.rtree_ods()[event.id]
+        assert min_od <= event.start_od and max_od >= event.end_od
+
+        self.session.delete(event)
+        self.session.flush()
+        assert event.id not in self.rtree_ods()
+
+    @pytest.mark.db
+    def test_rollups_follow_events(self):
+        calendar = ConvertibleCalendarFactory()
+        events = self.event_factory.create_batch(
+            FAKE.random_int(min=2, max=100), calendar=calendar
+        )
+        self.session.flush()
+        events[0].start_od -= FAKE.pyfloat(min_value=1, max_value=1e6)
+        self.session.delete(events[-1])
+        self.session.flush()
+        for width in ROLLUP_WIDTHS:
+            expected_counts = dict()
+            for event in events[:-1]:
+                bucket = int(numpy.floor(event.start_od / width))
+                expected_counts[bucket] = expected_counts.get(bucket, 0) + 1
+            assert self.rollup_counts(calendar, width) == expected_counts
+
+    @pytest.mark.db
+    def test_histogram(self):
+        calendar = ConvertibleCalendarFactory()
+        events = self.event_factory.create_batch(
+            FAKE.random_int(min=1, max=100), calendar=calendar
+        )
+        self.event_factory.create_batch(FAKE.random_int(min=1, max=10))
+        self.session.flush()
+        start_ods = [event.start_od for event in events]
+
+        # aligned with the rollup buckets, so exact
+        width = FAKE.random_element(ROLLUP_WIDTHS[1:7])
+        edges = numpy.arange(-1e6, 1e6 + width, width)
+        assert Event.histogram(self.session, calendar, edges) == (
+            numpy.histogram(start_ods, edges)[0].tolist()
+        )
+
+        # narrower than a day
+        start_od = events[0].start_od
+        edges = numpy.linspace(start_od - 1, start_od + 1, 5)
+        assert Event.histogram(self.session, calendar, edges) == (
+            numpy.histogram(start_ods, edges)[0].tolist()
+        )
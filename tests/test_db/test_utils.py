@@ -14,7 +14,16 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with JulianBC.  If not, see <https://www.gnu.org/licenses/>.
-from src.db.utils import integer_sanitization, string_sanitization
+import pytest
+
+from src.db import ConvertibleClock
+from src.db.utils import (
+    integer_sanitization,
+    make_engine,
+    string_sanitization,
+)
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
 from tests.utils import FAKE
 
 
@@ -39,3 +48,53 @@ def test_integer_sanitization():
     ]
     for element in integer_sanitization(mixed_type_collection):
         assert isinstance(element, int)
+
+
+def pragma(engine, name: str):
+    with engine.connect() as connection:
+        return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+
+@pytest.mark.db
+def test_make_engine(tmp_path):
+    path = tmp_path / "julianbc.db"
+    mmap_size = FAKE.random_int(min=1, max=2 ** 20)
+    cache_size = FAKE.random_int(min=1, max=2 ** 10)
+    busy_timeout = FAKE.random_int(min=1, max=10000)
+    engine = make_engine(
+        path,
+        mmap_size=mmap_size,
+        cache_size=cache_size,
+        busy_timeout=busy_timeout,
+    )
+    assert pragma(engine, "journal_mode") == "wal"
+    assert pragma(engine, "synchronous") == 1  # NORMAL
+    assert pragma(engine, "mmap_size") == mmap_size
+    assert pragma(engine, "cache_size") == -cache_size
+    assert pragma(engine, "busy_timeout") == busy_timeout
+    assert "convertible_calendar" in inspect(engine).get_table_names()
+
+    name = FAKE.word()
+    with Session(engine) as session:
+        session.add(ConvertibleClock(name=name))
+        session.commit()
+    engine.dispose()
+
+    engine = make_engine(path)  # tables already exist
+    with Session(engine) as session:
+        assert session.query(ConvertibleClock).one().name == name
+    engine.dispose()
+
+
+@pytest.mark.db
+def test_make_engine_in_memory():
+    engine = make_engine()
+    assert pragma(engine, "journal_mode") == "memory"
+    assert pragma(engine, "synchronous") == 1
+
+    name = FAKE.word()
+    with Session(engine) as session:
+        session.add(ConvertibleClock(name=name))
+        session.commit()
+    with Session(engine) as session:  # the database outlives the session
+        assert session.query(ConvertibleClock).one().name == name
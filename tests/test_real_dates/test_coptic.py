@@ -739,7 +739,7 @@ class CopticTest(RealCalendarTestCase):
             self.coptic_cd.hr_to_ast(hr_am_year, 1)
         ) == (hr_am_year, 1)
 
-    @patch("src.customdate.ConvertibleDate.gen_years_before_era")
+    @patch("src.customdate.ConvertibleDate._era_idx", return_value=None)
     def test_ast_to_hr_raise(self, _):
         ast_ah_year = self.random_ce_year()
         with pytest.raises(RuntimeError):
@@ -883,7 +883,7 @@ class CopticTest(RealCalendarTestCase):
         assert (
             self.coptic_cd.days_in_months(common_year)
             # fmt: off
-            == [30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 5]
+            == (30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 5)
             # fmt: on
         )
 
@@ -893,7 +893,7 @@ class CopticTest(RealCalendarTestCase):
         assert (
             self.coptic_cd.days_in_months(leap_year)
             # fmt: off
-            == [30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 6]
+            == (30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 6)
             # fmt: on
         )
 
@@ -1,10 +1,12 @@
 import convertdate
+import numpy
 import pytest
 
 from .utils import RealCalendarTestCase
 from collections import deque
 from convertdate import gregorian, ordinal, utils
-from src.customdate import DateUnit
+from src.customdate import ConvertibleDate, DateUnit
+from tests.factories import ConvertibleCalendarFactory
 from tests.utils import FAKE
 from unittest.mock import patch
 
@@ -168,6 +170,71 @@ class GregorianTest(RealCalendarTestCase):
             julian_ast_ymd, self.julian_cd
         ) == (year, month, day)
 
+    @pytest.mark.db
+    def test_convert_ast_ymd_raises(self):
+        unrelated_calendar = ConvertibleCalendarFactory.build()
+        unrelated_cd = ConvertibleDate(calendar=unrelated_calendar)
+        with pytest.raises(ValueError):
+            self.gregorian_cd.convert_ast_ymd((1, 1, 1), unrelated_cd)
+
+    #
+    # ConvertibleDate.convert_ast_ymd_many
+    #
+    @pytest.mark.db
+    def test_convert_ast_ymd_many(self):
+        gregorian_ymds = [
+            self.random_convertible_gregorian_ymd() for _ in range(100)
+        ]
+        julian_ast_ymds = [
+            convertdate.julian.from_gregorian(*ymd) for ymd in gregorian_ymds
+        ]
+        years, months, days = self.gregorian_cd.convert_ast_ymd_many(
+            julian_ast_ymds, self.julian_cd
+        )
+        assert list(zip(years, months, days)) == gregorian_ymds
+
+        years, months, days = self.gregorian_cd.convert_ast_ymd_many(
+            numpy.array(julian_ast_ymds), self.julian_cd
+        )
+        assert list(zip(years, months, days)) == gregorian_ymds
+
+    @pytest.mark.db
+    def test_convert_ast_ymd_many_raises(self):
+        unrelated_calendar = ConvertibleCalendarFactory.build()
+        unrelated_cd = ConvertibleDate(calendar=unrelated_calendar)
+        with pytest.raises(ValueError):
+            self.gregorian_cd.convert_ast_ymd_many([(1, 1, 1)], unrelated_cd)
+
+    #
+    # ConvertibleDate.fan_out_ast_ymd
+    #
+    @pytest.mark.db
+    def test_fan_out_ast_ymd(self):
+        gregorian_ymd = self.random_convertible_gregorian_ymd()
+        target_ast_ymds = self.gregorian_cd.fan_out_ast_ymd(gregorian_ymd)
+        assert set(target_ast_ymds) == set(self.gregorian.calendars())
+        assert target_ast_ymds[
+            self.julian
+        ] == convertdate.julian.from_gregorian(*gregorian_ymd)
+        for calendar, target_ast_ymd in target_ast_ymds.items():
+            assert target_ast_ymd == ConvertibleDate(calendar).convert_ast_ymd(
+                gregorian_ymd, self.gregorian_cd
+            )
+
+    @pytest.mark.db
+    def test_fan_out_ast_ymd_many(self):
+        gregorian_ymds = [self.random_ymd() for _ in range(100)]
+        target_ast_ymds = self.gregorian_cd.fan_out_ast_ymd_many(
+            gregorian_ymds
+        )
+        assert set(target_ast_ymds) == set(self.gregorian.calendars())
+        for calendar, (years, months, days) in target_ast_ymds.items():
+            target_cd = ConvertibleDate(calendar)
+            assert list(zip(years, months, days)) == [
+                target_cd.convert_ast_ymd(ymd, self.gregorian_cd)
+                for ymd in gregorian_ymds
+            ]
+
     #
     # Ordinals
     #
@@ -348,6 +415,40 @@ class GregorianTest(RealCalendarTestCase):
             == ce_ordinal
         )
 
+    def test_ordinal_date_to_ordinal_for_deep_time(self):
+        # every 400 year Gregorian cycle is 146097 days long
+        cycles = FAKE.random_int(min=1, max=2_500_000)
+        assert self.gregorian_cd.ordinal_date_to_ordinal(
+            (cycles * 400 + 1, 1)
+        ) == (cycles * 146097 + 1)
+        assert self.gregorian_cd.ordinal_date_to_ordinal(
+            (cycles * 400, 366)
+        ) == (cycles * 146097)
+        assert self.gregorian_cd.ordinal_date_to_ordinal(
+            (-cycles * 400 + 1, 1)
+        ) == (-cycles * 146097 + 1)
+        assert self.gregorian_cd.ordinal_date_to_ordinal(
+            (-cycles * 400, 366)
+        ) == (-cycles * 146097)
+
+    def test_ordinal_to_ordinal_date_for_deep_time(self):
+        # every 400 year Gregorian cycle is 146097 days long
+        cycles = FAKE.random_int(min=1, max=2_500_000)
+        assert self.gregorian_cd.ordinal_to_ordinal_date(
+            cycles * 146097 + 1
+        ) == (cycles * 400 + 1, 1)
+        assert self.gregorian_cd.ordinal_to_ordinal_date(cycles * 146097) == (
+            cycles * 400,
+            366,
+        )
+        assert self.gregorian_cd.ordinal_to_ordinal_date(
+            -cycles * 146097 + 1
+        ) == (-cycles * 400 + 1, 1)
+        assert self.gregorian_cd.ordinal_to_ordinal_date(-cycles * 146097) == (
+            -cycles * 400,
+            366,
+        )
+
     #
     # Cycle methods
     #
@@ -798,7 +899,7 @@ class GregorianTest(RealCalendarTestCase):
             self.gregorian_cd.hr_to_ast(hr_ce_year, 1)
         ) == (hr_ce_year, 1)
 
-    @patch("src.customdate.ConvertibleDate.gen_years_before_era")
+    @patch("src.customdate.ConvertibleDate._era_idx", return_value=None)
     def test_ast_to_hr_raise(self, _):
         ast_ce_year = self.random_ce_year()
         with pytest.raises(RuntimeError):
@@ -936,7 +1037,7 @@ class GregorianTest(RealCalendarTestCase):
         assert (
             self.gregorian_cd.days_in_months(common_year)
             # fmt: off
-            == [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+            == (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
             # fmt: on
         )
 
@@ -946,7 +1047,7 @@ class GregorianTest(RealCalendarTestCase):
         assert (
             self.gregorian_cd.days_in_months(leap_year)
             # fmt: off
-            == [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+            == (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
             # fmt: on
         )
 
@@ -1029,3 +1130,36 @@ class GregorianTest(RealCalendarTestCase):
         assert self.gregorian_cd.day_of_week(ce_ordinal) == utils.jwday(
             ce_julian_day
         )
+
+    def test_nth_weekday(self):
+        thursday, monday, sunday = 3, 0, 6
+        cd = self.gregorian_cd
+        assert cd.nth_weekday(2021, 11, thursday, 4) == (2021, 11, 25)
+        assert cd.nth_weekday(2021, 5, monday, -1) == (2021, 5, 31)
+        assert cd.nth_weekday(2021, 10, sunday, 5) == (2021, 10, 31)
+        with pytest.raises(ValueError):
+            cd.nth_weekday(2021, 11, sunday, 5)
+
+    def test_next_week(self):  # weeks start on Sunday
+        cd = self.gregorian_cd
+        assert cd.next_week((2021, 10, 13), 1) == (2021, 10, 17)
+        assert cd.next_week((2021, 10, 17), 1) == (2021, 10, 24)
+        assert cd.next_week((2021, 10, 17), 1, False) == (2021, 10, 10)
+        assert cd.next_week((2021, 12, 29), 1) == (2022, 1, 2)
+
+    def test_weekend_mask(self):
+        ordinal = self.gregorian_cd.ordinal_date_to_ordinal((2021, 286))
+        weekend_mask = self.gregorian_cd.weekend_mask(ordinal, ordinal + 7)
+        # fmt: off
+        assert weekend_mask.tolist() == [  # from Wednesday, October 13th
+            False, False, False, True, True, False, False,
+        ]
+        # fmt: on
+
+    def test_shift_ast_ymd_by_weeks(self):
+        assert self.gregorian_cd.shift_ast_ymd(
+            (2021, 12, 29), [[1, DateUnit.WEEK]]
+        ) == (2022, 1, 5)
+        assert self.gregorian_cd.shift_ast_ymd(
+            (2021, 3, 31), [[-1, DateUnit.MONTH], [-2, DateUnit.WEEK]]
+        ) == (2021, 2, 14)
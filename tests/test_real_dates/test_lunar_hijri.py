@@ -750,7 +750,7 @@ class LunarHijriTest(RealCalendarTestCase):
             self.l_hijri_cd.hr_to_ast(hr_ce_year, 1)
         ) == (hr_ce_year, 1)
 
-    @patch("src.customdate.ConvertibleDate.gen_years_before_era")
+    @patch("src.customdate.ConvertibleDate._era_idx", return_value=None)
     def test_ast_to_hr_raise(self, _):
         ast_ah_year = self.random_ce_year()
         with pytest.raises(RuntimeError):
@@ -890,7 +890,7 @@ class LunarHijriTest(RealCalendarTestCase):
         assert (
             self.l_hijri_cd.days_in_months(common_year)
             # fmt: off
-            == [30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29]
+            == (30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29)
             # fmt: on
         )
 
@@ -900,7 +900,7 @@ class LunarHijriTest(RealCalendarTestCase):
         assert (
             self.l_hijri_cd.days_in_months(leap_year)
             # fmt: off
-            == [30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 30]
+            == (30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 30)
             # fmt: on
         )
 
@@ -1,6 +1,9 @@
+from kivy.graphics import Rectangle
 from kivy.lang import Builder
 from os.path import join
 from src.ui.eventview import EventView
+from tests.utils import FAKE
+from unittest.mock import Mock
 
 
 try:
@@ -12,3 +15,89 @@ except FileNotFoundError:
 def test_focused_highlight_color():
     event_view = EventView(focus=True)
     assert event_view.focused_highlight_color[3] != 0  # not transparent
+
+
+def mocked_event_view():
+    timeline = Mock()
+    timeline.od_to_x.side_effect = lambda od: od
+    return EventView(timeline=timeline, pos=(0, 0), size=(1000, 100))
+
+
+def test_on_timeline():
+    event_view = mocked_event_view()
+    event_view.timeline.bind.assert_called_once_with(
+        start_od=event_view.draw_events_trigger,
+        end_od=event_view.draw_events_trigger,
+        events=event_view.draw_events_trigger,
+        event_counts=event_view.draw_events_trigger,
+    )
+
+
+def test_draw_events():
+    event_view = mocked_event_view()
+    event_view.draw_event_rows = Mock()
+    event_view.draw_histogram = Mock()
+    event_view.timeline.events = FAKE.pylist()
+    event_view.draw_events()
+    event_view.draw_event_rows.assert_called_once()
+    event_view.draw_histogram.assert_not_called()
+
+    event_view.draw_event_rows.reset_mock()
+    event_view.timeline.events = []
+    event_view.timeline.event_counts = [FAKE.random_int()]
+    event_view.draw_events()
+    event_view.draw_event_rows.assert_not_called()
+    event_view.draw_histogram.assert_called_once()
+
+    event_view = EventView()
+    event_view.draw_events()
+    assert not event_view.event_group.children
+
+
+def test_draw_event_rows():
+    event_view = mocked_event_view()
+    event_view.event_height = event_view.event_spacing = 10
+    event_view.min_event_width = 1
+    start_od = FAKE.random_int(max=900)
+    event_view.timeline.events = [
+        Mock(start_od=start_od, end_od=start_od + 50),
+        Mock(start_od=start_od + 10, end_od=start_od + 20),
+        Mock(start_od=start_od + 60, end_od=start_od + 60),  # too narrow
+        Mock(start_od=-100, end_od=-50),  # not visible
+    ]
+    event_view.event_group.clear()
+    event_view.draw_event_rows()
+    rectangles = [
+        instruction
+        for instruction in event_view.event_group.children
+        if isinstance(instruction, Rectangle)
+    ]
+    assert len(rectangles) == 3
+    assert rectangles[0].pos == (start_od, 80)
+    assert rectangles[0].size == (50, 10)
+    assert rectangles[1].pos == (start_od + 10, 60)
+    assert rectangles[2].pos == (start_od + 60, 40)
+    assert rectangles[2].size == (1, 10)
+
+
+def test_draw_histogram():
+    event_view = mocked_event_view()
+    event_view.timeline.event_count_ods = [0, 250, 500, 750, 1000]
+    event_view.timeline.event_counts = [2, 0, 4, 1]
+    event_view.event_group.clear()
+    event_view.draw_histogram()
+    rectangles = [
+        instruction
+        for instruction in event_view.event_group.children
+        if isinstance(instruction, Rectangle)
+    ]
+    assert [rectangle.pos for rectangle in rectangles] == [
+        (0, 0),
+        (500, 0),
+        (750, 0),
+    ]
+    assert [rectangle.size for rectangle in rectangles] == [
+        (250, 50),
+        (250, 100),
+        (250, 25),
+    ]
@@ -13,17 +13,20 @@ from unittest.mock import Mock, patch
 
 @patch("src.ui.mark.Mark.canvas")
 @patch("src.ui.mark.Mark.make_label")
-def test_draw_marks_without_mark_ods(mock_make_label, mock_canvas):
+def test_draw_marks_without_mark_instants(mock_make_label, mock_canvas):
     timeline = Mock()
     extended_time_span = FAKE.pyfloat(min_value=5000, max_value=9999)
     timeline.extended_start_od = FAKE.pyfloat(min_value=-2000)
     timeline.extended_end_od = timeline.extended_start_od + extended_time_span
     timeline.width = timeline.extended_end_od + abs(FAKE.pyfloat())
     timeline.x, timeline.right = 0, timeline.width
-    timeline.od_to_x = lambda od: od
-    timeline.cdt.next_od.side_effect = (
-        lambda od, _, **kwargs: od + extended_time_span / 10
+    timeline.instant_to_x = lambda instant: instant
+    timeline.cdt.iter_instants.side_effect = lambda start_od, end_od, _: (
+        round(start_od + n * extended_time_span / 10) for n in range(-1, 12)
     )
+    timeline.cdt.instants_to_hr_dates.side_effect = lambda instants, _: [
+        FAKE.word() for _ in instants
+    ]
     timeline.mark_interval = FAKE.pylist(
         nb_elements=2, variable_nb_elements=False
     )
@@ -37,7 +40,7 @@ def test_draw_marks_without_mark_ods(mock_make_label, mock_canvas):
     mark.mark = mock_mark_graphic
     mark.interval = timeline.mark_interval
 
-    assert all([isinstance(mark_od, float) for mark_od in mark.draw_marks()])
+    assert all([isinstance(instant, int) for instant in mark.draw_marks()])
     assert any(  # label graphic is somewhere in the canvas
         True
         for call in mark.canvas.add.call_args_list
@@ -51,15 +54,16 @@ def test_draw_marks_without_mark_ods(mock_make_label, mock_canvas):
     assert mark.interval_width > 0
     mock_canvas.clear.assert_called_once()
     mock_canvas.add.assert_any_call(mark.mark_color)
-    timeline.cdt.next_od.assert_any_call(  # what the first mark_od should be
-        timeline.extended_start_od, mark.interval, forward=False
+    timeline.cdt.iter_instants.assert_any_call(
+        timeline.extended_start_od, timeline.extended_end_od, mark.interval
     )
     mock_make_label.assert_called()
+    timeline.cdt.instants_to_hr_dates.assert_called_once()
 
     mock_canvas.reset_mock(), mock_make_label.reset_mock()
 
     mark.has_label = False
-    assert all([isinstance(mark_od, float) for mark_od in mark.draw_marks()])
+    assert all([isinstance(instant, int) for instant in mark.draw_marks()])
     assert any(  # mark graphic is somewhere in the canvas
         True
         for call in mark.canvas.add.call_args_list
@@ -68,23 +72,27 @@ def test_draw_marks_without_mark_ods(mock_make_label, mock_canvas):
     assert mark.interval_width > 0
     mock_canvas.clear.assert_called_once()
     mock_canvas.add.assert_any_call(mark.mark_color)
-    timeline.cdt.next_od.assert_any_call(  # what the first mark_od should be
-        timeline.extended_start_od, mark.interval, forward=False
+    timeline.cdt.iter_instants.assert_any_call(
+        timeline.extended_start_od, timeline.extended_end_od, mark.interval
     )
     mock_make_label.assert_not_called()
+    timeline.cdt.instants_to_hr_dates.assert_called_once()
 
 
 @patch("src.ui.mark.Mark.canvas")
 @patch("src.ui.mark.Mark.make_label")
-def test_draw_marks_with_mark_ods(mock_make_label, mock_canvas):
+def test_draw_marks_with_mark_instants(mock_make_label, mock_canvas):
     mock_mark_graphic = Mock()
     mock_make_label.return_value = Label(text=FAKE.word())
     expected_interval_width = FAKE.pyfloat(min_value=1)
-    mark_ods = [n * expected_interval_width for n in range(10)]
+    mark_instants = [n * expected_interval_width for n in range(10)]
 
     timeline = Mock()
-    timeline.od_to_x = lambda x: x
-    timeline.width = max(mark_ods)
+    timeline.instant_to_x = lambda x: x
+    timeline.cdt.instants_to_hr_dates.side_effect = lambda instants, _: [
+        FAKE.word() for _ in instants
+    ]
+    timeline.width = max(mark_instants)
     timeline.x, timeline.right = 0, timeline.width
     timeline.mark_interval = FAKE.pylist(
         nb_elements=2, variable_nb_elements=False
@@ -95,7 +103,7 @@ def test_draw_marks_with_mark_ods(mock_make_label, mock_canvas):
     mark.mark = mock_mark_graphic
     mark.interval = timeline.mark_interval
 
-    assert mark.draw_marks(mark_ods=mark_ods) == mark_ods
+    assert mark.draw_marks(mark_instants=mark_instants) == mark_instants
     assert any(  # label graphic is somewhere in the canvas
         True
         for call in mark.canvas.add.call_args_list
@@ -109,13 +117,13 @@ def test_draw_marks_with_mark_ods(mock_make_label, mock_canvas):
     assert round(mark.interval_width, 1) == round(expected_interval_width, 1)
     mock_canvas.clear.assert_called_once()
     mock_canvas.add.assert_any_call(mark.mark_color)
-    mark.timeline.cdt.next_od.assert_not_called()
+    mark.timeline.cdt.next_instant.assert_not_called()
     mock_make_label.assert_called()
 
     mock_canvas.reset_mock(), mock_make_label.reset_mock()
 
     mark.has_label = False
-    assert mark.draw_marks(mark_ods=mark_ods) == mark_ods
+    assert mark.draw_marks(mark_instants=mark_instants) == mark_instants
     assert any(  # mark graphic is somewhere in the canvas
         True
         for call in mark.canvas.add.call_args_list
@@ -124,7 +132,7 @@ def test_draw_marks_with_mark_ods(mock_make_label, mock_canvas):
     assert round(mark.interval_width, 1) == round(expected_interval_width, 1)
     mock_canvas.clear.assert_called_once()
     mock_canvas.add.assert_any_call(mark.mark_color)
-    mark.timeline.cdt.next_od.assert_not_called()
+    mark.timeline.cdt.next_instant.assert_not_called()
     mock_make_label.assert_not_called()
 
 
@@ -139,8 +147,11 @@ def test_draw_marks_with_era_interval(mock_make_label, mock_canvas):
     era_start_ordinals = [FAKE.random_int() for _ in range(5)]
     era_start_ordinals.insert(0, 0)
     timeline.cdt.era_start_ordinals = era_start_ordinals
-    timeline.od_to_x = lambda x: x
-    timeline.width = max(timeline.cdt.era_start_ordinals)
+    timeline.cdt.instants_to_hr_dates.side_effect = lambda instants, _: [
+        FAKE.word() for _ in instants
+    ]
+    timeline.instant_to_x = lambda x: x
+    timeline.width = max(timeline.cdt.era_start_ordinals) * 86400
     timeline.x, timeline.right = 0, timeline.width
     timeline.mark_interval = FAKE.pylist(
         nb_elements=2, variable_nb_elements=False
@@ -151,7 +162,10 @@ def test_draw_marks_with_era_interval(mock_make_label, mock_canvas):
     mark.mark = mock_mark_graphic
     mark.interval = timeline.mark_interval
 
-    assert mark.draw_marks(mark_ods=era_start_ordinals) == era_start_ordinals
+    era_start_instants = [ordinal * 86400 for ordinal in era_start_ordinals]
+    assert (
+        mark.draw_marks(mark_instants=era_start_instants) == era_start_instants
+    )
     assert any(  # label graphic is somewhere in the canvas
         True
         for call in mark.canvas.add.call_args_list
@@ -165,7 +179,7 @@ def test_draw_marks_with_era_interval(mock_make_label, mock_canvas):
     assert mark.interval_width > 0
     mock_canvas.clear.assert_called_once()
     mock_canvas.add.assert_any_call(mark.mark_color)
-    mark.timeline.cdt.next_od.assert_not_called()
+    mark.timeline.cdt.next_instant.assert_not_called()
     mock_make_label.assert_called()
 
 
@@ -173,6 +187,7 @@ def test_draw_marks_with_era_interval(mock_make_label, mock_canvas):
 def test_draw_marks_raises(*_):
 
     mark = Mark(timeline=Mock())
+    mark.timeline.cdt.era_start_ordinals = []
     mark.interval = FAKE.pylist(nb_elements=2, variable_nb_elements=0)
     with pytest.raises(RuntimeError):
         mark.draw_marks()
@@ -186,21 +201,28 @@ def test_draw_marks_with_force_visible(mock_make_label, mock_canvas):
 
     tl = Mock()
     visible_mark_x = 50
-    mark_ods = [-100, visible_mark_x]
-    returned_ods = copy.deepcopy(mark_ods)
-    returned_ods.extend([FAKE.random_int(), visible_mark_x])
-    tl.od_to_x.side_effect = returned_ods
+    mark_instants = [-100, visible_mark_x]
+    returned_xs = copy.deepcopy(mark_instants)
+    returned_xs.extend([FAKE.random_int(), visible_mark_x])
+    tl.instant_to_x.side_effect = returned_xs
     tl.width = 100
     tl.x, tl.right = 0, tl.width
     tl.mark_interval = FAKE.pylist(nb_elements=2, variable_nb_elements=0)
-    mock_hr_date = tl.cdt.od_to_hr_date.return_value
+    mock_hr_date = FAKE.word()
+    tl.cdt.instants_to_hr_dates.side_effect = lambda instants, _: [
+        mock_hr_date
+    ] * len(instants)
 
     mark = Mark(force_visible=True)
     mark.timeline = tl
     mark.mark = mock_mark_graphic
     mark.interval = tl.mark_interval
 
-    assert mark.draw_marks(mark_ods=mark_ods) == [tl.start_od, tl.end_od]
+    start_instant = tl.cdt.od_to_instant.return_value
+    assert mark.draw_marks(mark_instants=mark_instants) == [
+        start_instant,
+        tl.cdt.od_to_instant.return_value,
+    ]
     assert any(  # label graphic is somewhere in the canvas
         True
         for call in mark.canvas.add.call_args_list
@@ -214,8 +236,12 @@ def test_draw_marks_with_force_visible(mock_make_label, mock_canvas):
     assert mark.interval_width is None
     mock_canvas.clear.assert_called_once()
     mock_canvas.add.assert_any_call(mark.mark_color)
-    tl.cdt.next_od.assert_any_call(tl.start_od, mark.interval, forward=False)
-    tl.cdt.next_od.assert_any_call(tl.start_od, mark.interval)
+    tl.cdt.od_to_instant.assert_any_call(tl.start_od)
+    tl.cdt.od_to_instant.assert_any_call(tl.end_od)
+    tl.cdt.next_instant.assert_any_call(
+        start_instant, mark.interval, forward=False
+    )
+    tl.cdt.next_instant.assert_any_call(start_instant, mark.interval)
     mock_mark_graphic.assert_any_call(
         pos=(visible_mark_x, mark.mark_y),
         size=(mark.mark_width, mark.mark_height),
@@ -1,6 +1,6 @@
 import copy
 import itertools
-import pytest
+import numpy
 
 from src.customdatetime import DateUnit, TimeUnit
 from src.dbsetup import gregorian_cdt
@@ -23,15 +23,6 @@ def mocked_timeline():
     )
 
 
-def datetime_units():
-    # fmt: off
-    return [
-        DateUnit.ERA, DateUnit.YEAR, DateUnit.MONTH, DateUnit.DAY,
-        TimeUnit.HOUR, TimeUnit.MINUTE, TimeUnit.SECOND,
-    ]
-    # fmt: on
-
-
 #
 # Timeline
 #
@@ -96,6 +87,81 @@ def test_timeline_draw_mark_trigger(mock_bind, mock_create_trigger):
     tl.draw_marks_trigger.assert_called()
 
 
+@patch("kivy.clock.Clock.create_trigger")
+@patch("src.ui.timeline.Timeline.bind")
+def test_timeline_fetch_events_trigger(mock_bind, mock_create_trigger):
+    tl = mocked_timeline()
+    assert tl.fetch_events_trigger == mock_create_trigger.return_value
+    for name in ("cdt", "width", "extended_start_od", "extended_end_od"):
+        assert any(
+            True
+            for call in mock_bind.call_args_list
+            if (name, tl.fetch_events_trigger) in call.kwargs.items()
+        )
+    mock_create_trigger.assert_any_call(tl.fetch_events)
+
+
+@patch("src.ui.timeline.Event.histogram")
+@patch("src.ui.timeline.Event.overlapping")
+@patch("src.ui.timeline.object_session")
+def test_timeline_fetch_events(
+    mock_object_session, mock_overlapping, mock_histogram
+):
+    timeline = mocked_timeline()
+    timeline.cdt = Mock()
+    timeline.width = FAKE.random_int(min=100, max=1000)
+    extended_start_od = timeline.start_od - FAKE.pyfloat(
+        min_value=0, max_value=timeline.time_span
+    )
+    extended_end_od = timeline.end_od + FAKE.pyfloat(
+        min_value=0, max_value=timeline.time_span
+    )
+    timeline.cdt.extend_od.side_effect = lambda *_, reverse=False: (
+        extended_start_od if reverse else extended_end_od
+    )
+    max_visible_events = timeline.max_visible_events
+    events = [  # began before the extended time span, so none are counted
+        Mock(start_od=extended_start_od - FAKE.pyfloat(positive=True))
+        for _ in range(max_visible_events)
+    ]
+    mock_overlapping.return_value = events
+    mock_histogram.return_value = [0]
+    timeline.fetch_events()
+    calendar = timeline.cdt.date.calendar
+    mock_object_session.assert_called_once_with(calendar)
+    mock_overlapping.assert_called_once_with(
+        mock_object_session.return_value,
+        calendar,
+        extended_start_od,
+        extended_end_od,
+        limit=max_visible_events + 1,
+    )
+    mock_histogram.assert_not_called()
+    assert timeline.events == events
+    assert timeline.event_counts == []
+    assert timeline.event_count_ods == []
+
+    events.append(Mock(start_od=extended_start_od))
+    timeline.fetch_events()
+    session, histogram_calendar, ods = mock_histogram.call_args.args
+    assert session == mock_object_session.return_value
+    assert histogram_calendar == calendar
+    assert ods[0] == extended_start_od and ods[-1] == extended_end_od
+    assert len(ods) - 1 == numpy.ceil(
+        timeline.dod_to_dx(timeline.extended_time_span)
+        / timeline.event_column_width
+    )
+    assert timeline.events == []
+    assert timeline.event_counts == mock_histogram.return_value
+    assert timeline.event_count_ods == ods.tolist()
+
+    mock_object_session.return_value = None
+    timeline.fetch_events()
+    assert timeline.events == []
+    assert timeline.event_counts == []
+    assert timeline.event_count_ods == []
+
+
 @patch("src.ui.timeline.Timeline.bind")
 def test_timeline_give_focus(mock_bind):
     tl = mocked_timeline()
@@ -161,7 +227,6 @@ def test_timeline_check_mark_spacing():
     tl.cdt.extend_od.return_value = FAKE.pyfloat()
     tl.change_interval = Mock()
     tl.change_interval.return_value = FAKE.pylist()
-    tl.change_interval_unit = Mock()
     tl.bad_mark_spacing = Mock()
 
     dateunit = FAKE.random_element(elements=DateUnit)
@@ -236,102 +301,41 @@ def test_timeline_change_interval():
     assert new_freq < old_frequency or new_unit != DateUnit.YEAR
 
 
-def test_timeline_change_interval_recursively_changing_unit():
-    timeline = mocked_timeline()
-    timeline.cdt = gregorian_cdt
-    timeline.cdt.get_frequencies = Mock()
-    frequencies = [FAKE.random_int(min=1) for _ in range(10)]
-    timeline.cdt.get_frequencies.return_value = frequencies
-    timeline.change_interval_unit = Mock()
-    timeline.od_to_x = Mock()  # mock too few marks on screen
-    timeline.od_to_x.side_effect = [0, timeline.width + FAKE.random_int(min=1)]
-    timeline.bad_mark_spacing = Mock()
-    timeline.bad_mark_spacing.return_value = True
-
-    frequency = FAKE.random_element(elements=frequencies)
-    unit = FAKE.random_element(elements=datetime_units())
-    expected_interval = [frequency, unit]
-    timeline.change_interval_unit.side_effect = [None, expected_interval]
-
-    old_frequency = FAKE.random_int(min=1)
-    frequency = FAKE.random_element(elements=frequencies)
-    unit = FAKE.random_element(elements=datetime_units())
-    interval = [frequency, unit]
-    timeline.secondary_mark_interval = interval
-    timeline.end_od = timeline.start_od + old_frequency * 365.25
-    assert timeline.change_interval(interval, timeline) == expected_interval
-
-
-@patch("src.customdatetime.ConvertibleDateTime.get_frequencies")
-def test_timeline_change_interval_unit_when_increasing_unit(mock):
-    mock_get_frequencies = mock
-
-    non_year_or_era_units = [DateUnit.MONTH, DateUnit.DAY]
-    non_year_or_era_units.extend(TimeUnit)
-    non_year_or_era_unit = FAKE.random_element(elements=non_year_or_era_units)
-    frequencies = [FAKE.random_int(min=1) for _ in range(5)]
-    mock_get_frequencies.return_value = frequencies
-
+def test_timeline_change_interval_bisects_interval_ladder():
+    spans = [1, 2, 4, 8, 16, 32]
+    intervals = [[span, DateUnit.DAY] for span in spans]
     timeline = mocked_timeline()
     timeline.cdt = Mock()
-    timeline.cdt.get_frequencies = mock_get_frequencies
-    timeline.cdt.datetime_units = datetime_units()
-    timeline.cdt.is_datetime_unit.return_value = False
-    timeline.change_interval = Mock()
-
-    non_year_interval = [max(frequencies), non_year_or_era_unit]
-    assert (
-        timeline.change_interval_unit(non_year_interval, increase=False)
-        == timeline.change_interval.return_value
-    )
-
-    timeline.cdt.is_datetime_unit.return_value = True
-    year_interval = [max(frequencies), DateUnit.YEAR]
-    with pytest.raises(ValueError):
-        timeline.change_interval_unit(year_interval, increase=False)
-
-
-@patch("src.customdatetime.ConvertibleDateTime.get_frequencies")
-def test_timeline_change_interval_unit_when_decreasing_unit(mock):
-    mock_get_frequencies = mock
-
-    non_sec_units = [*DateUnit]
-    non_sec_units.extend([TimeUnit.HOUR, TimeUnit.MINUTE])
-    non_sec_unit = FAKE.random_element(elements=non_sec_units)
-    frequencies = [FAKE.random_int(min=1) for _ in range(5)]
-    mock_get_frequencies.return_value = frequencies
+    timeline.cdt.extend_od.return_value = FAKE.pyfloat()
+    timeline.cdt.get_interval_ladder.return_value = spans, intervals
+    timeline.width = 960
+    timeline.end_od = timeline.start_od + 96  # 10 pixels per day
+    timeline.too_few_marks_factor = 3
+    timeline.too_many_marks_factor = 1
+    timeline.secondary_mark.max_label_width = 30
+
+    # widest interval with at least 3 marks, 32 days
+    assert timeline.change_interval([1, DateUnit.YEAR]) == [32, DateUnit.DAY]
+    # narrowest interval with room for labels, 4 days
+    assert timeline.change_interval([1, TimeUnit.HOUR], increase=False) == [
+        4,
+        DateUnit.DAY,
+    ]
 
-    timeline = mocked_timeline()
-    timeline.cdt = Mock()
-    timeline.cdt.get_frequencies = mock_get_frequencies
-    timeline.cdt.datetime_units = datetime_units()
-    timeline.cdt.is_datetime_unit.return_value = False
-    timeline.change_interval = Mock()
+    # always moves past the current interval
+    assert timeline.change_interval([32, DateUnit.DAY]) == [16, DateUnit.DAY]
+    assert timeline.change_interval([4, DateUnit.DAY], increase=False) == [
+        8,
+        DateUnit.DAY,
+    ]
 
-    non_sec_interval = [min(frequencies), non_sec_unit]
+    # labels too wide for every interval
+    timeline.secondary_mark.max_label_width = 10_000
     assert (
-        timeline.change_interval_unit(non_sec_interval, increase=True)
-        == timeline.change_interval.return_value
+        timeline.change_interval([1, DateUnit.DAY], increase=False)
+        == intervals[-1]
     )
-
-    timeline.cdt.is_datetime_unit.return_value = True
-    second_interval = [min(frequencies), TimeUnit.SECOND]
-    with pytest.raises(ValueError):
-        timeline.change_interval_unit(second_interval, increase=True)
-
-
-def test_timeline_change_unit_can_do_nothing():
-    timeline = mocked_timeline()
-    timeline.cdt = Mock()
-    timeline.change_interval = Mock()
-
-    frequencies = [FAKE.random_int(min=1) for _ in range(5)]
-    frequencies.sort()
-    timeline.cdt.get_frequencies.return_value = frequencies
-    frequency = FAKE.random_element(elements=frequencies[1:-1])
-    interval = [frequency, Mock()]
-    assert timeline.change_interval_unit(interval, FAKE.pybool()) is None
-    timeline.change_interval.assert_not_called()
+    timeline.cdt.get_interval_ladder.assert_called_with()
 
 
 def test_timeline_bad_mark_spacing():
@@ -357,7 +361,7 @@ def test_timeline_draw_marks():
     timeline.draw_marks(Mock())
     timeline.secondary_mark.draw_marks.assert_called_once()
     timeline.event_view_mark.draw_marks.assert_called_once_with(
-        mark_ods=timeline.secondary_mark.draw_marks.return_value
+        mark_instants=timeline.secondary_mark.draw_marks.return_value
     )
 
 
@@ -443,6 +447,20 @@ def test_timeline_od_to_x():
     timeline.dod_to_dx.assert_called_once_with(dod)
 
 
+def test_timeline_instant_to_x():
+    timeline = mocked_timeline()
+    timeline.cdt = Mock()
+    timeline.cdt.time.clock.seconds_in_day = 86400
+    start_instant = FAKE.random_int(min=10 ** 17, max=10 ** 18)
+    timeline.cdt.od_to_instant.return_value = start_instant
+    timeline.dod_to_dx = Mock()
+    dx = FAKE.pyfloat()
+    timeline.dod_to_dx.return_value = dx
+    assert timeline.instant_to_x(start_instant + 21601) == timeline.x + dx
+    timeline.cdt.od_to_instant.assert_called_once_with(timeline.start_od)
+    timeline.dod_to_dx.assert_called_once_with(21601 / 86400)
+
+
 def test_timeline_dod_to_dx():
     timeline = mocked_timeline()
     width = timeline.width
@@ -660,14 +678,14 @@ def test_timelinelayout_resize_timelines(mock_default_timeline_height):
 
 def test_timelinelayout_set_height():
     parent = Mock()
-    parent.height = FAKE.pyfloat(min_value=1)
+    parent.height = FAKE.pyfloat(min_value=1, max_value=10_000)
     tl_layout = TimelineLayout(parent=parent)
     tl_layout.set_height()
     assert tl_layout.height == tl_layout.parent.height
 
     timeline1, timeline2, timeline3 = Mock(), Mock(), Mock()
     timeline1.collapsed = True
-    timeline1.collapsed_height = FAKE.pyfloat(min_value=1)
+    timeline1.collapsed_height = FAKE.pyfloat(min_value=1, max_value=10_000)
     timeline2.collapsed, timeline3.collapsed = False, False
     tl_layout.timelines = [timeline1, timeline2, timeline3]
     tl_layout.set_height()